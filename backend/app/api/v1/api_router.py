@@ -1,8 +1,10 @@
 from fastapi import APIRouter
-from app.api.v1.routers import analyze, health
+from app.api.v1.routers import analyze, health, jobs, metrics
 
 api_router = APIRouter()
 
 # Include all v1 routers
 api_router.include_router(health.router)
 api_router.include_router(analyze.router)
+api_router.include_router(jobs.router)
+api_router.include_router(metrics.router)
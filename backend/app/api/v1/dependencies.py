@@ -1,6 +1,8 @@
 from functools import lru_cache
 from fastapi import Depends
 from app.core.config import get_settings, Settings
+from app.services.job_service import JobService
+from app.services.job_store import JobStore
 from app.services.llm_service import LLMService
 from app.services.review_analysis_service import ReviewAnalysisService
 
@@ -8,6 +10,7 @@ from app.services.review_analysis_service import ReviewAnalysisService
 # Singleton instances
 _llm_service: LLMService | None = None
 _review_service: ReviewAnalysisService | None = None
+_job_service: JobService | None = None
 
 
 def get_settings_dependency() -> Settings:
@@ -47,3 +50,22 @@ def get_review_service(
         _review_service = ReviewAnalysisService(llm_service)
     
     return _review_service
+
+
+def get_job_service() -> JobService:
+    """
+    Dependency for getting bulk job service instance.
+    Creates singleton instance (and its job database) on first call.
+    """
+    global _job_service
+    
+    if _job_service is None:
+        settings = get_settings()
+        _job_service = JobService(
+            get_review_service(get_llm_service()),
+            JobStore(settings.jobs_db_path),
+            chunk_size=settings.jobs_chunk_size,
+            poll_interval=settings.jobs_poll_interval
+        )
+    
+    return _job_service
@@ -1,7 +1,18 @@
-from fastapi import APIRouter, Depends, status
-from app.schemas.analyze import AnalyzeRequest, AnalyzeResponse
+import json
+from typing import AsyncIterator, BinaryIO
+from fastapi import APIRouter, Depends, Header, Query, Request, status
+from fastapi.responses import StreamingResponse
+from app.schemas.analyze import (
+    AnalysisSummary,
+    AnalyzeRequest,
+    AnalyzeResponse,
+    BatchAnalyzeRequest,
+    BatchAnalyzeResponse
+)
 from app.services.review_analysis_service import ReviewAnalysisService
 from app.api.v1.dependencies import get_review_service
+from app.api.v1.uploads import iter_text, spool_request_body, spooled_upload
+from app.core.config import get_settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -12,6 +23,7 @@ router = APIRouter(prefix="/analyze", tags=["Analysis"])
 @router.post(
     "",
     response_model=AnalyzeResponse,
+    response_model_exclude_none=True,
     status_code=status.HTTP_200_OK,
     summary="Analyze Customer Review",
     description="Analyze a customer review and classify sentences by topic",
@@ -25,6 +37,7 @@ async def analyze_review(
     Analyze a customer review.
     
     - **text**: Customer review text to analyze
+    - **include_scores**: Attach per-topic scores to each sentence
     
     Returns a list of sentences with their classified topics:
     - Billing
@@ -37,3 +50,165 @@ async def analyze_review(
     logger.info("Received analyze request")
     response = await service.analyze_review(request)
     return response
+
+
+@router.post(
+    "/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Analyze Customer Review (Streaming)",
+    description="Stream each sentence's topic as soon as it is classified",
+    response_description="NDJSON (or Server-Sent Events) stream of sentence and summary events",
+    responses={
+        200: {
+            "content": {
+                "application/x-ndjson": {},
+                "text/event-stream": {}
+            }
+        }
+    }
+)
+async def stream_review(
+    request: AnalyzeRequest,
+    service: ReviewAnalysisService = Depends(get_review_service),
+    accept: str = Header(default="application/x-ndjson")
+) -> StreamingResponse:
+    """
+    Analyze a customer review, streaming results.
+    
+    - **text**: Customer review text to analyze
+    - **include_scores**: Attach per-topic scores to each sentence
+    
+    Emits one `sentence` event per sentence as soon as its topic is ready
+    (possibly out of order; use `index`), then a final `summary` event.
+    Responds with NDJSON by default, or Server-Sent Events when the
+    `Accept` header asks for `text/event-stream`.
+    """
+    logger.info("Received streaming analyze request")
+    
+    # Errors raised once streaming has begun can no longer change the status
+    service.llm_service.ensure_ready()
+    
+    use_sse = "text/event-stream" in accept
+    media_type = "text/event-stream" if use_sse else "application/x-ndjson"
+    
+    return StreamingResponse(
+        _format_events(service.stream_review(request), use_sse),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post(
+    "/document",
+    status_code=status.HTTP_200_OK,
+    summary="Analyze Long Document (Streaming)",
+    description="Analyze a plain-text document of any length, such as a support transcript",
+    response_description="NDJSON (or Server-Sent Events) stream of sentence and summary events",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"text/plain": {"schema": {"type": "string"}}}
+        }
+    },
+    responses={
+        200: {
+            "content": {
+                "application/x-ndjson": {},
+                "text/event-stream": {}
+            }
+        }
+    }
+)
+async def analyze_document(
+    request: Request,
+    include_scores: bool = Query(False, description="Attach per-topic scores to each sentence"),
+    service: ReviewAnalysisService = Depends(get_review_service),
+    accept: str = Header(default="application/x-ndjson")
+) -> StreamingResponse:
+    """
+    Analyze a long document. The request body is the raw UTF-8 text and
+    is not subject to the single-review length limit.
+    
+    The body is spooled to disk while it arrives, then split and
+    classified in bounded batches, so memory use does not grow with the
+    document. Emits one `sentence` event per sentence, in order, with
+    `start`/`end` offsets (in characters) into the whole document, then
+    a final `summary` event.
+    """
+    settings = get_settings()
+    # Errors raised once streaming has begun can no longer change the status
+    service.llm_service.ensure_ready()
+    upload = spooled_upload()
+    
+    try:
+        size = await spool_request_body(request, upload, settings.document_max_bytes)
+    except Exception:
+        upload.close()
+        raise
+    logger.info(f"Received document analyze request ({size} bytes)")
+    
+    use_sse = "text/event-stream" in accept
+    media_type = "text/event-stream" if use_sse else "application/x-ndjson"
+    
+    events = service.analyze_document(
+        iter_text(upload),
+        include_scores=include_scores,
+        batch_size=settings.document_batch_size,
+        max_in_flight=settings.document_max_in_flight,
+        max_sentence_chars=settings.document_max_sentence_chars
+    )
+    
+    return StreamingResponse(
+        _close_after(_format_events(events, use_sse), upload),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _close_after(events: AsyncIterator[str], upload: BinaryIO) -> AsyncIterator[str]:
+    """Pass events through, closing the spooled upload once streaming ends."""
+    try:
+        async for event in events:
+            yield event
+    finally:
+        upload.close()
+
+
+async def _format_events(events: AsyncIterator, use_sse: bool) -> AsyncIterator[str]:
+    """Serialize service events as NDJSON lines or SSE messages."""
+    async for event in events:
+        name = "summary" if isinstance(event, AnalysisSummary) else "sentence"
+        data = event.model_dump(exclude_none=True)
+        
+        if use_sse:
+            yield f"event: {name}\ndata: {json.dumps(data)}\n\n"
+        else:
+            yield json.dumps({"event": name, "data": data}) + "\n"
+
+
+@router.post(
+    "/batch",
+    response_model=BatchAnalyzeResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    summary="Analyze Many Customer Reviews",
+    description="Analyze a batch of reviews, classifying each distinct sentence once",
+    response_description="Per-review sentence lists or errors"
+)
+async def analyze_batch(
+    request: BatchAnalyzeRequest,
+    service: ReviewAnalysisService = Depends(get_review_service)
+) -> BatchAnalyzeResponse:
+    """
+    Analyze a batch of customer reviews.
+    
+    - **reviews**: List of reviews, each with a client **id** and **text**
+    - **include_scores**: Attach per-topic scores to each sentence
+    
+    Identical sentences are classified once across the whole batch.
+    A review that cannot be analyzed gets an **error** instead of
+    **sentences**; the rest of the batch is unaffected.
+    """
+    logger.info(f"Received batch analyze request with {len(request.reviews)} reviews")
+    response = await service.analyze_batch(request)
+    return response
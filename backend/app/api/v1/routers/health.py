@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends, status
-from app.schemas.health import HealthResponse
+from fastapi import APIRouter, Depends, Response, status
+from app.schemas.health import HealthResponse, LivenessResponse, ReadinessResponse
 from app.services.llm_service import LLMService
 from app.api.v1.dependencies import get_llm_service, get_settings_dependency
 from app.core.config import Settings
@@ -25,9 +25,69 @@ async def health_check(
     - **status**: Overall API status
     - **model_loaded**: Whether the LLM model is loaded
     - **model_name**: Name of the loaded model
+    - **model_precision**: fp32, int8 (dynamic quantization) or bf16
+    - **cache**: Sentence cache hit, miss and eviction counters
+    - **routing**: Share of sentences handled by each classification tier
+    - **persistent_cache**: Persistent cache counters for this worker
+    - **bucketing**: Token-length bucket occupancy and padding waste
     """
     return HealthResponse(
         status="ok",
         model_loaded=llm_service.is_model_loaded(),
-        model_name=settings.model_name
+        model_name=settings.model_name,
+        model_precision=llm_service.model_precision(),
+        cache=llm_service.cache_stats(),
+        routing=llm_service.routing_stats(),
+        persistent_cache=llm_service.persistent_cache_stats(),
+        bucketing=llm_service.bucket_stats()
+    )
+
+
+@router.get(
+    "/live",
+    response_model=LivenessResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Liveness Probe",
+    description="Check that the process is up; never waits for the model"
+)
+async def liveness() -> LivenessResponse:
+    """Liveness probe: 200 whenever the server is accepting requests."""
+    return LivenessResponse(status="ok")
+
+
+@router.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Readiness Probe",
+    description="Check whether analysis requests can be served, with model load progress",
+    responses={503: {"model": ReadinessResponse, "description": "Not ready yet"}}
+)
+async def readiness(
+    response: Response,
+    llm_service: LLMService = Depends(get_llm_service),
+    settings: Settings = Depends(get_settings_dependency)
+) -> ReadinessResponse:
+    """
+    Readiness probe.
+    
+    Ready once the model is loaded, or straight away while it loads when
+    keyword answers are allowed (`serving` is then `keyword`). Responds
+    with 503 while requests would be rejected.
+    """
+    if llm_service.is_model_loaded():
+        serving = "model"
+    elif llm_service.is_model_loading() and not settings.serve_keywords_while_loading:
+        serving = "none"
+    else:
+        serving = "keyword"
+    
+    ready = serving != "none"
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    
+    return ReadinessResponse(
+        ready=ready,
+        serving=serving,
+        model=llm_service.load_status()
     )
@@ -0,0 +1,109 @@
+from typing import Literal
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
+from app.schemas.jobs import JobStatusResponse
+from app.services.job_service import JobService
+from app.api.v1.dependencies import get_job_service
+from app.api.v1.uploads import spool_request_body, spooled_upload
+from app.core.config import get_settings
+from app.core.exceptions import ValidationException, create_http_exception
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+def _job_service() -> JobService:
+    """Get the job service, or fail with 503 when bulk jobs are disabled."""
+    if not get_settings().jobs_enabled:
+        raise create_http_exception(
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            "Bulk jobs are disabled"
+        )
+    return get_job_service()
+
+
+@router.post(
+    "",
+    response_model=JobStatusResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit Bulk Analysis Job",
+    description="Upload a JSONL or CSV corpus of reviews to analyze in the background",
+    response_description="The queued job",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "text/csv": {"schema": {"type": "string"}}
+            }
+        }
+    }
+)
+async def create_job(
+    request: Request,
+    format: Literal["jsonl", "csv"] = Query("jsonl", description="Upload format"),
+    service: JobService = Depends(_job_service)
+) -> JobStatusResponse:
+    """
+    Submit a bulk analysis job. The request body is the raw upload.
+
+    - **jsonl**: one `{"id": ..., "text": ...}` object per line
+    - **csv**: header row with a `text` column and an optional `id` column
+
+    Reviews without an ID are numbered by position. Unparseable lines are
+    recorded as failed reviews. Poll `GET /jobs/{id}` for progress and
+    download results from `GET /jobs/{id}/results`.
+    """
+    max_bytes = get_settings().jobs_max_upload_bytes
+
+    with spooled_upload() as upload:
+        size = await spool_request_body(request, upload, max_bytes)
+
+        try:
+            job = await service.create_job(upload, format)
+        except ValidationException as e:
+            raise create_http_exception(status.HTTP_400_BAD_REQUEST, e.message, e.details)
+
+    logger.info(f"Queued job {job.id} ({size} bytes, {job.total} reviews)")
+    return await service.get_status(job.id)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobStatusResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get Job Progress",
+    description="Get a bulk job's progress, throughput and estimated time remaining"
+)
+async def get_job(
+    job_id: str,
+    service: JobService = Depends(_job_service)
+) -> JobStatusResponse:
+    """Get a bulk job's status."""
+    job = await service.get_status(job_id)
+    if job is None:
+        raise create_http_exception(status.HTTP_404_NOT_FOUND, f"Job {job_id} not found")
+    return job
+
+
+@router.get(
+    "/{job_id}/results",
+    status_code=status.HTTP_200_OK,
+    summary="Download Job Results",
+    description="Stream a bulk job's finished results as NDJSON, in upload order",
+    responses={200: {"content": {"application/x-ndjson": {}}}}
+)
+async def get_job_results(
+    job_id: str,
+    service: JobService = Depends(_job_service)
+) -> StreamingResponse:
+    """
+    Download results as NDJSON, one `{"id", "sentences"}` or `{"id", "error"}`
+    line per review. Results of a running job are the ones finished so far.
+    """
+    if await service.get_status(job_id) is None:
+        raise create_http_exception(status.HTTP_404_NOT_FOUND, f"Job {job_id} not found")
+
+    return StreamingResponse(service.iter_results(job_id), media_type="application/x-ndjson")
@@ -0,0 +1,114 @@
+from typing import Dict, Optional
+from fastapi import APIRouter, Response, status
+from app.api.v1.dependencies import get_llm_service
+from app.core.metrics import REGISTRY, LabelValues
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _cache_value(field: str) -> Optional[float]:
+    stats = get_llm_service().cache_stats()
+    return None if stats is None else stats[field]
+
+
+def _labeled(stats: Optional[Dict[str, int]], fields: Dict[str, str]) -> Optional[Dict[LabelValues, float]]:
+    """Map stats fields to label values, e.g. {"hits": "hit"} -> {("hit",): n}."""
+    if stats is None:
+        return None
+    return {(label,): stats[field] for field, label in fields.items()}
+
+
+def _queue_value(field: str) -> Optional[float]:
+    stats = get_llm_service().queue_stats()
+    return None if stats is None else stats[field]
+
+
+# Service state is read when scraped rather than mirrored into counters
+REGISTRY.callback(
+    "review_model_loaded",
+    "Whether the classification model is loaded (1) or not (0).",
+    lambda: float(get_llm_service().is_model_loaded())
+)
+REGISTRY.callback(
+    "review_model_loading",
+    "Whether the classification model is loading in the background.",
+    lambda: float(get_llm_service().is_model_loading())
+)
+REGISTRY.callback(
+    "review_routed_sentences",
+    "Sentences classified by each tier (keyword, cache, llm, fallback).",
+    lambda: {(tier,): count for tier, count in get_llm_service().routing_stats()["counts"].items()},
+    labelnames=("tier",),
+    type_name="counter"
+)
+REGISTRY.callback(
+    "review_cache_entries",
+    "Sentences held in the in-memory cache.",
+    lambda: _cache_value("entries")
+)
+REGISTRY.callback(
+    "review_cache_bytes",
+    "Approximate memory held by the in-memory cache.",
+    lambda: _cache_value("bytes")
+)
+REGISTRY.callback(
+    "review_cache_lookups",
+    "In-memory cache lookups by result.",
+    lambda: _labeled(get_llm_service().cache_stats(), {"hits": "hit", "misses": "miss"}),
+    labelnames=("result",),
+    type_name="counter"
+)
+REGISTRY.callback(
+    "review_cache_removals",
+    "In-memory cache entries removed to stay within limits or after their TTL.",
+    lambda: _labeled(
+        get_llm_service().cache_stats(),
+        {"evictions": "evicted", "expirations": "expired"}
+    ),
+    labelnames=("reason",),
+    type_name="counter"
+)
+REGISTRY.callback(
+    "review_persistent_cache_lookups",
+    "Persistent cache lookups by result, for this worker process.",
+    lambda: _labeled(
+        get_llm_service().persistent_cache_stats(),
+        {"hits": "hit", "misses": "miss", "errors": "error"}
+    ),
+    labelnames=("result",),
+    type_name="counter"
+)
+REGISTRY.callback(
+    "review_batch_queue_depth",
+    "Sentences waiting to be batched for inference.",
+    lambda: _queue_value("queued")
+)
+REGISTRY.callback(
+    "review_batches_in_flight",
+    "Inference batches currently running.",
+    lambda: _queue_value("in_flight")
+)
+
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    summary="Prometheus Metrics",
+    description="Pipeline stage latencies, request sizes, fallbacks, cache and queue state",
+    response_class=Response,
+    responses={200: {"content": {"text/plain": {}}}}
+)
+async def metrics() -> Response:
+    """
+    Metrics in Prometheus text format, for this worker process.
+
+    - **review_stage_duration_seconds{stage}**: split, keyword_match,
+      cache_lookup, inference, tokenize, generate, decode, response_build
+    - **review_request_sentences{endpoint}**: sentences per request
+    - **review_keyword_fallbacks_total{reason}**: keyword fallbacks
+    - model, cache, routing and batching queue state
+    """
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
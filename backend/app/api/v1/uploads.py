@@ -0,0 +1,67 @@
+import codecs
+import tempfile
+from typing import AsyncIterator, BinaryIO
+from fastapi import Request, status
+from app.core.exceptions import create_http_exception
+
+# Uploads larger than this are spooled to disk instead of memory
+SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+
+# Bytes read from a spooled upload at a time
+READ_CHUNK_BYTES = 64 * 1024
+
+
+def spooled_upload() -> BinaryIO:
+    """Temporary file for a request body, kept in memory while it is small."""
+    return tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+
+
+async def spool_request_body(request: Request, upload: BinaryIO, max_bytes: int) -> int:
+    """
+    Copy the request body into a spooled file as it arrives, then rewind it.
+
+    Args:
+        request: Incoming request
+        upload: File to write the body to
+        max_bytes: Largest accepted body
+
+    Returns:
+        Body size in bytes
+
+    Raises:
+        HTTPException: 413 if the body is larger than max_bytes
+    """
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_bytes:
+            raise create_http_exception(
+                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                f"Upload exceeds {max_bytes} bytes"
+            )
+        upload.write(chunk)
+    upload.seek(0)
+    return size
+
+
+async def iter_text(upload: BinaryIO, chunk_bytes: int = READ_CHUNK_BYTES) -> AsyncIterator[str]:
+    """
+    Read a spooled UTF-8 upload back as text, one chunk at a time.
+    Multi-byte characters split across reads are decoded whole; invalid
+    bytes become U+FFFD.
+
+    Args:
+        upload: Rewound upload file
+        chunk_bytes: Bytes read per chunk
+
+    Yields:
+        Decoded text chunks
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        data = upload.read(chunk_bytes)
+        text = decoder.decode(data, final=not data)
+        if text:
+            yield text
+        if not data:
+            return
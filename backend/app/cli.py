@@ -0,0 +1,292 @@
+"""
+Command-line interface for offline review classification.
+
+Usage:
+    python -m app.cli classify reviews.jsonl labels.jsonl
+    python -m app.cli classify reviews.csv labels.jsonl --workers 4 --resume
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Iterator, List, Optional, Tuple
+from app.core.config import get_settings
+from app.core.logging import setup_logging, get_logger
+from app.schemas.analyze import BatchAnalyzeRequest, BatchReviewItem, MAX_BATCH_REVIEWS
+from app.services.job_service import parse_upload
+from app.services.llm_service import LLMService
+from app.services.review_analysis_service import ReviewAnalysisService
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class Checkpoint:
+    """Progress of a classify run, saved next to the output file."""
+
+    records: int = 0
+    output_bytes: int = 0
+    completed: bool = False
+
+    @staticmethod
+    def path_for(output_path: str) -> str:
+        """Checkpoint file used for an output file."""
+        return output_path + ".checkpoint"
+
+    @classmethod
+    def load(cls, output_path: str) -> "Checkpoint":
+        """Load the checkpoint for an output file, or start from scratch."""
+        try:
+            with open(cls.path_for(output_path)) as f:
+                return cls(**json.load(f))
+        except FileNotFoundError:
+            return cls()
+
+    def save(self, output_path: str) -> None:
+        """Write the checkpoint atomically."""
+        path = self.path_for(output_path)
+        with open(path + ".tmp", "w") as f:
+            json.dump(self.__dict__, f)
+        os.replace(path + ".tmp", path)
+
+
+@dataclass
+class RunStats:
+    """Counters for the end-of-run throughput report."""
+
+    records: int = 0
+    sentences: int = 0
+    failed: int = 0
+    skipped: int = 0
+    elapsed: float = 0.0
+
+
+Chunk = List[Tuple[str, str, Optional[str]]]
+
+
+def _chunks(records: Iterator[Tuple[str, str, Optional[str]]], size: int) -> Iterator[Chunk]:
+    """Group parsed records into chunks without reading ahead further."""
+    chunk: Chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _classify_chunk(
+    service: ReviewAnalysisService,
+    chunk: Chunk
+) -> Tuple[List[str], int, int]:
+    """
+    Classify one chunk of records.
+
+    Returns:
+        Output lines in input order, sentence count and failed record count
+    """
+    usable = [(i, text) for i, (_, text, failed) in enumerate(chunk) if failed is None]
+    lines: List[Optional[str]] = [failed for _, _, failed in chunk]
+    failed = len(chunk) - len(usable)
+    sentences = 0
+
+    if usable:
+        response = await service.analyze_batch(BatchAnalyzeRequest(
+            reviews=[BatchReviewItem(id=str(i), text=text) for i, text in usable]
+        ))
+        sentences = response.total_sentences
+
+        for (i, _), result in zip(usable, response.results):
+            result.id = chunk[i][0]
+            lines[i] = result.model_dump_json(exclude_none=True)
+            failed += result.error is not None
+
+    return [line + "\n" for line in lines], sentences, failed
+
+
+async def classify_file(
+    input_path: str,
+    output_path: str,
+    service: ReviewAnalysisService,
+    fmt: str = "jsonl",
+    chunk_size: int = 64,
+    max_in_flight: int = 4,
+    checkpoint_every: int = 10000,
+    resume: bool = False
+) -> RunStats:
+    """
+    Stream reviews from a file through sentence splitting and batched
+    classification into a JSONL output file.
+    At most max_in_flight chunks are held at once, so memory use does not
+    grow with the file size. Output is written in input order and a
+    checkpoint is saved every checkpoint_every records.
+
+    Args:
+        input_path: JSONL or CSV file of reviews
+        output_path: JSONL file to write, one result per review
+        service: Review analysis service used for classification
+        fmt: Input format, "jsonl" or "csv"
+        chunk_size: Reviews classified per batch
+        max_in_flight: Chunks classified concurrently
+        checkpoint_every: Records between checkpoints
+        resume: Continue from the last checkpoint instead of starting over
+
+    Returns:
+        Run statistics
+    """
+    stats = RunStats()
+    checkpoint = Checkpoint.load(output_path) if resume else Checkpoint()
+    if checkpoint.completed:
+        logger.info(f"{output_path} is already complete")
+        return stats
+
+    started = time.perf_counter()
+    last_saved = checkpoint.records
+
+    with open(input_path, "rb") as source, open(output_path, "ab" if resume else "wb") as sink:
+        # Drop anything written after the last checkpoint
+        sink.truncate(checkpoint.output_bytes)
+        sink.seek(checkpoint.output_bytes)
+
+        records = parse_upload(source, fmt)
+        for _ in range(checkpoint.records):
+            if next(records, None) is None:
+                break
+            stats.skipped += 1
+        if stats.skipped:
+            logger.info(f"Resuming after {stats.skipped} records")
+
+        in_flight: Deque[asyncio.Task] = deque()
+        chunks = _chunks(records, chunk_size)
+
+        async def drain_one() -> None:
+            nonlocal last_saved
+            lines, sentences, failed = await in_flight.popleft()
+            sink.write("".join(lines).encode())
+            stats.records += len(lines)
+            stats.sentences += sentences
+            stats.failed += failed
+
+            checkpoint.records += len(lines)
+            if checkpoint.records - last_saved >= checkpoint_every:
+                sink.flush()
+                os.fsync(sink.fileno())
+                checkpoint.output_bytes = sink.tell()
+                checkpoint.save(output_path)
+                last_saved = checkpoint.records
+                logger.info(f"Checkpoint: {checkpoint.records} records")
+
+        try:
+            for chunk in chunks:
+                in_flight.append(asyncio.create_task(_classify_chunk(service, chunk)))
+                if len(in_flight) >= max_in_flight:
+                    await drain_one()
+            while in_flight:
+                await drain_one()
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+        sink.flush()
+        os.fsync(sink.fileno())
+        checkpoint.output_bytes = sink.tell()
+        checkpoint.completed = True
+        checkpoint.save(output_path)
+
+    stats.elapsed = time.perf_counter() - started
+    return stats
+
+
+def _report(stats: RunStats, llm_service: LLMService) -> str:
+    """Format the end-of-run throughput report."""
+    elapsed = max(stats.elapsed, 1e-9)
+    routing = llm_service.routing_stats()
+    tiers = ", ".join(
+        f"{tier} {count}" for tier, count in routing["counts"].items() if count
+    )
+    return (
+        f"Classified {stats.records} reviews ({stats.sentences} sentences, "
+        f"{stats.failed} failed, {stats.skipped} skipped on resume) in {stats.elapsed:.1f}s\n"
+        f"Throughput: {stats.records / elapsed:.1f} reviews/s, "
+        f"{stats.sentences / elapsed:.1f} sentences/s\n"
+        f"Sentences by tier: {tiers or 'none'}"
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli",
+        description="Offline review classification"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    classify = commands.add_parser("classify", help="Classify every review in a file")
+    classify.add_argument("input", help="JSONL ({\"id\", \"text\"} per line) or CSV (id,text) file")
+    classify.add_argument("output", help="JSONL file to write results to")
+    classify.add_argument(
+        "--format", choices=("jsonl", "csv"),
+        help="Input format (default: from the file extension)"
+    )
+    classify.add_argument(
+        "--workers", type=int, default=None,
+        help="Inference worker processes (default: in-process threads)"
+    )
+    classify.add_argument("--chunk-size", type=int, default=64, help="Reviews per batch")
+    classify.add_argument("--max-in-flight", type=int, default=4, help="Batches classified concurrently")
+    classify.add_argument(
+        "--checkpoint-every", type=int, default=10000,
+        help="Records between checkpoints"
+    )
+    classify.add_argument("--resume", action="store_true", help="Continue from the last checkpoint")
+    classify.add_argument(
+        "--keywords-only", action="store_true",
+        help="Skip the model and classify with keyword rules only"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the command-line interface."""
+    args = _build_parser().parse_args(argv)
+    setup_logging()
+
+    overrides = {}
+    if args.workers:
+        overrides = {"inference_mode": "process", "process_pool_size": args.workers}
+    settings = get_settings().model_copy(update=overrides)
+
+    fmt = args.format or ("csv" if args.input.lower().endswith(".csv") else "jsonl")
+    chunk_size = max(1, min(args.chunk_size, MAX_BATCH_REVIEWS))
+
+    llm_service = LLMService(settings)
+    if not args.keywords_only:
+        llm_service.load_model()
+
+    async def run() -> RunStats:
+        try:
+            return await classify_file(
+                args.input,
+                args.output,
+                ReviewAnalysisService(llm_service),
+                fmt=fmt,
+                chunk_size=chunk_size,
+                max_in_flight=max(1, args.max_in_flight),
+                checkpoint_every=max(1, args.checkpoint_every),
+                resume=args.resume
+            )
+        finally:
+            await llm_service.shutdown()
+
+    stats = asyncio.run(run())
+    print(_report(stats, llm_service), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,8 @@
+from pydantic import Field
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List, Optional
 from functools import lru_cache
+from app.utils.keyword_matcher import DEFAULT_TOPIC_KEYWORDS, KeywordMatcher
 
 
 class Settings(BaseSettings):
@@ -26,6 +28,122 @@ class Settings(BaseSettings):
     max_tokens: int = 512
     max_new_tokens: int = 10
     
+    # Classification mode: "generate" parses free-form model output,
+    # "score" ranks every topic label by decoder likelihood
+    classification_mode: str = "generate"
+    
+    # Keyword tables for the fallback classifier, topic -> keywords,
+    # in priority order (JSON object when set from the environment)
+    topic_keywords: Dict[str, List[str]] = Field(
+        default_factory=lambda: {
+            topic: list(keywords)
+            for topic, keywords in DEFAULT_TOPIC_KEYWORDS.items()
+        }
+    )
+    
+    # Keyword Router Settings: skip the LLM when exactly one topic matched
+    # with at least router_min_keyword_hits distinct keywords or any strong keyword
+    router_enabled: bool = True
+    router_min_keyword_hits: int = 2
+    router_strong_keywords: List[str] = [
+        "crash", "refund", "payment", "password", "login", "sign in"
+    ]
+    
+    # Startup (load the model in the background so the server starts at
+    # once; until it is ready, answer with keywords or 503)
+    model_background_load: bool = True
+    serve_keywords_while_loading: bool = True
+    
+    # Inference Backend ("auto", "transformers", "gguf", "keyword" or "fake";
+    # auto picks gguf for a .gguf model_name, and keyword or fake for
+    # model_name=keyword / model_name=fake)
+    inference_backend: str = "auto"
+    gguf_context_size: int = 2048
+    gguf_threads: Optional[int] = None
+    
+    # Fake Backend (load testing without a model): deterministic topics,
+    # batch time = base + per_item * batch_size ** exponent, scaled by a
+    # random factor ("fixed", "uniform", "normal", "lognormal", "exponential")
+    # with mean 1 and spread fake_latency_jitter (at most 1 for exponential)
+    fake_latency_base_ms: float = 20.0
+    fake_latency_per_item_ms: float = 5.0
+    fake_batch_exponent: float = 0.7
+    fake_latency_distribution: str = "lognormal"
+    fake_latency_jitter: float = 0.25
+    fake_load_seconds: float = 0.0
+    fake_seed: int = 0
+    
+    # Model Precision ("fp32", "int8" dynamic quantization of linear
+    # layers, or "bf16"; int8 and bf16 are meant for CPU-only hosts)
+    model_precision: str = "fp32"
+    
+    # Warm-up passes run after loading, one per (batch size, sentence length)
+    model_warmup: bool = True
+    warmup_batch_sizes: List[int] = [1, 8]
+    warmup_sentence_words: List[int] = [8, 32]
+    
+    # Thread Budget (unset thread counts are derived from the usable cores,
+    # the web server worker count and the inference threads or processes)
+    web_concurrency: int = 1
+    torch_intra_op_threads: Optional[int] = None
+    torch_inter_op_threads: Optional[int] = None
+    
+    # Batching Settings
+    batching_enabled: bool = True
+    batch_max_size: int = 16
+    batch_max_wait_ms: float = 5.0
+    
+    # Length Bucketing: batches are split by prompt length in tokens (the
+    # few-shot prompt alone is ~55 tokens); each bucket is padded on its own
+    length_bucketing: bool = True
+    length_bucket_edges: List[int] = [64, 80, 112, 176]
+    
+    # Inference Executor Settings
+    inference_threads: int = 1
+    
+    # Inference Mode Settings ("thread" or "process")
+    inference_mode: str = "thread"
+    process_pool_size: int = 2
+    process_pool_torch_threads: Optional[int] = None
+    process_pool_restart_on_crash: bool = True
+    # A worker busy with one batch for longer than this is killed and
+    # replaced (None: no limit)
+    process_pool_batch_timeout_seconds: Optional[float] = 120.0
+    # A worker that has not warmed up and reported ready within this is
+    # killed; after a few such failures in a row restarts stop
+    process_pool_startup_timeout_seconds: Optional[float] = 300.0
+    
+    # Sentence Cache Settings
+    cache_enabled: bool = True
+    cache_max_entries: int = 10000
+    cache_max_bytes: Optional[int] = None
+    cache_ttl_seconds: Optional[float] = None
+    
+    # Persistent Cache Settings (SQLite file shared by all workers on a host)
+    persistent_cache_path: Optional[str] = None
+    persistent_cache_timeout: float = 5.0
+    
+    # Bulk Job Settings (off by default: enabling them creates the SQLite
+    # queue at jobs_db_path, relative to the working directory)
+    jobs_enabled: bool = False
+    jobs_db_path: str = "data/jobs.db"
+    jobs_chunk_size: int = 64
+    jobs_poll_interval: float = 1.0
+    jobs_max_upload_bytes: int = 1024 * 1024 * 1024
+    
+    # Long Document Settings (POST /analyze/document)
+    document_max_bytes: int = 64 * 1024 * 1024
+    document_batch_size: int = 32
+    document_max_in_flight: int = 2
+    document_max_sentence_chars: int = 2000
+    
+    # Request Profiling (a request with an X-Profile header or ?profile=
+    # query parameter gets a Server-Timing header; when a token is set the
+    # header or parameter must carry it)
+    request_profiling_enabled: bool = False
+    request_profiling_token: Optional[str] = None
+    request_profiling_cprofile: bool = False
+    
     # Logging
     log_level: str = "INFO"
     
@@ -41,3 +159,12 @@ def get_settings() -> Settings:
     Creates settings once and reuses across the application.
     """
     return Settings()
+
+
+@lru_cache()
+def get_keyword_matcher() -> KeywordMatcher:
+    """
+    Cached keyword matcher compiled from the configured topic_keywords.
+    Shared by every caller that does not pass its own matcher.
+    """
+    return KeywordMatcher(get_settings().topic_keywords)
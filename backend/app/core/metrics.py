@@ -0,0 +1,370 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+from app.core.profiling import current_profile
+
+# Latency buckets in seconds, from sub-millisecond keyword work to slow generation
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Sentences per request, from a one-line review to a long document
+SENTENCE_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 5000, 20000)
+
+LabelValues = Tuple[str, ...]
+CallbackValue = Union[float, Mapping[LabelValues, float]]
+
+
+class _Metric(ABC):
+    """Base for a named metric family with optional labels."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[LabelValues, object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str):
+        """
+        Get the child metric for a set of label values.
+        Children are created once; callers on hot paths should keep them.
+        """
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    @abstractmethod
+    def _new_child(self):
+        """Create the time series for a new set of label values."""
+
+    @abstractmethod
+    def _samples(self) -> Iterator[Tuple[str, LabelValues, Sequence[str], float]]:
+        """
+        Yield every sample of the family.
+
+        Yields:
+            (name suffix, label values, extra label names, value) tuples
+        """
+
+    def render(self) -> List[str]:
+        """Render the family in Prometheus text exposition format."""
+        # Counter samples carry the _total suffix, and so must their header
+        family = f"{self.name}_total" if self.type_name == "counter" else self.name
+        lines = [
+            f"# HELP {family} {_escape_help(self.documentation)}",
+            f"# TYPE {family} {self.type_name}",
+        ]
+        for suffix, values, extra_names, value in self._samples():
+            names = self.labelnames + tuple(extra_names)
+            lines.append(f"{self.name}{suffix}{_format_labels(names, values)} {_format_value(value)}")
+        return lines
+
+
+class _CounterChild:
+    """A single counter time series."""
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Add a non-negative amount."""
+        with self._lock:
+            self.value += amount
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    type_name = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the unlabeled series."""
+        self.labels().inc(amount)
+
+    def _samples(self):
+        for values, child in list(self._children.items()):
+            yield "_total", values, (), child.value
+
+
+class _HistogramChild:
+    """A single histogram time series: per-bucket counts, sum and count."""
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        # One slot per bound plus +Inf; cumulated only when rendering
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        index = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        """Consistent copy of the bucket counts and sum."""
+        with self._lock:
+            return list(self.counts), self.sum
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.bounds = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.bounds)
+
+    def observe(self, value: float) -> None:
+        """Record an observation on the unlabeled series."""
+        self.labels().observe(value)
+
+    def _samples(self):
+        for values, child in list(self._children.items()):
+            counts, total = child.snapshot()
+            cumulative = 0
+            for bound, count in zip((*self.bounds, float("inf")), counts):
+                cumulative += count
+                yield "_bucket", (*values, _format_value(bound)), ("le",), cumulative
+            yield "_sum", values, (), total
+            yield "_count", values, (), cumulative
+
+
+class CallbackMetric(_Metric):
+    """
+    Gauge or counter whose value is read from a callback at scrape time,
+    for state that already lives elsewhere (cache sizes, queue depth).
+    The callback returns a number, or a mapping of label values to numbers.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Optional[CallbackValue]],
+        labelnames: Sequence[str] = (),
+        type_name: str = "gauge"
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+        self.type_name = type_name
+
+    def _new_child(self):
+        raise TypeError(f"{self.name} takes its label values from its callback, not labels()")
+
+    def _samples(self):
+        value = self.callback()
+        if value is None:
+            return
+        suffix = "_total" if self.type_name == "counter" else ""
+        if isinstance(value, Mapping):
+            for values, sample in value.items():
+                yield suffix, values, (), sample
+        else:
+            yield suffix, (), (), value
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together for scraping."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """
+        Add a metric family, or return the one already registered under
+        its name so module reloads do not duplicate series.
+        """
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Register a counter."""
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        """Register a histogram."""
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Optional[CallbackValue]],
+        labelnames: Sequence[str] = (),
+        type_name: str = "gauge"
+    ) -> CallbackMetric:
+        """Register a metric read from a callback at scrape time."""
+        return self.register(CallbackMetric(name, documentation, callback, labelnames, type_name))
+
+    def render(self) -> str:
+        """Render every family in Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "review_stage_duration_seconds",
+    "Time spent in each stage of the analysis pipeline.",
+    labelnames=("stage",)
+)
+
+SENTENCES_PER_REQUEST = REGISTRY.histogram(
+    "review_request_sentences",
+    "Sentences per analysis request.",
+    labelnames=("endpoint",),
+    buckets=SENTENCE_COUNT_BUCKETS
+)
+
+KEYWORD_FALLBACKS = REGISTRY.counter(
+    "review_keyword_fallbacks",
+    "Sentences classified by keywords because the model was unavailable or failed.",
+    labelnames=("reason",)
+)
+
+
+_recording: ContextVar[bool] = ContextVar("metrics_recording", default=True)
+
+# When set, stage timings are appended here instead of being recorded
+_stage_sink: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar(
+    "metrics_stage_sink", default=None
+)
+
+
+def is_recording() -> bool:
+    """Whether traffic statistics are recorded in the current context."""
+    return _recording.get()
+
+
+@contextmanager
+def recording_paused() -> Iterator[None]:
+    """
+    Leave the work done in a block out of stage timings and other traffic
+    statistics, e.g. synthetic warm-up batches that would skew them.
+    """
+    token = _recording.set(False)
+    try:
+        yield
+    finally:
+        _recording.reset(token)
+
+
+@contextmanager
+def collecting_stages() -> Iterator[List[Tuple[str, float]]]:
+    """
+    Collect the stage timings of a block as (stage, seconds) pairs instead
+    of recording them, for work done in a process whose metrics are never
+    scraped; the parent records them with record_stages.
+    """
+    sink: List[Tuple[str, float]] = []
+    token = _stage_sink.set(sink)
+    try:
+        yield sink
+    finally:
+        _stage_sink.reset(token)
+
+
+def record_stages(timings: Sequence[Tuple[str, float]]) -> None:
+    """
+    Record stage timings collected elsewhere, e.g. in an inference worker.
+
+    Args:
+        timings: (stage, seconds) pairs from collecting_stages
+    """
+    for stage, elapsed in timings:
+        STAGE_SECONDS.labels(stage).observe(elapsed)
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    """
+    Time a block as one pipeline stage, for the metrics histogram and,
+    when the request asked for it, the request's profile.
+
+    Args:
+        stage: Stage name, e.g. "split" or "generate"
+    """
+    if not is_recording():
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        sink = _stage_sink.get()
+        if sink is not None:
+            sink.append((stage, elapsed))
+            return
+        STAGE_SECONDS.labels(stage).observe(elapsed)
+        profile = current_profile()
+        if profile is not None:
+            profile.add(stage, elapsed)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format a label set as {name="value",...}."""
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value, with Prometheus spellings for infinities."""
+    if value == float("inf"):
+        return "+Inf"
+    if value == float("-inf"):
+        return "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
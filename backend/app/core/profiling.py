@@ -0,0 +1,187 @@
+import cProfile
+import io
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import parse_qs
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Header (or query parameter "profile") that asks for a request profile
+PROFILE_HEADER = b"x-profile"
+
+
+class RequestProfile:
+    """
+    Accumulated time per pipeline stage for one request.
+    Stages may be timed from several tasks and inference threads at once.
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float) -> None:
+        """
+        Add time spent in a stage.
+
+        Args:
+            stage: Stage name
+            seconds: Elapsed time
+        """
+        with self._lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def merge(self, stages: Dict[str, float]) -> None:
+        """
+        Add the stage times of work done on the request's behalf, such as
+        a shared inference batch.
+
+        Args:
+            stages: Seconds per stage
+        """
+        for stage, seconds in list(stages.items()):
+            self.add(stage, seconds)
+
+    def server_timing(self, total: Optional[float] = None) -> str:
+        """
+        Format the stages as a Server-Timing header value, in milliseconds.
+
+        Args:
+            total: Whole request time in seconds, added as "total"
+        """
+        with self._lock:
+            entries = [f"{stage};dur={seconds * 1000:.3f}" for stage, seconds in self.stages.items()]
+        if total is not None:
+            entries.append(f"total;dur={total * 1000:.3f}")
+        return ", ".join(entries)
+
+
+_current_profile: ContextVar[Optional[RequestProfile]] = ContextVar("request_profile", default=None)
+
+
+def current_profile() -> Optional[RequestProfile]:
+    """Profile of the request being handled, if it asked for one."""
+    return _current_profile.get()
+
+
+@contextmanager
+def capture_stages() -> Iterator[RequestProfile]:
+    """
+    Collect stage times into a fresh profile for the duration of a block,
+    e.g. an inference batch serving several requests.
+    """
+    profile = RequestProfile()
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+class RequestProfilingMiddleware:
+    """
+    Opt-in per-request profiling.
+    A request carrying an X-Profile header or a ?profile= query parameter
+    gets a Server-Timing response header with the time spent in each
+    pipeline stage; the stages are those timed with metrics.stage_timer.
+    Optionally a cProfile summary of the request is written to the debug
+    log. For streaming responses the header can only cover the work done
+    before the first byte; the full profile is logged at the end.
+    """
+
+    def __init__(
+        self,
+        app,
+        enabled: bool = False,
+        token: Optional[str] = None,
+        cprofile: bool = False,
+        top_functions: int = 25
+    ):
+        """
+        Initialize profiling middleware.
+
+        Args:
+            app: ASGI application to wrap
+            enabled: Whether requests may ask for a profile at all
+            token: Value the header or parameter must carry; when unset,
+                any value other than "0" or "false" is accepted
+            cprofile: Also run cProfile and log the hottest functions
+            top_functions: Functions listed in the cProfile summary
+        """
+        self.app = app
+        self.enabled = enabled
+        self.token = token
+        self.cprofile = cprofile
+        self.top_functions = top_functions
+        # Only one cProfile session can run at a time
+        self._cprofile_lock = threading.Lock()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.enabled or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+        started = time.perf_counter()
+        profiler = self._start_cprofile()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                timing = profile.server_timing(time.perf_counter() - started)
+                headers: List = list(message.get("headers", []))
+                headers.append((b"server-timing", timing.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_profile.reset(token)
+            logger.info(
+                f"Profile {scope['method']} {scope['path']}: "
+                f"{profile.server_timing(time.perf_counter() - started)}"
+            )
+            if profiler is not None:
+                self._log_cprofile(profiler, scope)
+
+    def _requested(self, scope) -> bool:
+        """Whether the request asked for a profile with an accepted value."""
+        value = None
+        for name, header_value in scope.get("headers", []):
+            if name == PROFILE_HEADER:
+                value = header_value.decode("latin-1")
+                break
+        if value is None:
+            values = parse_qs(scope.get("query_string", b"").decode("latin-1")).get("profile")
+            value = values[0] if values else None
+
+        if value is None:
+            return False
+        if self.token:
+            return value == self.token
+        return value.lower() not in ("0", "false")
+
+    def _start_cprofile(self) -> Optional[cProfile.Profile]:
+        """Start cProfile unless it is disabled or already profiling a request."""
+        if not self.cprofile or not self._cprofile_lock.acquire(blocking=False):
+            return None
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def _log_cprofile(self, profiler: cProfile.Profile, scope) -> None:
+        """Stop cProfile and log the functions with the most cumulative time."""
+        try:
+            profiler.disable()
+            output = io.StringIO()
+            pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(self.top_functions)
+            # The event loop thread is sampled, so concurrent requests show up too
+            logger.debug(f"cProfile {scope['method']} {scope['path']}:\n{output.getvalue()}")
+        finally:
+            self._cprofile_lock.release()
@@ -1,3 +1,4 @@
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,8 +9,9 @@ from pydantic import ValidationError
 from app.core.config import get_settings
 from app.core.logging import setup_logging, get_logger
 from app.core.exceptions import ReviewAnalysisException, ModelNotLoadedException
+from app.core.profiling import RequestProfilingMiddleware
 from app.api.v1.api_router import api_router
-from app.api.v1.dependencies import get_llm_service
+from app.api.v1.dependencies import get_job_service, get_llm_service
 
 # Setup logging
 setup_logging()
@@ -29,19 +31,35 @@ async def lifespan(app: FastAPI):
     logger.info("Starting application...")
     logger.info(f"App: {settings.app_name} v{settings.app_version}")
     
-    # Load LLM model
-    try:
-        llm_service = get_llm_service()
-        llm_service.load_model()
-        logger.info("LLM model loaded successfully")
-    except Exception as e:
-        logger.error(f"Failed to load LLM model: {e}")
-        logger.warning("Application will continue with keyword-based classification")
+    # Load LLM model, in the background unless configured otherwise
+    llm_service = get_llm_service()
+    model_loader = None
+    
+    if settings.model_background_load:
+        model_loader = asyncio.create_task(llm_service.load_model_in_background())
+        logger.info("Loading LLM model in the background")
+    else:
+        try:
+            llm_service.load_model()
+            logger.info("LLM model loaded successfully")
+        except Exception as e:
+            logger.error(f"Failed to load LLM model: {e}")
+            logger.warning("Application will continue with keyword-based classification")
+    
+    # Resume queued bulk jobs
+    if settings.jobs_enabled:
+        get_job_service().start()
     
     yield
     
     # Shutdown
     logger.info("Shutting down application...")
+    if settings.jobs_enabled:
+        await get_job_service().stop()
+    if model_loader is not None and not model_loader.done():
+        # The load thread cannot be interrupted; let it finish first
+        await model_loader
+    await get_llm_service().shutdown()
 
 
 # Create FastAPI app
@@ -62,6 +80,16 @@ app.add_middleware(
     allow_credentials=settings.cors_allow_credentials,
     allow_methods=settings.cors_allow_methods,
     allow_headers=settings.cors_allow_headers,
+    expose_headers=["Server-Timing"],
+)
+
+
+# Opt-in per-request profiling (Server-Timing header)
+app.add_middleware(
+    RequestProfilingMiddleware,
+    enabled=settings.request_profiling_enabled,
+    token=settings.request_profiling_token,
+    cprofile=settings.request_profiling_cprofile,
 )
 
 
@@ -95,9 +123,10 @@ async def model_not_loaded_exception_handler(
     return JSONResponse(
         status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
         content={
-            "message": "LLM model not available, using fallback classification",
+            "message": exc.message,
             "details": exc.details
-        }
+        },
+        headers={"Retry-After": "5"}
     )
 
 
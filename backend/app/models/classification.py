@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+from app.models.topic import Topic
+
+
+@dataclass(frozen=True)
+class Classification:
+    """
+    Result of classifying a single sentence.
+    Carries per-topic scores when the classifier produces them.
+    """
+    
+    topic: Topic
+    scores: Optional[Dict[str, float]] = field(default=None, compare=False)
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 from app.models.topic import Topic
 
 
@@ -12,6 +13,9 @@ class Sentence:
     index: int
     text: str
     topic: Topic
+    start: Optional[int] = None
+    end: Optional[int] = None
+    scores: Optional[Dict[str, float]] = field(default=None, compare=False)
     
     def __post_init__(self):
         """Validate sentence data after initialization."""
@@ -19,6 +23,8 @@ class Sentence:
             raise ValueError("Sentence index must be non-negative")
         if not self.text.strip():
             raise ValueError("Sentence text cannot be empty")
+        if self.start is not None and (self.start < 0 or self.end < self.start):
+            raise ValueError("Sentence span must satisfy 0 <= start <= end")
     
     @property
     def topic_name(self) -> str:
@@ -1,5 +1,7 @@
 from enum import Enum
-from typing import List
+from typing import List, Optional
+from app.core.config import get_keyword_matcher
+from app.utils.keyword_matcher import KeywordMatch, KeywordMatcher
 
 
 class Topic(str, Enum):
@@ -46,37 +48,35 @@ class Topic(str, Enum):
         return [topic.value for topic in cls]
     
     @classmethod
-    def detect_from_keywords(cls, text: str) -> "Topic":
+    def detect_from_keywords(
+        cls,
+        text: str,
+        matcher: Optional[KeywordMatcher] = None
+    ) -> "Topic":
         """
         Detect topic based on keyword matching.
         Fallback method when LLM is unavailable.
         
         Args:
             text: Text to analyze
+            matcher: Compiled keyword matcher, defaults to the configured tables
             
         Returns:
             Detected Topic
         """
-        lower_text = text.lower()
-        
-        # Performance keywords
-        if any(keyword in lower_text for keyword in ["crash", "slow", "lag", "freeze", "hang", "performance"]):
-            return cls.PERFORMANCE
-        
-        # Billing keywords
-        if any(keyword in lower_text for keyword in ["bill", "charg", "refund", "payment", "price", "cost"]):
-            return cls.BILLING
-        
-        # Support keywords
-        if any(keyword in lower_text for keyword in ["support", "help", "service", "assist", "response"]):
-            return cls.SUPPORT
-        
-        # Account keywords
-        if any(keyword in lower_text for keyword in ["login", "password", "sign in", "account", "auth"]):
-            return cls.ACCOUNT
-        
-        # UX keywords
-        if any(keyword in lower_text for keyword in ["button", "ui", "interface", "design", "confusing", "hard to find"]):
-            return cls.UX
+        return cls.from_keyword_match((matcher or get_keyword_matcher()).match(text))
+    
+    @classmethod
+    def from_keyword_match(cls, match: KeywordMatch) -> "Topic":
+        """
+        Convert a keyword match to a Topic.
         
-        return cls.OTHER
+        Args:
+            match: Result of a keyword matcher scan
+            
+        Returns:
+            Winning Topic, or OTHER if nothing matched
+        """
+        if match.topic is None:
+            return cls.OTHER
+        return cls.from_string(match.topic)
@@ -1,5 +1,11 @@
 from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import List
+from typing import Dict, List, Optional
+
+# Longest review accepted by the analyze endpoints
+MAX_REVIEW_LENGTH = 5000
+
+# Most reviews accepted by one batch request
+MAX_BATCH_REVIEWS = 1000
 
 
 class AnalyzeRequest(BaseModel):
@@ -8,10 +14,14 @@ class AnalyzeRequest(BaseModel):
     text: str = Field(
         ...,
         min_length=1,
-        max_length=5000,
+        max_length=MAX_REVIEW_LENGTH,
         description="Customer review text to analyze",
         examples=["The app crashes frequently. Customer support was helpful."]
     )
+    include_scores: bool = Field(
+        False,
+        description="Include per-topic scores (only produced in score classification mode)"
+    )
     
     model_config = ConfigDict(
         json_schema_extra={
@@ -24,10 +34,13 @@ class AnalyzeRequest(BaseModel):
     @field_validator("text")
     @classmethod
     def validate_text_not_empty(cls, v: str) -> str:
-        """Ensure text is not just whitespace."""
+        """
+        Ensure text is not just whitespace.
+        The text is kept as sent so sentence offsets index into it.
+        """
         if not v.strip():
             raise ValueError("Text cannot be empty or whitespace only")
-        return v.strip()
+        return v
 
 
 class SentenceResult(BaseModel):
@@ -36,13 +49,29 @@ class SentenceResult(BaseModel):
     index: int = Field(..., ge=0, description="Sentence index in the review")
     text: str = Field(..., description="The sentence text")
     topic: str = Field(..., description="Classified topic")
+    start: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Offset of the sentence's first character in the review text"
+    )
+    end: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Offset just past the sentence's last character (text == review[start:end])"
+    )
+    scores: Optional[Dict[str, float]] = Field(
+        None,
+        description="Per-topic scores, present when requested and available"
+    )
     
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
                 "index": 0,
                 "text": "The app crashes frequently.",
-                "topic": "Performance"
+                "topic": "Performance",
+                "start": 0,
+                "end": 27
             }
         }
     )
@@ -74,3 +103,89 @@ class AnalyzeResponse(BaseModel):
             }
         }
     )
+
+
+class AnalysisSummary(BaseModel):
+    """Closing summary of a streamed analysis."""
+    
+    total_sentences: int = Field(..., ge=0, description="Sentences classified")
+    topic_counts: Dict[str, int] = Field(..., description="Number of sentences per topic")
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "total_sentences": 2,
+                "topic_counts": {"Performance": 1, "Support": 1}
+            }
+        }
+    )
+
+
+class BatchReviewItem(BaseModel):
+    """A single review in a batch request."""
+    
+    id: str = Field(
+        ...,
+        min_length=1,
+        max_length=128,
+        description="Client-supplied review ID, echoed back in the result"
+    )
+    text: str = Field(
+        ...,
+        description=f"Customer review text (at most {MAX_REVIEW_LENGTH} characters)"
+    )
+
+
+class BatchAnalyzeRequest(BaseModel):
+    """Request model for analyzing many reviews at once."""
+    
+    reviews: List[BatchReviewItem] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_REVIEWS,
+        description="Reviews to analyze"
+    )
+    include_scores: bool = Field(
+        False,
+        description="Include per-topic scores (only produced in score classification mode)"
+    )
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "reviews": [
+                    {"id": "r-1", "text": "The app crashes frequently. Support was helpful."},
+                    {"id": "r-2", "text": "The app crashes frequently. I was charged twice."}
+                ]
+            }
+        }
+    )
+
+
+class BatchReviewResult(BaseModel):
+    """Analysis result, or error, for one review in a batch."""
+    
+    id: str = Field(..., description="Client-supplied review ID")
+    sentences: Optional[List[SentenceResult]] = Field(
+        None,
+        description="Analyzed sentences, absent if the review failed"
+    )
+    error: Optional[str] = Field(
+        None,
+        description="Why this review could not be analyzed"
+    )
+
+
+class BatchAnalyzeResponse(BaseModel):
+    """Response model for batch review analysis."""
+    
+    results: List[BatchReviewResult] = Field(
+        ...,
+        description="Per-review results in request order"
+    )
+    total_sentences: int = Field(..., ge=0, description="Sentences across all reviews")
+    unique_sentences: int = Field(
+        ...,
+        ge=0,
+        description="Distinct sentences actually classified"
+    )
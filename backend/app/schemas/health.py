@@ -1,4 +1,114 @@
 from pydantic import BaseModel, Field, ConfigDict
+from typing import Dict, List, Optional
+
+
+class CacheStats(BaseModel):
+    """Sentence cache counters."""
+    
+    entries: int = Field(..., description="Number of cached sentences")
+    bytes: int = Field(..., description="Approximate memory held by the cache")
+    hits: int = Field(..., description="Lookups served from the cache")
+    misses: int = Field(..., description="Lookups that required inference")
+    evictions: int = Field(..., description="Entries evicted to stay within limits")
+    expirations: int = Field(..., description="Entries dropped after their TTL")
+
+
+class PersistentCacheStats(BaseModel):
+    """Persistent cache counters for this worker process."""
+    
+    hits: int = Field(..., description="Lookups served from disk")
+    misses: int = Field(..., description="Lookups not found on disk")
+    errors: int = Field(..., description="Failed reads or writes")
+
+
+class RoutingStats(BaseModel):
+    """Sentences handled by each classification tier."""
+    
+    total: int = Field(..., description="Sentences classified")
+    counts: Dict[str, int] = Field(..., description="Sentences per tier")
+    fractions: Dict[str, float] = Field(..., description="Share of sentences per tier")
+
+
+class LengthBucketStats(BaseModel):
+    """Counters for one token-length bucket."""
+    
+    max_tokens: Optional[int] = Field(
+        None,
+        description="Longest prompt in the bucket, in tokens (null for the last bucket)"
+    )
+    batches: int = Field(..., description="Padded batches run for the bucket")
+    sentences: int = Field(..., description="Sentences that fell into the bucket")
+    occupancy: float = Field(..., description="Share of all sentences in the bucket")
+    mean_batch_size: float = Field(..., description="Average sentences per padded batch")
+    padding_waste: float = Field(..., description="Share of padded token slots that are padding")
+
+
+class LengthBucketingStats(BaseModel):
+    """Token-length bucketing counters, for tuning the bucket edges."""
+    
+    edges: List[int] = Field(..., description="Configured bucket edges, in tokens")
+    sentences: int = Field(..., description="Sentences run through the model")
+    padding_waste: float = Field(..., description="Share of padded token slots that are padding")
+    padding_waste_unbucketed: float = Field(
+        ...,
+        description="Padding share the same batches would have had without bucketing"
+    )
+    buckets: List[LengthBucketStats] = Field(..., description="Per-bucket counters")
+
+
+class ModelLoadStatus(BaseModel):
+    """Progress and timing of the model load."""
+    
+    state: str = Field(..., description="not_started, loading, ready or failed")
+    stage: Optional[str] = Field(None, description="Current load step while loading")
+    progress: float = Field(..., ge=0, le=1, description="Fraction of load steps done")
+    started_at: Optional[float] = Field(None, description="Load start time (Unix seconds)")
+    load_seconds: Optional[float] = Field(
+        None,
+        description="Load duration, or time spent so far while loading"
+    )
+    error: Optional[str] = Field(None, description="Why loading failed")
+    threads: Optional[Dict[str, int]] = Field(
+        None,
+        description="intra_op and inter_op threads per inference unit"
+    )
+    warmup_ms: Optional[Dict[str, float]] = Field(
+        None,
+        description="Warm-up latency per shape, keyed <batch>x<words>w"
+    )
+
+
+class LivenessResponse(BaseModel):
+    """Liveness probe response model."""
+    
+    status: str = Field(..., description="Always ok while the process is serving")
+
+
+class ReadinessResponse(BaseModel):
+    """Readiness probe response model."""
+    
+    ready: bool = Field(..., description="Whether the API can serve analysis requests")
+    serving: str = Field(
+        ...,
+        description="What classifies sentences right now: model, keyword or none"
+    )
+    model: ModelLoadStatus = Field(..., description="Model load progress and timing")
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "ready": True,
+                "serving": "keyword",
+                "model": {
+                    "state": "loading",
+                    "stage": "loading_model",
+                    "progress": 0.0,
+                    "started_at": 1760774400.0,
+                    "load_seconds": 1.8
+                }
+            }
+        }
+    )
 
 
 class HealthResponse(BaseModel):
@@ -7,13 +117,34 @@ class HealthResponse(BaseModel):
     status: str = Field(..., description="Overall API status")
     model_loaded: bool = Field(..., description="Whether the LLM model is loaded")
     model_name: str = Field(..., description="Name of the loaded model")
+    model_precision: str = Field(
+        "fp32",
+        description="Numeric precision the model runs in (fp32, int8 or bf16)"
+    )
+    cache: Optional[CacheStats] = Field(
+        None,
+        description="Sentence cache counters, if caching is enabled"
+    )
+    routing: Optional[RoutingStats] = Field(
+        None,
+        description="Keyword, cache, LLM and fallback tier counters"
+    )
+    persistent_cache: Optional[PersistentCacheStats] = Field(
+        None,
+        description="Persistent cache counters, if configured"
+    )
+    bucketing: Optional[LengthBucketingStats] = Field(
+        None,
+        description="Token-length bucket occupancy and padding waste, if the backend pads batches"
+    )
     
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
                 "status": "ok",
                 "model_loaded": True,
-                "model_name": "google/flan-t5-small"
+                "model_name": "google/flan-t5-small",
+                "model_precision": "fp32"
             }
         }
     )
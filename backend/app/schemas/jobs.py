@@ -0,0 +1,40 @@
+from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional
+
+
+class JobStatusResponse(BaseModel):
+    """Progress of an asynchronous bulk analysis job."""
+    
+    id: str = Field(..., description="Job ID")
+    status: str = Field(..., description="queued, running or completed")
+    total: int = Field(..., ge=0, description="Reviews in the upload")
+    processed: int = Field(..., ge=0, description="Reviews finished so far, including failures")
+    failed: int = Field(..., ge=0, description="Reviews that could not be analyzed")
+    throughput: Optional[float] = Field(
+        None,
+        description="Reviews processed per second since the job started"
+    )
+    eta_seconds: Optional[float] = Field(
+        None,
+        description="Estimated seconds until the job completes"
+    )
+    created_at: float = Field(..., description="Submission time (Unix seconds)")
+    started_at: Optional[float] = Field(None, description="Time processing started")
+    finished_at: Optional[float] = Field(None, description="Time processing finished")
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "id": "4f0c2b1e9a8d4c7b8e6f5a4b3c2d1e0f",
+                "status": "running",
+                "total": 100000,
+                "processed": 25000,
+                "failed": 12,
+                "throughput": 410.5,
+                "eta_seconds": 182.7,
+                "created_at": 1760774400.0,
+                "started_at": 1760774401.2,
+                "finished_at": None
+            }
+        }
+    )
@@ -0,0 +1,65 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+from app.models.classification import Classification
+from app.services.runtime_tuning import ThreadBudget
+
+
+class InferenceBackend(ABC):
+    """
+    Interface for the model that classifies sentences.
+    LLMService handles routing, caching, batching and worker processes;
+    a backend only loads a model and classifies a batch of sentences.
+    """
+
+    #: Short backend name, used in logs and health output
+    name: str = "base"
+
+    @property
+    def cache_namespace(self) -> str:
+        """
+        Identifies the model whose results are cached, so results from
+        different backends or models never share cache entries.
+        """
+        return self.name
+
+    @property
+    def precision(self) -> str:
+        """Numeric precision the model runs in."""
+        return "fp32"
+
+    def configure_threads(self, budget: ThreadBudget) -> None:
+        """
+        Limit the threads the backend's runtime uses. Called before load.
+
+        Args:
+            budget: Threads available to each inference unit
+        """
+
+    def bucket_stats(self) -> Optional[Dict[str, object]]:
+        """
+        Token-length bucket occupancy and padding waste, for backends that
+        pad batches; None otherwise.
+        """
+        return None
+
+    @abstractmethod
+    def load(self) -> None:
+        """
+        Load the model. Called once, before any classification.
+
+        Raises:
+            Exception: If the model cannot be loaded
+        """
+
+    @abstractmethod
+    def classify(self, texts: List[str]) -> List[Classification]:
+        """
+        Classify a batch of sentences. Blocking - always called on the
+        inference executor or in a worker process.
+
+        Args:
+            texts: Sentences to classify
+
+        Returns:
+            Classifications in the same order as the input
+        """
@@ -0,0 +1,98 @@
+from app.core.config import Settings
+from app.core.exceptions import ConfigurationException
+from app.services.backends.base import InferenceBackend
+from app.utils.keyword_matcher import KeywordMatcher
+
+INFERENCE_BACKENDS = ("auto", "transformers", "gguf", "keyword", "fake")
+
+
+def resolve_backend_name(settings: Settings) -> str:
+    """
+    Get the backend to use. "auto" picks gguf for a .gguf model file,
+    keyword or fake when the model name is "keyword" or "fake", and
+    transformers otherwise.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Backend name
+
+    Raises:
+        ConfigurationException: If the backend is unknown
+    """
+    backend = settings.inference_backend.lower()
+    if backend not in INFERENCE_BACKENDS:
+        raise ConfigurationException(
+            f"Unknown inference backend: {settings.inference_backend}",
+            details=f"Expected one of: {', '.join(INFERENCE_BACKENDS)}"
+        )
+
+    if backend != "auto":
+        return backend
+    if settings.model_name.lower().endswith(".gguf"):
+        return "gguf"
+    if settings.model_name.lower() in ("keyword", "fake"):
+        return settings.model_name.lower()
+    return "transformers"
+
+
+def create_backend(settings: Settings) -> InferenceBackend:
+    """
+    Create the configured inference backend without loading its model.
+    Backend modules are imported on demand so optional dependencies are
+    only needed by the backend actually used.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Unloaded inference backend
+
+    Raises:
+        ConfigurationException: If the backend does not support the settings
+    """
+    backend = resolve_backend_name(settings)
+
+    if backend == "keyword":
+        from app.services.backends.keyword_backend import KeywordBackend
+        return KeywordBackend(KeywordMatcher(settings.topic_keywords))
+
+    if backend == "fake":
+        from app.services.backends.fake_backend import (
+            FAKE_LATENCY_DISTRIBUTIONS,
+            FakeBackend
+        )
+        if settings.fake_latency_distribution not in FAKE_LATENCY_DISTRIBUTIONS:
+            raise ConfigurationException(
+                f"Unknown fake latency distribution: {settings.fake_latency_distribution}",
+                details=f"Expected one of: {', '.join(FAKE_LATENCY_DISTRIBUTIONS)}"
+            )
+        if (
+            settings.fake_latency_distribution == "exponential"
+            and not 0 <= settings.fake_latency_jitter <= 1
+        ):
+            raise ConfigurationException(
+                "Fake latency jitter must be between 0 and 1 for the exponential distribution",
+                details="Larger values would make the latency multiplier negative"
+            )
+        return FakeBackend(settings)
+
+    if backend == "gguf":
+        if settings.classification_mode != "generate":
+            raise ConfigurationException(
+                "The gguf backend only supports the generate classification mode"
+            )
+        from app.services.backends.gguf_backend import GGUFBackend
+        return GGUFBackend(settings)
+
+    from app.services.backends.transformers_backend import (
+        MODEL_PRECISIONS,
+        TransformersBackend
+    )
+    if settings.model_precision not in MODEL_PRECISIONS:
+        raise ConfigurationException(
+            f"Unknown model precision: {settings.model_precision}",
+            details=f"Expected one of: {', '.join(MODEL_PRECISIONS)}"
+        )
+    return TransformersBackend(settings)
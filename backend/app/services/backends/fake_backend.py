@@ -0,0 +1,112 @@
+import hashlib
+import random
+import threading
+import time
+from typing import List
+from app.core.config import Settings
+from app.models.classification import Classification
+from app.models.topic import Topic
+from app.services.backends.base import InferenceBackend
+from app.services.result_cache import normalize_sentence
+
+FAKE_LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+
+class FakeBackend(InferenceBackend):
+    """
+    Deterministic stand-in for a model, for load tests without one.
+    Every sentence gets the same topic on every run (derived from a hash
+    of its normalized text), and each batch blocks the inference thread
+    for a simulated time:
+
+        base_ms + per_item_ms * batch_size ** batch_exponent
+
+    scaled by a random factor drawn from the configured distribution.
+    A batch_exponent below 1 models batching gains; 1 means none.
+    """
+
+    name = "fake"
+
+    def __init__(self, settings: Settings):
+        """
+        Initialize fake backend.
+
+        Args:
+            settings: Application settings with the fake_* latency options
+        """
+        self.settings = settings
+        self._rng = random.Random(settings.fake_seed)
+        self._rng_lock = threading.Lock()
+
+    @property
+    def precision(self) -> str:
+        """There are no weights."""
+        return "none"
+
+    def load(self) -> None:
+        """Pretend to load a model for fake_load_seconds."""
+        time.sleep(max(self.settings.fake_load_seconds, 0.0))
+
+    def batch_latency(self, batch_size: int) -> float:
+        """
+        Draw the simulated inference time of one batch.
+
+        Args:
+            batch_size: Sentences in the batch
+
+        Returns:
+            Seconds to block for
+        """
+        settings = self.settings
+        mean_ms = (
+            settings.fake_latency_base_ms
+            + settings.fake_latency_per_item_ms * batch_size ** settings.fake_batch_exponent
+        )
+        return max(mean_ms * self._jitter(), 0.0) / 1000.0
+
+    def classify(self, texts: List[str]) -> List[Classification]:
+        """
+        Sleep for the simulated batch time, then label each sentence.
+
+        Args:
+            texts: Sentences to classify
+
+        Returns:
+            Deterministic classifications in the same order as the input
+        """
+        time.sleep(self.batch_latency(len(texts)))
+        return [self._classify_one(text) for text in texts]
+
+    def _classify_one(self, text: str) -> Classification:
+        """Pick a topic (and scores, in score mode) from the text's hash."""
+        digest = hashlib.blake2b(normalize_sentence(text).encode("utf-8"), digest_size=8).digest()
+        topics = list(Topic)
+        topic = topics[digest[0] % len(topics)]
+
+        if self.settings.classification_mode != "score":
+            return Classification(topic=topic)
+
+        # Most of the mass on the chosen topic, the rest spread evenly
+        rest = 0.2 / (len(topics) - 1)
+        scores = {t.value: (0.8 if t is topic else rest) for t in topics}
+        return Classification(topic=topic, scores=scores)
+
+    def _jitter(self) -> float:
+        """Random latency multiplier with mean 1."""
+        distribution = self.settings.fake_latency_distribution
+        spread = self.settings.fake_latency_jitter
+
+        with self._rng_lock:
+            if distribution == "uniform":
+                return self._rng.uniform(1 - spread, 1 + spread)
+            if distribution == "normal":
+                return self._rng.gauss(1.0, spread)
+            if distribution == "lognormal":
+                # Long right tail, like real generation latency; mean 1
+                return self._rng.lognormvariate(-spread ** 2 / 2, spread)
+            if distribution == "exponential":
+                # Shifted so the mean stays 1 with standard deviation spread
+                if spread <= 0:
+                    return 1.0
+                return 1 - spread + self._rng.expovariate(1 / spread)
+        return 1.0
@@ -0,0 +1,96 @@
+import threading
+from typing import Any, List, Optional
+from app.core.config import Settings
+from app.core.exceptions import ModelNotLoadedException
+from app.models.classification import Classification
+from app.models.topic import Topic
+from app.services.backends.base import InferenceBackend
+from app.services.prompt import build_prompt
+from app.services.runtime_tuning import ThreadBudget
+
+
+class GGUFBackend(InferenceBackend):
+    """
+    llama.cpp backend for quantized GGUF models, such as the TinyLlama
+    file fetched by scripts/download_model.py into models/model.gguf.
+    Requires the optional `llama-cpp-python` package.
+    """
+
+    name = "gguf"
+
+    def __init__(self, settings: Settings):
+        """
+        Initialize GGUF backend.
+
+        Args:
+            settings: Application settings; model_name is the .gguf file path
+        """
+        self.settings = settings
+        self.model: Optional[Any] = None
+        self._threads: Optional[int] = settings.gguf_threads
+        # A llama.cpp context must not be used by two threads at once
+        self._lock = threading.Lock()
+
+    @property
+    def cache_namespace(self) -> str:
+        """Results are cached per model file."""
+        return f"gguf:{self.settings.model_name}"
+
+    @property
+    def precision(self) -> str:
+        """Quantization is fixed by the GGUF file itself."""
+        return "gguf"
+
+    def configure_threads(self, budget: ThreadBudget) -> None:
+        """Use the budget's threads unless GGUF_THREADS is set."""
+        if self.settings.gguf_threads is None:
+            self._threads = budget.intra_op_threads
+
+    def load(self) -> None:
+        """
+        Load the GGUF model file.
+
+        Raises:
+            ModelNotLoadedException: If llama-cpp-python is not installed
+        """
+        try:
+            from llama_cpp import Llama
+        except ImportError as e:
+            raise ModelNotLoadedException(
+                "The gguf backend requires llama-cpp-python",
+                details="pip install llama-cpp-python"
+            ) from e
+
+        self.model = Llama(
+            model_path=self.settings.model_name,
+            n_ctx=self.settings.gguf_context_size,
+            n_threads=self._threads,
+            verbose=False
+        )
+
+    def classify(self, texts: List[str]) -> List[Classification]:
+        """
+        Complete the few-shot prompt for each sentence with greedy decoding.
+        llama.cpp evaluates one prompt at a time, so the batch is run
+        sequentially on the shared context.
+
+        Args:
+            texts: Sentences to classify
+
+        Returns:
+            Classifications in the same order as the input
+        """
+        classifications: List[Classification] = []
+
+        with self._lock:
+            for text in texts:
+                completion = self.model.create_completion(
+                    build_prompt(text),
+                    max_tokens=self.settings.max_new_tokens,
+                    temperature=0.0,
+                    stop=["\n"]
+                )
+                output = completion["choices"][0]["text"]
+                classifications.append(Classification(topic=Topic.from_string(output)))
+
+        return classifications
@@ -0,0 +1,38 @@
+from typing import List
+from app.models.classification import Classification
+from app.models.topic import Topic
+from app.services.backends.base import InferenceBackend
+from app.utils.keyword_matcher import KeywordMatcher
+
+
+class KeywordBackend(InferenceBackend):
+    """
+    Model-free backend that classifies with the keyword tables alone.
+    Useful on hosts too small for a model, and as a latency baseline.
+    """
+
+    name = "keyword"
+
+    def __init__(self, matcher: KeywordMatcher):
+        """
+        Initialize keyword backend.
+
+        Args:
+            matcher: Compiled keyword tables
+        """
+        self.matcher = matcher
+
+    @property
+    def precision(self) -> str:
+        """Keyword rules have no numeric precision."""
+        return "none"
+
+    def load(self) -> None:
+        """Nothing to load."""
+
+    def classify(self, texts: List[str]) -> List[Classification]:
+        """Classify each sentence by its keyword match."""
+        return [
+            Classification(topic=Topic.from_keyword_match(self.matcher.match(text)))
+            for text in texts
+        ]
@@ -0,0 +1,233 @@
+from typing import TYPE_CHECKING, Dict, List, Optional
+from app.core.config import Settings
+from app.core.logging import get_logger
+from app.core.metrics import stage_timer
+from app.models.classification import Classification
+from app.models.topic import Topic
+from app.services.backends.base import InferenceBackend
+from app.services.length_bucketing import LengthBucketer
+from app.services.prompt import CompiledPrompt
+from app.services.runtime_tuning import ThreadBudget, set_thread_env
+
+if TYPE_CHECKING:
+    import torch
+    from transformers import PreTrainedModel, PreTrainedTokenizerBase
+
+logger = get_logger(__name__)
+
+MODEL_PRECISIONS = ("fp32", "int8", "bf16")
+
+
+class TransformersBackend(InferenceBackend):
+    """
+    Hugging Face seq2seq backend (e.g. flan-t5).
+    Classifies by free-form generation or by scoring every topic label,
+    optionally with int8 dynamic quantization or bf16 weights.
+    Batches are split into token-length buckets, each padded on its own.
+    torch and transformers are imported on load, not on import, so the
+    API can start serving before they are available.
+    """
+
+    name = "transformers"
+
+    def __init__(self, settings: Settings):
+        """
+        Initialize transformers backend.
+
+        Args:
+            settings: Application settings containing model configuration
+        """
+        self.settings = settings
+        self.model: Optional["PreTrainedModel"] = None
+        self.tokenizer: Optional["PreTrainedTokenizerBase"] = None
+        self._prompt: Optional[CompiledPrompt] = None
+        self._label_ids: Optional["torch.Tensor"] = None
+        self.bucketer: Optional[LengthBucketer] = (
+            LengthBucketer(settings.length_bucket_edges)
+            if settings.length_bucketing
+            else None
+        )
+
+    @property
+    def cache_namespace(self) -> str:
+        """
+        Results are cached per model and precision: int8 and bf16 may label
+        sentences differently from fp32, so they never share entries.
+        """
+        return f"{self.settings.model_name}:{self.settings.model_precision}"
+
+    @property
+    def precision(self) -> str:
+        """Configured model precision."""
+        return self.settings.model_precision
+
+    def configure_threads(self, budget: ThreadBudget) -> None:
+        """Set torch's intra-op and inter-op thread pools to the budget."""
+        set_thread_env(budget)
+        import torch
+
+        torch.set_num_threads(budget.intra_op_threads)
+        try:
+            torch.set_num_interop_threads(budget.inter_op_threads)
+        except RuntimeError:
+            # Only allowed once, before any inter-op work has started
+            logger.debug("torch inter-op threads already set, keeping them")
+
+    def load(self) -> None:
+        """Load the model and tokenizer and pre-tokenize the prompt and labels."""
+        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+        self.tokenizer = AutoTokenizer.from_pretrained(self.settings.model_name)
+        model = AutoModelForSeq2SeqLM.from_pretrained(self.settings.model_name)
+        self.model = self._apply_precision(model.eval())
+        self._prompt = CompiledPrompt(self.tokenizer, self.settings.max_tokens)
+        self._label_ids = self._build_label_ids()
+
+    def classify(self, texts: List[str]) -> List[Classification]:
+        """
+        Classify sentences using the configured classification mode.
+        The prompts are tokenized once, grouped into length buckets and
+        run as one padded batch per bucket; results keep the input order.
+
+        Args:
+            texts: Sentences to classify
+
+        Returns:
+            Classifications in the same order as the input
+        """
+        with stage_timer("tokenize"):
+            rows = self._prompt.token_ids(texts)
+        if self.bucketer is not None:
+            groups = self.bucketer.split([len(row) for row in rows])
+        else:
+            groups = [list(range(len(rows)))]
+
+        results: List[Optional[Classification]] = [None] * len(rows)
+        for positions in groups:
+            with stage_timer("tokenize"):
+                inputs = self._prompt.pad([rows[position] for position in positions])
+            for position, classification in zip(positions, self._classify_batch(inputs)):
+                results[position] = classification
+
+        return results
+
+    def bucket_stats(self) -> Optional[Dict[str, object]]:
+        """Length bucket occupancy and padding waste, if bucketing is on."""
+        if self.bucketer is None:
+            return None
+        return self.bucketer.stats()
+
+    def _classify_batch(self, inputs) -> List[Classification]:
+        """Classify one padded batch of prompts."""
+        if self.settings.classification_mode == "score":
+            return self._score_labels(inputs)
+
+        outputs = self._generate(inputs)
+
+        with stage_timer("decode"):
+            return [
+                Classification(topic=Topic.from_string(output))
+                for output in self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
+            ]
+
+    def _apply_precision(self, model):
+        """
+        Convert a freshly loaded fp32 model to the configured precision.
+        int8 dynamically quantizes the weights of every linear layer
+        (activations are quantized on the fly); bf16 casts all weights.
+        """
+        import torch
+
+        precision = self.settings.model_precision
+
+        if precision == "int8":
+            return torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        if precision == "bf16":
+            return model.to(torch.bfloat16)
+        return model
+
+    def _generate(self, inputs):
+        """
+        Run free-form generation on a padded prompt batch.
+
+        Args:
+            inputs: input_ids and attention_mask tensors
+
+        Returns:
+            Generated token IDs
+        """
+        with stage_timer("generate"):
+            return self.model.generate(
+                **inputs,
+                max_new_tokens=self.settings.max_new_tokens
+            )
+
+    def _score_labels(self, inputs) -> List[Classification]:
+        """
+        Score every topic label with one encoder pass per prompt and one
+        batched decoder pass over all (prompt, label) pairs.
+        Picks the label with the highest sequence log-likelihood.
+
+        Args:
+            inputs: input_ids and attention_mask tensors of the prompts
+
+        Returns:
+            Classifications with label probabilities as scores
+        """
+        import torch
+
+        label_ids = self._label_ids
+        num_prompts, num_labels = inputs["input_ids"].size(0), label_ids.size(0)
+
+        # Label scoring is this mode's forward pass, timed as "generate"
+        with torch.inference_mode(), stage_timer("generate"):
+            encoder_states = self.model.get_encoder()(**inputs).last_hidden_state
+
+            # Pair every prompt with every label: rows are (prompt, label)
+            encoder_states = encoder_states.repeat_interleave(num_labels, dim=0)
+            attention_mask = inputs["attention_mask"].repeat_interleave(num_labels, dim=0)
+            labels = label_ids.repeat(num_prompts, 1)
+
+            logits = self.model(
+                encoder_outputs=(encoder_states,),
+                attention_mask=attention_mask,
+                decoder_input_ids=self.model.prepare_decoder_input_ids_from_labels(
+                    labels=labels
+                )
+            ).logits.float()
+
+            token_log_probs = logits.log_softmax(dim=-1).gather(
+                -1, labels.clamp(min=0).unsqueeze(-1)
+            ).squeeze(-1)
+            label_log_probs = (
+                token_log_probs.masked_fill(labels == -100, 0.0)
+                .sum(dim=-1)
+                .view(num_prompts, num_labels)
+            )
+            probabilities = label_log_probs.softmax(dim=-1)
+
+        topics = list(Topic)
+        classifications: List[Classification] = []
+        with stage_timer("decode"):
+            for row in probabilities.tolist():
+                best = max(range(num_labels), key=row.__getitem__)
+                classifications.append(Classification(
+                    topic=topics[best],
+                    scores={topic.value: round(score, 6) for topic, score in zip(topics, row)}
+                ))
+
+        return classifications
+
+    def _build_label_ids(self):
+        """
+        Tokenize every topic label once, padded to a common length.
+        Padding positions are set to -100 so they are ignored when scoring.
+        """
+        encoded = self.tokenizer(
+            Topic.all_values(),
+            return_tensors="pt",
+            padding=True
+        )
+        return encoded["input_ids"].masked_fill(encoded["attention_mask"] == 0, -100)
@@ -0,0 +1,205 @@
+import asyncio
+import contextvars
+import itertools
+from enum import IntEnum
+from typing import Awaitable, Callable, Generic, List, Optional, Set, Tuple, TypeVar
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+BatchHandler = Callable[[List[str]], Awaitable[List[T]]]
+
+
+class Priority(IntEnum):
+    """Scheduling priority; lower values are batched first."""
+
+    INTERACTIVE = 0
+    BULK = 1
+
+
+class BatchScheduler(Generic[T]):
+    """
+    Dynamic micro-batching scheduler.
+    Gathers items submitted by concurrent callers and dispatches them
+    to a batch handler in a single call, resolving each caller's future
+    with its own result. Higher-priority items are always batched before
+    lower-priority ones, so bulk work cannot starve interactive requests.
+    """
+
+    def __init__(
+        self,
+        handler: BatchHandler,
+        max_batch_size: int,
+        max_wait_ms: float,
+        max_concurrent_batches: int = 1
+    ):
+        """
+        Initialize batch scheduler.
+
+        Args:
+            handler: Coroutine function mapping a list of items to a list
+                of results of the same length and order
+            max_batch_size: Maximum number of items dispatched together
+            max_wait_ms: Maximum time to wait for a batch to fill up
+            max_concurrent_batches: Number of batches allowed in flight
+                at once, typically the number of inference threads
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_concurrent_batches < 1:
+            raise ValueError("max_concurrent_batches must be at least 1")
+
+        self._handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait = max(max_wait_ms, 0.0) / 1000.0
+        self.max_concurrent_batches = max_concurrent_batches
+
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._sequence = itertools.count()
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._in_flight: Set[asyncio.Task] = set()
+
+    async def submit(self, item: str, priority: Priority = Priority.INTERACTIVE) -> T:
+        """
+        Submit an item and wait for its result.
+
+        Args:
+            item: Item to process
+            priority: Scheduling priority of the item
+
+        Returns:
+            Result produced by the batch handler for this item
+
+        Raises:
+            Exception: Whatever the batch handler raised for this batch
+        """
+        self._ensure_worker()
+
+        future = self._loop.create_future()
+        # The sequence number keeps FIFO order within a priority level
+        self._queue.put_nowait((priority, next(self._sequence), item, future))
+        return await future
+
+    def queue_depth(self) -> int:
+        """Items waiting to be batched."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def batches_in_flight(self) -> int:
+        """Batches dispatched and not yet finished."""
+        return len(self._in_flight)
+
+    async def close(self) -> None:
+        """Stop the dispatch loop and fail any pending submissions."""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+        if self._queue is not None:
+            while not self._queue.empty():
+                *_, future = self._queue.get_nowait()
+                if not future.done():
+                    future.set_exception(RuntimeError("Batch scheduler closed"))
+
+        self._worker = None
+        self._queue = None
+        self._loop = None
+
+    def _ensure_worker(self) -> None:
+        """Start the dispatch loop on the running event loop if needed."""
+        loop = asyncio.get_running_loop()
+
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.PriorityQueue()
+            self._slots = asyncio.Semaphore(self.max_concurrent_batches)
+            # A fresh context, so the dispatch loop (and every batch it starts)
+            # does not inherit the context variables of whichever request
+            # happened to start it
+            self._worker = loop.create_task(self._run(), context=contextvars.Context())
+
+    async def _run(self) -> None:
+        """Collect batches from the queue and dispatch them."""
+        while True:
+            # Only start collecting once a dispatch slot is free, so items
+            # keep accumulating into the next batch while inference is busy
+            await self._slots.acquire()
+            try:
+                batch = await self._collect_batch()
+            except BaseException:
+                self._slots.release()
+                raise
+
+            task = self._loop.create_task(self._dispatch(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._on_dispatch_done)
+
+    def _on_dispatch_done(self, task: asyncio.Task) -> None:
+        """Free the dispatch slot held by a finished batch."""
+        self._in_flight.discard(task)
+        self._slots.release()
+
+    async def _collect_batch(self) -> List[Tuple[str, asyncio.Future]]:
+        """
+        Wait for the first item, then gather more until the batch is full
+        or the wait budget is spent.
+        """
+        batch = [self._unwrap(await self._queue.get())]
+        deadline = self._loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._unwrap(self._queue.get_nowait()))
+                continue
+
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+
+            try:
+                batch.append(self._unwrap(await asyncio.wait_for(self._queue.get(), timeout)))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    @staticmethod
+    def _unwrap(entry: Tuple) -> Tuple[str, asyncio.Future]:
+        """Drop the ordering fields from a queue entry."""
+        *_, item, future = entry
+        return item, future
+
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Run the handler on a batch and resolve the callers' futures."""
+        # Callers that gave up while queued don't need a slot in the batch
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if not batch:
+            return
+
+        items = [item for item, _ in batch]
+        logger.debug(f"Dispatching batch of {len(items)} items")
+
+        try:
+            results = await self._handler(items)
+            if len(results) != len(items):
+                raise RuntimeError(
+                    f"Batch handler returned {len(results)} results for {len(items)} items"
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
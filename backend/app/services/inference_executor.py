@@ -0,0 +1,90 @@
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class InferenceExecutor:
+    """
+    Dedicated thread pool for blocking model inference.
+    Keeps tokenization and generation off the asyncio event loop so that
+    awaiting callers yield and other endpoints stay responsive.
+    """
+
+    def __init__(self, max_workers: int):
+        """
+        Initialize inference executor.
+
+        Args:
+            max_workers: Number of inference threads
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> "Future[T]":
+        """
+        Schedule a blocking call on the inference threads.
+
+        Args:
+            fn: Callable to run
+            *args: Positional arguments for the callable
+
+        Returns:
+            Future resolving to the callable's return value
+        """
+        return self._get_executor().submit(fn, *args)
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking call on the inference threads and await its result.
+        The call sees the caller's context variables (e.g. its request profile).
+
+        Args:
+            fn: Callable to run
+            *args: Positional arguments for the callable
+
+        Returns:
+            The callable's return value
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self._get_executor(),
+            functools.partial(context.run, fn, *args)
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the inference threads.
+        The pool is recreated on the next submission.
+
+        Args:
+            wait: Whether to wait for running calls to finish
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the thread pool on first use."""
+        with self._lock:
+            if self._executor is None:
+                logger.info(f"Starting inference executor with {self.max_workers} thread(s)")
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="inference"
+                )
+            return self._executor
@@ -0,0 +1,281 @@
+import asyncio
+import csv
+import io
+import json
+import time
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+from app.core.exceptions import ValidationException
+from app.schemas.analyze import BatchAnalyzeRequest, BatchReviewItem, MAX_BATCH_REVIEWS
+from app.schemas.jobs import JobStatusResponse
+from app.services.batch_scheduler import Priority
+from app.services.job_store import JobItem, JobRecord, JobStore
+from app.services.llm_service import ModelLoadState
+from app.services.review_analysis_service import ReviewAnalysisService
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+def parse_upload(
+    upload: BinaryIO,
+    fmt: str
+) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """
+    Parse an uploaded JSONL or CSV corpus lazily, one review at a time.
+    Each JSONL line is an object with "text" and an optional "id"; a CSV
+    file needs a header row with a "text" column and an optional "id"
+    column. Reviews without an id are numbered by their position.
+
+    Args:
+        upload: Binary file positioned at the start of the upload
+        fmt: "jsonl" or "csv"
+
+    Returns:
+        Iterator of (review_id, text, failed_result) tuples, where
+        failed_result is an error entry for a record that cannot be used
+
+    Raises:
+        ValidationException: If the format is unknown or the CSV header
+            has no "text" column
+    """
+    stream = io.TextIOWrapper(upload, encoding="utf-8", errors="replace", newline="")
+
+    if fmt == "jsonl":
+        return _parse_jsonl(stream)
+
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        if not reader.fieldnames or "text" not in reader.fieldnames:
+            raise ValidationException("CSV upload must have a header row with a 'text' column")
+        return _parse_csv(reader)
+
+    raise ValidationException(f"Unsupported upload format: {fmt}")
+
+
+def _parse_jsonl(stream: io.TextIOWrapper) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """Yield reviews from JSONL lines, skipping blank lines."""
+    position = 0
+    for line in stream:
+        if not line.strip():
+            continue
+
+        review_id = str(position)
+        position += 1
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict) or not isinstance(record.get("text"), str):
+                raise ValueError("expected an object with a string 'text' field")
+            review_id = str(record.get("id", review_id))
+            yield review_id, record["text"], None
+        except ValueError as e:
+            yield review_id, "", _result_json(review_id, error=f"Invalid JSON line: {e}")
+
+
+def _parse_csv(reader: csv.DictReader) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """Yield reviews from CSV rows."""
+    for position, row in enumerate(reader):
+        review_id = row.get("id") or str(position)
+        yield review_id, row.get("text") or "", None
+
+
+def _result_json(
+    review_id: str,
+    sentences: Optional[List[dict]] = None,
+    error: Optional[str] = None
+) -> str:
+    """Serialize one review's result line."""
+    result = {"id": review_id}
+    if sentences is not None:
+        result["sentences"] = sentences
+    if error is not None:
+        result["error"] = error
+    return json.dumps(result)
+
+
+class JobService:
+    """
+    Service for asynchronous bulk analysis jobs.
+    Uploads are queued in a persistent JobStore and worked through in the
+    background, chunk by chunk, at bulk priority so interactive requests
+    are always batched first.
+    """
+
+    def __init__(
+        self,
+        review_service: ReviewAnalysisService,
+        store: JobStore,
+        chunk_size: int = 64,
+        poll_interval: float = 1.0
+    ):
+        """
+        Initialize job service.
+
+        Args:
+            review_service: Review analysis service that does the work
+            store: Persistent job queue
+            chunk_size: Reviews analyzed per chunk (capped at the batch limit)
+            poll_interval: Seconds to wait when there is nothing to do
+        """
+        self.review_service = review_service
+        self.store = store
+        self.chunk_size = max(1, min(chunk_size, MAX_BATCH_REVIEWS))
+        self.poll_interval = poll_interval
+        self._worker: Optional[asyncio.Task] = None
+        self._warned_load_failed = False
+
+    async def create_job(self, upload: BinaryIO, fmt: str) -> JobRecord:
+        """
+        Queue an uploaded corpus as a new job.
+
+        Args:
+            upload: Binary file positioned at the start of the upload
+            fmt: "jsonl" or "csv"
+
+        Returns:
+            The new job
+
+        Raises:
+            ValidationException: If the upload cannot be parsed
+        """
+        def create() -> JobRecord:
+            return self.store.create_job(parse_upload(upload, fmt))
+
+        job = await asyncio.to_thread(create)
+        logger.info(f"Created job {job.id} with {job.total} reviews")
+        return job
+
+    async def get_status(self, job_id: str) -> Optional[JobStatusResponse]:
+        """
+        Get a job's progress, throughput and estimated time remaining.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job status, or None if the job does not exist
+        """
+        job = await asyncio.to_thread(self.store.get_job, job_id)
+        if job is None:
+            return None
+
+        throughput = None
+        eta_seconds = None
+        if job.started_at is not None:
+            elapsed = (job.finished_at or time.time()) - job.started_at
+            if elapsed > 0 and job.processed:
+                throughput = job.processed / elapsed
+                eta_seconds = (job.total - job.processed) / throughput
+
+        return JobStatusResponse(
+            id=job.id,
+            status=job.status,
+            total=job.total,
+            processed=job.processed,
+            failed=job.failed,
+            throughput=throughput,
+            eta_seconds=eta_seconds,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at
+        )
+
+    def iter_results(self, job_id: str) -> Iterator[str]:
+        """
+        Iterate over a job's finished results as NDJSON lines, in input order.
+
+        Args:
+            job_id: Job identifier
+
+        Yields:
+            One JSON line per finished review
+        """
+        for result in self.store.iter_results(job_id):
+            yield result + "\n"
+
+    def start(self) -> None:
+        """Start the background worker, resuming any unfinished jobs."""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+            logger.info("Job worker started")
+
+    async def stop(self) -> None:
+        """Stop the background worker; unfinished items stay queued."""
+        if self._worker is None:
+            return
+
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        logger.info("Job worker stopped")
+
+    async def run_once(self) -> bool:
+        """
+        Analyze the next chunk of pending reviews.
+
+        Returns:
+            True if a chunk was processed, False if the queue was empty
+            or the model is not loaded
+        """
+        # Bulk results should come from the model, not the keyword stand-in:
+        # while it loads, and if loading failed, items stay pending
+        llm_service = self.review_service.llm_service
+        if not llm_service.is_model_loaded():
+            if llm_service.load_status()["state"] == ModelLoadState.FAILED.value and not self._warned_load_failed:
+                logger.error("Model failed to load; bulk jobs stay queued until it is available")
+                self._warned_load_failed = True
+            return False
+
+        claimed = await asyncio.to_thread(self.store.claim_pending, self.chunk_size)
+        if claimed is None:
+            return False
+
+        job_id, items = claimed
+        results = await self._analyze_chunk(items)
+        await asyncio.to_thread(self.store.complete_items, job_id, results)
+        return True
+
+    async def _run(self) -> None:
+        """Worker loop: process chunks until cancelled."""
+        while True:
+            try:
+                if not await self.run_once():
+                    await asyncio.sleep(self.poll_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Items stay pending and are retried on the next pass
+                logger.error(f"Job worker failed to process a chunk: {e}")
+                await asyncio.sleep(self.poll_interval)
+
+    async def _analyze_chunk(self, items: List[JobItem]) -> List[Tuple[int, bool, str]]:
+        """
+        Analyze a chunk of reviews as one batch at bulk priority.
+
+        Args:
+            items: Pending job items
+
+        Returns:
+            (seq, succeeded, result_json) for each item
+        """
+        # Client IDs can be anything, so batch on the item position instead
+        request = BatchAnalyzeRequest(
+            reviews=[BatchReviewItem(id=str(item.seq), text=item.text) for item in items]
+        )
+        response = await self.review_service.analyze_batch(request, priority=Priority.BULK)
+
+        results = []
+        for item, result in zip(items, response.results):
+            if result.error is not None:
+                results.append(
+                    (item.seq, False, _result_json(item.review_id, error=result.error))
+                )
+            else:
+                sentences = [
+                    sentence.model_dump(exclude_none=True) for sentence in result.sentences
+                ]
+                results.append(
+                    (item.seq, True, _result_json(item.review_id, sentences=sentences))
+                )
+        return results
@@ -0,0 +1,290 @@
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS jobs (
+        id TEXT PRIMARY KEY,
+        status TEXT NOT NULL,
+        total INTEGER NOT NULL DEFAULT 0,
+        processed INTEGER NOT NULL DEFAULT 0,
+        failed INTEGER NOT NULL DEFAULT 0,
+        created_at REAL NOT NULL,
+        started_at REAL,
+        finished_at REAL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS job_items (
+        job_id TEXT NOT NULL,
+        seq INTEGER NOT NULL,
+        review_id TEXT NOT NULL,
+        text TEXT NOT NULL,
+        status TEXT NOT NULL,
+        result TEXT,
+        PRIMARY KEY (job_id, seq)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS job_items_pending ON job_items (status, job_id, seq)",
+)
+
+# Job and item states
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class JobRecord:
+    """Snapshot of a bulk job's progress."""
+
+    id: str
+    status: str
+    total: int
+    processed: int
+    failed: int
+    created_at: float
+    started_at: Optional[float]
+    finished_at: Optional[float]
+
+
+@dataclass(frozen=True)
+class JobItem:
+    """A single review waiting to be analyzed."""
+
+    seq: int
+    review_id: str
+    text: str
+
+
+class JobStore:
+    """
+    SQLite-backed persistent queue of bulk analysis jobs.
+    Items stay pending until their results are written, so work left
+    unfinished by a restart is picked up again automatically.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        """
+        Initialize job store, creating the database if needed.
+
+        Args:
+            path: SQLite database file path
+            timeout: Seconds to wait for a lock held by another connection
+        """
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        with self._connection() as conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+
+    def create_job(
+        self,
+        items: Iterable[Tuple[str, str, Optional[str]]],
+        chunk_size: int = 1000
+    ) -> JobRecord:
+        """
+        Create a job from an iterable of reviews without holding them all
+        in memory.
+
+        Args:
+            items: (review_id, text, failed_result) tuples; items that
+                already carry a result (e.g. an error entry for an
+                unparseable input line) are stored as failed
+            chunk_size: Rows inserted per statement
+
+        Returns:
+            The new job
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        conn = self._connection()
+        total = failed = 0
+
+        with conn:
+            conn.execute(
+                "INSERT INTO jobs (id, status, created_at) VALUES (?, ?, ?)",
+                (job_id, QUEUED, now)
+            )
+
+            rows: List[tuple] = []
+            for seq, (review_id, text, failed_result) in enumerate(items):
+                if failed_result is None:
+                    rows.append((job_id, seq, review_id, text, PENDING, None))
+                else:
+                    rows.append((job_id, seq, review_id, text, FAILED, failed_result))
+                    failed += 1
+                total += 1
+
+                if len(rows) >= chunk_size:
+                    self._insert_items(conn, rows)
+                    rows = []
+
+            self._insert_items(conn, rows)
+            conn.execute(
+                "UPDATE jobs SET total = ?, processed = ?, failed = ?, status = ? WHERE id = ?",
+                (total, failed, failed, COMPLETED if failed == total else QUEUED, job_id)
+            )
+
+        return self.get_job(job_id)
+
+    def get_job(self, job_id: str) -> Optional[JobRecord]:
+        """
+        Look up a job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            Job snapshot, or None if it does not exist
+        """
+        row = self._connection().execute(
+            "SELECT id, status, total, processed, failed, created_at, started_at, finished_at "
+            "FROM jobs WHERE id = ?",
+            (job_id,)
+        ).fetchone()
+        return JobRecord(*row) if row else None
+
+    def claim_pending(self, limit: int) -> Optional[Tuple[str, List[JobItem]]]:
+        """
+        Get the next pending items of the oldest unfinished job and mark
+        that job as running.
+
+        Args:
+            limit: Maximum number of items to return
+
+        Returns:
+            (job_id, items), or None if there is nothing to do
+        """
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT id FROM jobs WHERE status IN (?, ?) ORDER BY created_at LIMIT 1",
+            (QUEUED, RUNNING)
+        ).fetchone()
+        if row is None:
+            return None
+
+        job_id = row[0]
+        items = [
+            JobItem(seq, review_id, text)
+            for seq, review_id, text in conn.execute(
+                "SELECT seq, review_id, text FROM job_items "
+                "WHERE status = ? AND job_id = ? ORDER BY seq LIMIT ?",
+                (PENDING, job_id, limit)
+            )
+        ]
+
+        with conn:
+            if not items:
+                # Nothing left (e.g. finished just before a restart)
+                conn.execute(
+                    "UPDATE jobs SET status = ?, finished_at = COALESCE(finished_at, ?) "
+                    "WHERE id = ?",
+                    (COMPLETED, time.time(), job_id)
+                )
+                return None
+
+            conn.execute(
+                "UPDATE jobs SET status = ?, started_at = COALESCE(started_at, ?) "
+                "WHERE id = ?",
+                (RUNNING, time.time(), job_id)
+            )
+
+        return job_id, items
+
+    def complete_items(self, job_id: str, results: List[Tuple[int, bool, str]]) -> None:
+        """
+        Store item results and advance the job's progress counters.
+        Items that are no longer pending (already stored by another worker)
+        are left alone and not counted twice.
+
+        Args:
+            job_id: Job identifier
+            results: (seq, succeeded, result_json) tuples
+        """
+        conn = self._connection()
+        with conn:
+            counts = {}
+            for status in (DONE, FAILED):
+                cursor = conn.executemany(
+                    "UPDATE job_items SET status = ?, result = ? "
+                    "WHERE job_id = ? AND seq = ? AND status = ?",
+                    [
+                        (status, result, job_id, seq, PENDING)
+                        for seq, ok, result in results
+                        if ok == (status == DONE)
+                    ]
+                )
+                counts[status] = max(cursor.rowcount, 0)
+
+            conn.execute(
+                "UPDATE jobs SET processed = processed + ?, failed = failed + ? WHERE id = ?",
+                (counts[DONE] + counts[FAILED], counts[FAILED], job_id)
+            )
+            conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ? "
+                "WHERE id = ? AND status != ? AND processed >= total",
+                (COMPLETED, time.time(), job_id, COMPLETED)
+            )
+
+    def iter_results(self, job_id: str, page_size: int = 500) -> Iterator[str]:
+        """
+        Iterate over finished item results in input order, page by page.
+        Each page is fetched on the calling thread's own connection, so the
+        iterator may be advanced from different threads (as a streaming
+        response does from its threadpool).
+
+        Args:
+            job_id: Job identifier
+            page_size: Rows fetched per query
+
+        Yields:
+            Stored result JSON for each finished item
+        """
+        last_seq = -1
+
+        while True:
+            rows = self._connection().execute(
+                "SELECT seq, result FROM job_items "
+                "WHERE job_id = ? AND seq > ? AND status != ? ORDER BY seq LIMIT ?",
+                (job_id, last_seq, PENDING, page_size)
+            ).fetchall()
+            if not rows:
+                return
+
+            for seq, result in rows:
+                last_seq = seq
+                yield result
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _insert_items(conn: sqlite3.Connection, rows: List[tuple]) -> None:
+        """Insert a chunk of item rows."""
+        if rows:
+            conn.executemany(
+                "INSERT INTO job_items (job_id, seq, review_id, text, status, result) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
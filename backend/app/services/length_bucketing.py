@@ -0,0 +1,105 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence
+from app.core.metrics import is_recording
+
+
+class LengthBucketer:
+    """
+    Groups a batch of prompts by token length so each group is padded
+    only to its own longest row, instead of every row paying for the
+    longest prompt in the whole batch.
+    Counts how full each bucket is and how much of the padded batch is
+    padding, to tune the bucket edges on real traffic.
+    """
+
+    def __init__(self, edges: Sequence[int]):
+        """
+        Initialize length bucketer.
+
+        Args:
+            edges: Upper token-length bound of each bucket; longer prompts
+                go to a final open-ended bucket
+        """
+        self.edges = sorted(set(edges))
+
+        bucket_count = len(self.edges) + 1
+        self._batches = [0] * bucket_count
+        self._rows = [0] * bucket_count
+        self._tokens = [0] * bucket_count
+        self._slots = [0] * bucket_count
+        # Padded slots the same batches would have needed without bucketing
+        self._unbucketed_slots = 0
+        self._lock = threading.Lock()
+
+    def split(self, lengths: Sequence[int]) -> List[List[int]]:
+        """
+        Assign each prompt to a bucket and record padding statistics,
+        unless recording is paused (see metrics.recording_paused).
+
+        Args:
+            lengths: Token length of each prompt in the batch
+
+        Returns:
+            Non-empty groups of input positions, one per bucket, each
+            sorted by length
+        """
+        groups: Dict[int, List[int]] = {}
+        for position in sorted(range(len(lengths)), key=lengths.__getitem__):
+            groups.setdefault(bisect_left(self.edges, lengths[position]), []).append(position)
+
+        if is_recording():
+            self._record(groups, lengths)
+
+        return [groups[bucket] for bucket in sorted(groups)]
+
+    def _record(self, groups: Dict[int, List[int]], lengths: Sequence[int]) -> None:
+        """Add one split batch to the occupancy and padding counters."""
+        with self._lock:
+            for bucket, positions in groups.items():
+                self._batches[bucket] += 1
+                self._rows[bucket] += len(positions)
+                self._tokens[bucket] += sum(lengths[p] for p in positions)
+                # Sorted by length, so the last row is the longest
+                self._slots[bucket] += lengths[positions[-1]] * len(positions)
+            if lengths:
+                self._unbucketed_slots += max(lengths) * len(lengths)
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Get per-bucket occupancy and padding waste.
+
+        occupancy is the share of all prompts that fell into a bucket;
+        padding_waste is the share of padded token slots holding padding.
+        padding_waste_unbucketed is what the waste would have been had
+        every batch been padded as a whole.
+        """
+        with self._lock:
+            rows, tokens, slots = list(self._rows), list(self._tokens), list(self._slots)
+            batches, unbucketed_slots = list(self._batches), self._unbucketed_slots
+
+        total_rows, total_tokens, total_slots = sum(rows), sum(tokens), sum(slots)
+        bounds: List[Optional[int]] = [*self.edges, None]
+
+        return {
+            "edges": list(self.edges),
+            "sentences": total_rows,
+            "padding_waste": _waste(total_tokens, total_slots),
+            "padding_waste_unbucketed": _waste(total_tokens, unbucketed_slots),
+            "buckets": [
+                {
+                    "max_tokens": bound,
+                    "batches": batches[i],
+                    "sentences": rows[i],
+                    "occupancy": rows[i] / total_rows if total_rows else 0.0,
+                    "mean_batch_size": rows[i] / batches[i] if batches[i] else 0.0,
+                    "padding_waste": _waste(tokens[i], slots[i]),
+                }
+                for i, bound in enumerate(bounds)
+            ],
+        }
+
+
+def _waste(tokens: int, slots: int) -> float:
+    """Fraction of padded slots that hold padding rather than tokens."""
+    return 1 - tokens / slots if slots else 0.0
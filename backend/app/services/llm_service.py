@@ -1,17 +1,56 @@
-from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
-from typing import Optional
+import asyncio
+import threading
+import time
+from enum import Enum
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
 from app.core.config import Settings
 from app.core.logging import get_logger
-from app.core.exceptions import ModelNotLoadedException, AnalysisException
+from app.core.metrics import KEYWORD_FALLBACKS, recording_paused, stage_timer
+from app.core.profiling import capture_stages, current_profile
+from app.core.exceptions import (
+    ModelNotLoadedException,
+    AnalysisException,
+    ConfigurationException
+)
+from app.models.classification import Classification
 from app.models.topic import Topic
+from app.utils.keyword_matcher import KeywordMatcher
+from app.services.backends.base import InferenceBackend
+from app.services.backends.factory import create_backend
+from app.services.batch_scheduler import BatchScheduler, Priority
+from app.services.inference_executor import InferenceExecutor
+from app.services.process_pool import InferenceProcessPool
+from app.services.prompt import PROMPT_VERSION, build_prompt
+from app.services.result_cache import SentenceCache, normalize_sentence
+from app.services.runtime_tuning import (
+    ThreadBudget,
+    available_cores,
+    plan_thread_budget,
+    warm_up
+)
+from app.services.persistent_cache import PersistentSentenceCache
+from app.services.topic_router import RoutingTier, TopicRouter
 
 logger = get_logger(__name__)
 
+class ModelLoadState(str, Enum):
+    """Lifecycle of the model behind the service."""
+    
+    NOT_STARTED = "not_started"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+
+
+# Steps of load_model, reported as load progress
+LOAD_STAGES = ("loading_model", "warming_up", "starting_workers")
+
 
 class LLMService:
     """
     Service for LLM-based text analysis.
     Handles model loading, inference, and topic classification.
+    The model itself is a pluggable InferenceBackend chosen from settings.
     """
     
     def __init__(self, settings: Settings):
@@ -22,39 +61,323 @@ class LLMService:
             settings: Application settings containing model configuration
         """
         self.settings = settings
-        self.model: Optional[AutoModelForSeq2SeqLM] = None
-        self.tokenizer: Optional[AutoTokenizer] = None
+        self.backend: InferenceBackend = create_backend(settings)
         self._model_loaded = False
+        self._load_lock = threading.Lock()
+        self._load_state = ModelLoadState.NOT_STARTED
+        self._load_stage: Optional[str] = None
+        self._load_started_at: Optional[float] = None
+        self._load_finished_at: Optional[float] = None
+        self._load_error: Optional[str] = None
+        self.thread_budget: Optional[ThreadBudget] = None
+        self.warmup_latencies: Dict[str, float] = {}
+        self._keyword_matcher = KeywordMatcher(settings.topic_keywords)
+        self._router = TopicRouter(
+            enabled=settings.router_enabled,
+            min_hits=settings.router_min_keyword_hits,
+            strong_keywords=settings.router_strong_keywords
+        )
+        self._executor = InferenceExecutor(settings.inference_threads)
+        self._process_pool: Optional[InferenceProcessPool] = None
+        self._scheduler: Optional[BatchScheduler[Tuple[Classification, Dict[str, float]]]] = None
+        self._cache: Optional[SentenceCache] = None
+        
+        if settings.cache_enabled:
+            self._cache = SentenceCache(
+                max_entries=settings.cache_max_entries,
+                max_bytes=settings.cache_max_bytes,
+                ttl_seconds=settings.cache_ttl_seconds
+            )
+        
+        self._persistent_cache: Optional[PersistentSentenceCache] = None
+        if settings.persistent_cache_path:
+            self._persistent_cache = PersistentSentenceCache(
+                settings.persistent_cache_path,
+                timeout=settings.persistent_cache_timeout
+            )
+        
+        if settings.inference_mode not in ("thread", "process"):
+            raise ConfigurationException(
+                f"Unknown inference mode: {settings.inference_mode}",
+                details="Expected 'thread' or 'process'"
+            )
+        
+        if settings.classification_mode not in ("generate", "score"):
+            raise ConfigurationException(
+                f"Unknown classification mode: {settings.classification_mode}",
+                details="Expected 'generate' or 'score'"
+            )
+        
+        if settings.batching_enabled:
+            # One batch in flight per inference thread or worker process
+            concurrency = (
+                settings.process_pool_size
+                if settings.inference_mode == "process"
+                else settings.inference_threads
+            )
+            self._scheduler = BatchScheduler(
+                self._run_scheduled_batch,
+                max_batch_size=settings.batch_max_size,
+                max_wait_ms=settings.batch_max_wait_ms,
+                max_concurrent_batches=concurrency
+            )
     
     def load_model(self) -> None:
         """
-        Load the LLM model and tokenizer.
+        Load the inference backend's model.
         Idempotent - safe to call multiple times.
         
         Raises:
             ModelNotLoadedException: If model loading fails
         """
-        if self._model_loaded:
-            logger.info("Model already loaded, skipping")
-            return
+        with self._load_lock:
+            if self._model_loaded:
+                logger.info("Model already loaded, skipping")
+                return
+            
+            self._load_state = ModelLoadState.LOADING
+            self._load_started_at = time.time()
+            self._load_finished_at = None
+            self._load_error = None
+            
+            try:
+                self._load_and_prepare()
+            except Exception as e:
+                self._load_state = ModelLoadState.FAILED
+                self._load_error = str(e)
+                raise
+            finally:
+                self._load_finished_at = time.time()
+                self._load_stage = None
+            
+            self._load_state = ModelLoadState.READY
+            logger.info(
+                f"Model ready in {self._load_finished_at - self._load_started_at:.1f}s"
+            )
+    
+    async def load_model_in_background(self) -> None:
+        """
+        Load the model on a worker thread so the event loop keeps serving.
+        Failures are logged; the service keeps using keyword classification.
+        """
+        try:
+            await asyncio.to_thread(self.load_model)
+        except Exception as e:
+            logger.error(f"Background model load failed: {e}")
+            logger.warning("Application will continue with keyword-based classification")
+    
+    def _load_and_prepare(self) -> None:
+        """
+        Load the model, warm it up and start worker processes, recording
+        the current stage for load progress reporting.
         
-        logger.info(f"Loading model: {self.settings.model_name}")
+        Raises:
+            ModelNotLoadedException: If model loading fails
+        """
+        self._load_stage = "loading_model"
+        logger.info(f"Loading model: {self.settings.model_name} ({self.backend.name} backend)")
         
         try:
-            self.tokenizer = AutoTokenizer.from_pretrained(self.settings.model_name)
-            self.model = AutoModelForSeq2SeqLM.from_pretrained(self.settings.model_name)
-            self._model_loaded = True
-            logger.info("Model loaded successfully")
+            self.thread_budget = self._plan_thread_budget()
+            self.backend.configure_threads(self.thread_budget)
+            self.backend.load()
+            logger.info(f"Model loaded successfully ({self.backend.precision})")
         except Exception as e:
             logger.error(f"Failed to load model: {e}")
             raise ModelNotLoadedException(
                 f"Failed to load model {self.settings.model_name}",
                 details=str(e)
             )
+        
+        if self.settings.inference_mode == "process":
+            # Never run inference in the parent before forking: workers
+            # would inherit its thread pools and any locks they hold. Each
+            # worker warms up after the fork instead
+            self._load_stage = "starting_workers"
+            self._start_process_pool()
+        elif self.settings.model_warmup:
+            self._load_stage = "warming_up"
+            self._warm_up()
+        
+        self._model_loaded = True
+    
+    def _plan_thread_budget(self) -> ThreadBudget:
+        """
+        Derive per-unit thread counts from the usable cores, the web server
+        worker count and how many batches run in parallel per worker.
+        """
+        settings = self.settings
+        if settings.inference_mode == "process":
+            parallel_units = settings.process_pool_size
+            intra_op_threads = (
+                settings.process_pool_torch_threads or settings.torch_intra_op_threads
+            )
+        else:
+            parallel_units = settings.inference_threads
+            intra_op_threads = settings.torch_intra_op_threads
+        
+        budget = plan_thread_budget(
+            cores=available_cores(),
+            server_workers=settings.web_concurrency,
+            parallel_units=parallel_units,
+            intra_op_threads=intra_op_threads,
+            inter_op_threads=settings.torch_inter_op_threads
+        )
+        logger.info(
+            f"Thread budget: {budget.cores} core(s) / {budget.server_workers} server worker(s) "
+            f"/ {budget.parallel_units} inference unit(s) -> "
+            f"{budget.intra_op_threads} intra-op, {budget.inter_op_threads} inter-op thread(s)"
+        )
+        return budget
+    
+    def _warm_up(self) -> Dict[str, float]:
+        """
+        Run the model at representative batch sizes and sentence lengths so
+        one-off costs (kernel selection, allocator growth, lazy
+        initialization) are paid before the first request.
+        Synthetic batches are kept out of the stage metrics and length
+        bucket statistics. Failures are logged, not raised.
+        
+        Returns:
+            Latency in milliseconds per warmed-up shape
+        """
+        try:
+            with recording_paused():
+                self.warmup_latencies = warm_up(
+                    self.backend.classify,
+                    batch_sizes=self.settings.warmup_batch_sizes,
+                    sentence_words=self.settings.warmup_sentence_words
+                )
+        except Exception as e:
+            logger.warning(f"Model warm-up failed: {e}")
+        return self.warmup_latencies
+    
+    def _start_process_pool(self) -> None:
+        """
+        Fork inference workers that share the loaded model's weights.
+        Must run after the model is loaded and before any inference runs
+        in this process; the workers warm up themselves.
+        """
+        self._process_pool = InferenceProcessPool(
+            self.backend.classify,
+            size=self.settings.process_pool_size,
+            torch_threads=self.thread_budget.intra_op_threads,
+            restart_on_crash=self.settings.process_pool_restart_on_crash,
+            batch_timeout=self.settings.process_pool_batch_timeout_seconds,
+            warmup_fn=self._warm_up if self.settings.model_warmup else None,
+            startup_timeout=self.settings.process_pool_startup_timeout_seconds
+        )
+        self._process_pool.start()
+        self.warmup_latencies = self._process_pool.warmup_result or {}
     
     def is_model_loaded(self) -> bool:
         """Check if the model is loaded and ready."""
-        return self._model_loaded and self.model is not None
+        return self._model_loaded
+    
+    def is_model_loading(self) -> bool:
+        """Check if the model is being loaded right now."""
+        return self._load_state == ModelLoadState.LOADING
+    
+    def ensure_ready(self) -> None:
+        """
+        Check that requests can be answered now, by the model or, while it
+        loads, by keywords if serve_keywords_while_loading allows it.
+        Streaming endpoints call this before sending response headers.
+        
+        Raises:
+            ModelNotLoadedException: If the model is still loading and
+                keyword answers are not allowed meanwhile
+        """
+        if (
+            self.is_model_loading()
+            and not self.settings.serve_keywords_while_loading
+        ):
+            raise ModelNotLoadedException(
+                "Model is still loading, try again shortly",
+                details=f"{self.load_status()['progress']:.0%} loaded"
+            )
+    
+    def load_status(self) -> Dict[str, Any]:
+        """Get the model load state, current stage, progress and timing."""
+        state = self._load_state
+        stage = self._load_stage
+        started, finished = self._load_started_at, self._load_finished_at
+        
+        if state == ModelLoadState.READY:
+            progress = 1.0
+        elif state == ModelLoadState.LOADING and stage in LOAD_STAGES:
+            progress = LOAD_STAGES.index(stage) / len(LOAD_STAGES)
+        else:
+            progress = 0.0
+        
+        load_seconds = None
+        if started is not None:
+            load_seconds = (finished or time.time()) - started
+        
+        return {
+            "state": state.value,
+            "stage": stage,
+            "progress": progress,
+            "started_at": started,
+            "load_seconds": load_seconds,
+            "error": self._load_error,
+            "threads": (
+                {
+                    "intra_op": self.thread_budget.intra_op_threads,
+                    "inter_op": self.thread_budget.inter_op_threads,
+                }
+                if self.thread_budget is not None
+                else None
+            ),
+            "warmup_ms": self.warmup_latencies or None,
+        }
+    
+    def model_precision(self) -> str:
+        """Get the numeric precision the model runs in."""
+        return self.backend.precision
+    
+    def cache_stats(self) -> Optional[Dict[str, int]]:
+        """Get sentence cache counters, or None if caching is disabled."""
+        if self._cache is None:
+            return None
+        return self._cache.stats()
+    
+    def routing_stats(self) -> Dict[str, Any]:
+        """Get the number and fraction of sentences handled by each tier."""
+        return self._router.stats()
+    
+    def persistent_cache_stats(self) -> Optional[Dict[str, int]]:
+        """Get persistent cache counters, or None if it is not configured."""
+        if self._persistent_cache is None:
+            return None
+        return self._persistent_cache.stats()
+    
+    def queue_stats(self) -> Optional[Dict[str, int]]:
+        """Get batching queue depth and batches in flight, or None without batching."""
+        if self._scheduler is None:
+            return None
+        return {
+            "queued": self._scheduler.queue_depth(),
+            "in_flight": self._scheduler.batches_in_flight(),
+        }
+    
+    def bucket_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get token-length bucket occupancy and padding waste, or None when
+        the backend does not bucket. Worker processes keep their own
+        counters, so nothing is reported in process mode.
+        """
+        if self._process_pool is not None:
+            return None
+        return self.backend.bucket_stats()
+    
+    async def shutdown(self) -> None:
+        """Stop background batching and the inference threads or processes."""
+        if self._scheduler is not None:
+            await self._scheduler.close()
+        self._executor.shutdown(wait=False)
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
     
     async def analyze_sentence(self, text: str) -> Topic:
         """
@@ -66,39 +389,252 @@ class LLMService:
             
         Returns:
             Classified Topic
+        """
+        topics = await self.analyze_sentences([text])
+        return topics[0]
+    
+    async def analyze_sentences(self, texts: List[str]) -> List[Topic]:
+        """
+        Analyze several sentences and classify their topics.
+        
+        Args:
+            texts: Sentence texts to analyze
             
-        Raises:
-            AnalysisException: If analysis fails
+        Returns:
+            Classified Topics in the same order as the input
+        """
+        classifications = await self.classify_sentences(texts)
+        return [classification.topic for classification in classifications]
+    
+    async def classify_sentences(
+        self,
+        texts: List[str],
+        priority: Priority = Priority.INTERACTIVE
+    ) -> List[Classification]:
         """
+        Classify several sentences, including per-topic scores when available.
+        Sentences are tokenized together and classified in padded batches;
+        any sentence whose inference fails falls back to keyword detection.
+        
+        Args:
+            texts: Sentence texts to analyze
+            priority: Batching priority; bulk work yields to interactive requests
+            
+        Returns:
+            Classifications in the same order as the input
+        """
+        if not texts:
+            return []
+        
         # Try keyword-based detection first (fast fallback)
-        keyword_topic = Topic.detect_from_keywords(text)
+        with stage_timer("keyword_match"):
+            matches = [self._keyword_matcher.match(text) for text in texts]
+            keyword_topics = [Topic.from_keyword_match(match) for match in matches]
         
         # If model not loaded, use keyword detection
         if not self.is_model_loaded():
+            self.ensure_ready()
             logger.warning("Model not loaded, using keyword-based detection")
-            return keyword_topic
+            self._router.record(RoutingTier.FALLBACK, len(texts))
+            KEYWORD_FALLBACKS.labels("model_not_loaded").inc(len(texts))
+            return [Classification(topic=topic) for topic in keyword_topics]
+        
+        # Unambiguous keyword matches skip the LLM entirely
+        classifications: List[Optional[Classification]] = [
+            Classification(topic=topic) if self._router.is_confident(match) else None
+            for topic, match in zip(keyword_topics, matches)
+        ]
+        pending = [i for i, classification in enumerate(classifications) if classification is None]
+        self._router.record(RoutingTier.KEYWORD, len(texts) - len(pending))
+        
+        if not pending:
+            return classifications
         
         # Use LLM for more accurate classification
-        try:
-            topic_str = await self._run_inference(text)
-            llm_topic = Topic.from_string(topic_str)
+        results, cache_hits = await self._classify_cached(
+            [texts[i] for i in pending],
+            priority
+        )
+        self._router.record(RoutingTier.CACHE, cache_hits)
+        
+        failures = 0
+        for i, result in zip(pending, results):
+            if isinstance(result, Exception):
+                logger.error(f"LLM inference failed: {result}, falling back to keywords")
+                classifications[i] = Classification(topic=keyword_topics[i])
+                failures += 1
+            else:
+                logger.debug(f"Analyzed: '{texts[i][:50]}...' -> {result.topic.value}")
+                classifications[i] = result
+        
+        self._router.record(RoutingTier.FALLBACK, failures)
+        if failures:
+            KEYWORD_FALLBACKS.labels("inference_error").inc(failures)
+        self._router.record(RoutingTier.LLM, len(pending) - cache_hits - failures)
+        return classifications
+    
+    async def _classify_cached(
+        self,
+        texts: List[str],
+        priority: Priority = Priority.INTERACTIVE
+    ) -> Tuple[List[Union[Classification, Exception]], int]:
+        """
+        Classify sentences, serving repeats from the sentence caches.
+        The in-memory cache is checked first, then the persistent cache
+        in one bulk lookup; each distinct remaining sentence is sent to
+        the model once and successful results are stored in both.
+        
+        Args:
+            texts: Sentences to classify
+            priority: Batching priority for sentences sent to the model
             
-            logger.debug(f"Analyzed: '{text[:50]}...' -> {llm_topic.value}")
-            return llm_topic
+        Returns:
+            A Classification or the raised exception for each input sentence,
+            and how many of the sentences were served from a cache
+        """
+        if self._cache is None and self._persistent_cache is None:
+            return await self._classify_all(texts, priority), 0
+        
+        with stage_timer("cache_lookup"):
+            keys = [self._cache_key(text) for text in texts]
+            results: List[Optional[Union[Classification, Exception]]] = (
+                self._cache.get_many(keys) if self._cache is not None else [None] * len(keys)
+            )
+        
+        missing: Dict[Hashable, str] = {}
+        for key, text, result in zip(keys, texts, results):
+            if result is None:
+                missing.setdefault(key, text)
+        
+        if not missing:
+            return results, len(texts)
+        
+        resolved: Dict[Hashable, Union[Classification, Exception]] = {}
+        
+        if self._persistent_cache is not None:
+            stored = await asyncio.to_thread(self._persistent_cache.get_many, list(missing))
+            for key, value in zip(list(missing), stored):
+                if value is not None:
+                    resolved[key] = value
+                    del missing[key]
             
-        except Exception as e:
-            logger.error(f"LLM inference failed: {e}, falling back to keywords")
-            return keyword_topic
+            if resolved and self._cache is not None:
+                self._cache.put_many(resolved.items())
+        
+        if missing:
+            fresh_results = await self._classify_all(list(missing.values()), priority)
+            fresh = dict(zip(missing, fresh_results))
+            resolved.update(fresh)
+            
+            successes = [
+                (key, result) for key, result in fresh.items()
+                if not isinstance(result, Exception)
+            ]
+            if self._cache is not None:
+                self._cache.put_many(successes)
+            if self._persistent_cache is not None and successes:
+                await asyncio.to_thread(self._persistent_cache.put_many, successes)
+        
+        cache_hits = sum(
+            result is not None or (key in resolved and key not in missing)
+            for key, result in zip(keys, results)
+        )
+        
+        classified = [
+            resolved[key] if result is None else result
+            for key, result in zip(keys, results)
+        ]
+        return classified, cache_hits
+    
+    def _cache_key(self, text: str) -> Hashable:
+        """
+        Build the cache key for a sentence under the current model and prompt.
+        The classification mode is part of the prompt component, since the
+        two modes may label the same sentence differently.
+        """
+        return (
+            self.backend.cache_namespace,
+            f"{PROMPT_VERSION}:{self.settings.classification_mode}",
+            normalize_sentence(text)
+        )
+    
+    async def _classify_all(
+        self,
+        texts: List[str],
+        priority: Priority = Priority.INTERACTIVE
+    ) -> List[Union[Classification, Exception]]:
+        """
+        Classify sentences with the LLM, capturing failures per sentence.
+        
+        Args:
+            texts: Sentences to classify
+            priority: Batching priority
+            
+        Returns:
+            A Classification or the raised exception for each input sentence
+        """
+        if self._scheduler is not None:
+            outcomes = await asyncio.gather(
+                *(self._scheduler.submit(text, priority) for text in texts),
+                return_exceptions=True
+            )
+            
+            # Charge the stages of the batches that served the request to it
+            profile = current_profile()
+            if profile is not None:
+                batch_stages = {
+                    id(outcome[1]): outcome[1]
+                    for outcome in outcomes if not isinstance(outcome, BaseException)
+                }
+                for stages in batch_stages.values():
+                    profile.merge(stages)
+            
+            return [
+                outcome if isinstance(outcome, BaseException) else outcome[0]
+                for outcome in outcomes
+            ]
+        
+        results: List[Union[Classification, Exception]] = []
+        batch_size = self.settings.batch_max_size
+        
+        for start in range(0, len(texts), batch_size):
+            chunk = texts[start:start + batch_size]
+            try:
+                results.extend(await self._run_batch_inference(chunk))
+            except Exception as e:
+                results.extend([e] * len(chunk))
+        
+        return results
     
-    async def _run_inference(self, text: str) -> str:
+    async def _run_scheduled_batch(
+        self,
+        texts: List[str]
+    ) -> List[Tuple[Classification, Dict[str, float]]]:
         """
-        Run LLM inference on the text.
+        Batch handler for the micro-batching scheduler.
+        Runs inference and pairs each result with the batch's stage times,
+        so requests served by the batch can add them to their profile.
         
         Args:
-            text: Input text
+            texts: Input texts gathered from any number of requests
             
         Returns:
-            Raw model output
+            (classification, seconds per stage) in the same order as the input
+        """
+        with capture_stages() as batch_profile:
+            classifications = await self._run_batch_inference(texts)
+        return [(classification, batch_profile.stages) for classification in classifications]
+    
+    async def _run_batch_inference(self, texts: List[str]) -> List[Classification]:
+        """
+        Run LLM inference on several texts as one padded batch.
+        Used as the batch handler for the micro-batching scheduler.
+        
+        Args:
+            texts: Input texts
+            
+        Returns:
+            Classifications in the same order as the input
             
         Raises:
             AnalysisException: If inference fails
@@ -106,29 +642,11 @@ class LLMService:
         if not self.is_model_loaded():
             raise ModelNotLoadedException("Model must be loaded before inference")
         
-        # Few-shot prompting for better results
-        prompt = self._build_prompt(text)
-        
         try:
-            inputs = self.tokenizer(
-                prompt,
-                return_tensors="pt",
-                max_length=self.settings.max_tokens,
-                truncation=True
-            )
-            
-            outputs = self.model.generate(
-                **inputs,
-                max_new_tokens=self.settings.max_new_tokens
-            )
-            
-            output_text = self.tokenizer.batch_decode(
-                outputs,
-                skip_special_tokens=True
-            )[0]
-            
-            return output_text
-            
+            with stage_timer("inference"):
+                if self._process_pool is not None:
+                    return await asyncio.wrap_future(self._process_pool.submit(texts))
+                return await self._executor.run(self.backend.classify, texts)
         except Exception as e:
             raise AnalysisException(
                 "LLM inference failed",
@@ -145,15 +663,4 @@ class LLMService:
         Returns:
             Formatted prompt
         """
-        topics_list = ", ".join(Topic.all_values())
-        
-        return f"""Classify review sentences into: {topics_list}.
-
-Input: The screen is frozen.
-Topic: Performance
-Input: I was charged double.
-Topic: Billing
-Input: The button is hard to find.
-Topic: UX
-Input: {text}
-Topic:"""
+        return build_prompt(text)
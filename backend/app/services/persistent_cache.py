@@ -0,0 +1,173 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+from app.core.logging import get_logger
+from app.models.classification import Classification
+from app.models.topic import Topic
+
+logger = get_logger(__name__)
+
+# SQLite's historical limit on bound parameters per statement is 999
+_MAX_LOOKUP_BATCH = 900
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS classifications (
+    model TEXT NOT NULL,
+    prompt TEXT NOT NULL,
+    sentence TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    scores TEXT,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (model, prompt, sentence)
+) WITHOUT ROWID
+"""
+
+
+class PersistentSentenceCache:
+    """
+    On-disk cache of sentence classifications backed by SQLite in WAL mode.
+    Shared safely by every worker process on a host and kept across restarts.
+    Keys are (model name, prompt hash, normalized sentence) tuples.
+    Errors are logged and treated as cache misses so the cache can never
+    break classification.
+    """
+
+    def __init__(self, path: str, timeout: float = 5.0):
+        """
+        Initialize persistent cache, creating the database if needed.
+
+        Args:
+            path: SQLite database file path
+            timeout: Seconds to wait for a lock held by another process
+        """
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        with self._connection() as conn:
+            conn.execute(_SCHEMA)
+
+    def get_many(self, keys: List[Hashable]) -> List[Optional[Classification]]:
+        """
+        Look up every key in as few queries as possible.
+
+        Args:
+            keys: (model, prompt, sentence) tuples
+
+        Returns:
+            Cached classification or None for each key
+        """
+        found: Dict[Hashable, Classification] = {}
+
+        try:
+            conn = self._connection()
+            for (model, prompt), sentences in self._group(keys).items():
+                for start in range(0, len(sentences), _MAX_LOOKUP_BATCH):
+                    chunk = sentences[start:start + _MAX_LOOKUP_BATCH]
+                    placeholders = ", ".join("?" * len(chunk))
+                    rows = conn.execute(
+                        "SELECT sentence, topic, scores FROM classifications "
+                        f"WHERE model = ? AND prompt = ? AND sentence IN ({placeholders})",
+                        (model, prompt, *chunk)
+                    ).fetchall()
+
+                    for sentence, topic, scores in rows:
+                        found[(model, prompt, sentence)] = Classification(
+                            topic=Topic(topic),
+                            scores=json.loads(scores) if scores else None
+                        )
+        except (sqlite3.Error, ValueError) as e:
+            self._record_error("lookup", e)
+            return [None] * len(keys)
+
+        results = [found.get(key) for key in keys]
+        hits = sum(result is not None for result in results)
+
+        with self._stats_lock:
+            self.hits += hits
+            self.misses += len(keys) - hits
+
+        return results
+
+    def put_many(self, items: Iterable[Tuple[Hashable, Classification]]) -> None:
+        """
+        Store several classifications in one transaction.
+
+        Args:
+            items: ((model, prompt, sentence), classification) pairs
+        """
+        now = time.time()
+        rows = [
+            (
+                model,
+                prompt,
+                sentence,
+                value.topic.value,
+                json.dumps(value.scores) if value.scores else None,
+                now
+            )
+            for (model, prompt, sentence), value in items
+        ]
+        if not rows:
+            return
+
+        try:
+            with self._connection() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO classifications "
+                    "(model, prompt, sentence, topic, scores, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+        except sqlite3.Error as e:
+            self._record_error("write", e)
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit, miss and error counters for this process."""
+        with self._stats_lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "errors": self.errors,
+            }
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _record_error(self, operation: str, error: Exception) -> None:
+        """Count and log a failed cache operation."""
+        with self._stats_lock:
+            self.errors += 1
+        logger.warning(f"Persistent cache {operation} failed: {error}")
+
+    @staticmethod
+    def _group(keys: List[Hashable]) -> Dict[Tuple[str, str], List[str]]:
+        """Group sentences by (model, prompt) so each group is one query."""
+        groups: Dict[Tuple[str, str], List[str]] = {}
+        for model, prompt, sentence in keys:
+            groups.setdefault((model, prompt), []).append(sentence)
+        return groups
@@ -0,0 +1,441 @@
+import gc
+import itertools
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Dict, List, Optional
+from app.core.logging import get_logger
+from app.core.metrics import collecting_stages, record_stages
+from app.core.exceptions import AnalysisException, ConfigurationException
+
+logger = get_logger(__name__)
+
+InferenceFn = Callable[[List[str]], List[Any]]
+WarmupFn = Callable[[], Any]
+
+
+def prepare_for_fork() -> None:
+    """
+    Make the parent safe to fork from.
+    Caps torch at one intra-op thread, so no OpenMP thread pool exists to
+    be inherited half-locked, and turns off Hugging Face tokenizers'
+    thread pool, which deadlocks in a child forked after it was used.
+    Python's own logging locks are reset in the child by the runtime.
+    """
+    os.environ["TOKENIZERS_PARALLELISM"] = "false"
+    try:
+        import torch
+        torch.set_num_threads(1)
+    except ImportError:
+        pass
+
+
+@dataclass
+class _Worker:
+    """Bookkeeping for a single forked inference worker."""
+
+    worker_id: int
+    process: multiprocessing.Process
+    task_queue: multiprocessing.Queue
+    # Read end of the worker's own result pipe; never shared with other
+    # workers, so a worker killed mid-write cannot block the others
+    result_conn: Connection
+    pending: Dict[int, Future] = field(default_factory=dict)
+    started_at: float = field(default_factory=time.monotonic)
+    # Set once the worker has warmed up and is serving batches
+    ready: bool = False
+    # When the batch the worker is running was handed to it, if any
+    busy_since: Optional[float] = None
+    # Set when the result pipe is closed or unreadable
+    broken: bool = False
+
+
+class InferenceProcessPool:
+    """
+    Pool of forked inference worker processes.
+    Workers are forked after the model is loaded in the parent, so they
+    share its weights copy-on-write instead of loading their own copies.
+    Batches are dispatched over per-worker queues to the least busy worker
+    and results come back over per-worker pipes. A worker that dies or
+    runs a batch for longer than the batch timeout is killed, its batches
+    are failed and, if configured, it is replaced with a fresh process.
+
+    Fork safety: a forked child inherits every lock held by any parent
+    thread at the moment of the fork, without the thread that would
+    release it. The parent must therefore never run inference itself:
+    it is pinned to one torch thread and tokenizers parallelism is off
+    before every fork (see prepare_for_fork), and warm-up runs inside
+    each worker after the fork rather than in the parent. Replacement
+    workers are forked from the collector thread under the same rules.
+    As a guard against a fork that still inherits a held lock, a worker
+    must report ready within the startup timeout or it is killed, and
+    after max_failed_starts workers in a row fail to start, the pool
+    stops replacing them.
+    """
+
+    # How often the collector thread checks worker liveness (seconds)
+    poll_interval = 0.5
+
+    # Consecutive workers that may die or hang before reporting ready
+    # before restarts are given up
+    max_failed_starts = 3
+
+    def __init__(
+        self,
+        infer_fn: InferenceFn,
+        size: int,
+        torch_threads: int = 1,
+        restart_on_crash: bool = True,
+        batch_timeout: Optional[float] = None,
+        warmup_fn: Optional[WarmupFn] = None,
+        startup_timeout: Optional[float] = 300.0
+    ):
+        """
+        Initialize the process pool.
+
+        Args:
+            infer_fn: Blocking function run inside the workers; inherited
+                through fork, so it does not need to be picklable
+            size: Number of worker processes
+            torch_threads: Intra-op torch threads per worker
+            restart_on_crash: Whether to replace workers that die
+            batch_timeout: Seconds a worker may spend on one batch before it
+                is considered stuck and killed; None waits forever
+            warmup_fn: Run inside each worker after the fork, before it
+                reports ready; its result is kept as warmup_result
+            startup_timeout: Seconds a worker may take to report ready
+                before it is considered stuck and killed; None waits forever
+        """
+        if size < 1:
+            raise ConfigurationException("Process pool size must be at least 1")
+
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise ConfigurationException(
+                "Process inference mode requires the 'fork' start method",
+                details="Copy-on-write weight sharing is not available on this platform"
+            )
+
+        self._infer_fn = infer_fn
+        self.size = size
+        self.torch_threads = torch_threads
+        self.restart_on_crash = restart_on_crash
+        self.batch_timeout = batch_timeout
+        self.warmup_fn = warmup_fn
+        self.startup_timeout = startup_timeout
+        self.warmup_result: Any = None
+
+        self._ctx = multiprocessing.get_context("fork")
+        self._workers: List[_Worker] = []
+        self._task_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._collector: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._ready = threading.Condition(self._lock)
+        self._failed_starts = 0
+        self.restarts = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the pool has been started and not shut down."""
+        return self._collector is not None and not self._stopping.is_set()
+
+    def start(self) -> None:
+        """
+        Fork the worker processes, start collecting results and wait for
+        the workers to warm up (up to the startup timeout).
+        Call before the parent starts inference threads of its own.
+        """
+        if self.is_running:
+            return
+
+        self._stopping.clear()
+        self._failed_starts = 0
+
+        # Move everything allocated so far out of the GC's reach so that
+        # collections in the workers don't touch (and copy) shared pages
+        gc.freeze()
+
+        self._workers = [self._spawn_worker(i) for i in range(self.size)]
+
+        self._collector = threading.Thread(
+            target=self._collect_results,
+            name="inference-pool-collector",
+            daemon=True
+        )
+        self._collector.start()
+
+        with self._ready:
+            self._ready.wait_for(
+                lambda: all(w.ready for w in self._workers) or not self._workers,
+                timeout=self.startup_timeout
+            )
+            ready = sum(w.ready for w in self._workers)
+        if ready < self.size:
+            logger.warning(f"Only {ready} of {self.size} inference worker(s) reported ready")
+
+        logger.info(
+            f"Started inference process pool with {self.size} worker(s), "
+            f"{self.torch_threads} torch thread(s) each"
+        )
+
+    def submit(self, texts: List[str]) -> "Future[List[Any]]":
+        """
+        Dispatch a batch of sentences to the least busy worker.
+
+        Args:
+            texts: Sentences to run inference on
+
+        Returns:
+            Future resolving to the inference function's results
+
+        Raises:
+            AnalysisException: If the pool is not running
+        """
+        future: Future = Future()
+
+        with self._lock:
+            workers = [w for w in self._workers if w.process.is_alive() and not w.broken]
+            if not self.is_running or not workers:
+                raise AnalysisException("Inference process pool is not running")
+            # Workers still warming up only get batches when none is ready
+            workers = [w for w in workers if w.ready] or workers
+
+            worker = min(workers, key=lambda w: len(w.pending))
+            task_id = next(self._task_ids)
+            if not worker.pending:
+                worker.busy_since = time.monotonic()
+            worker.pending[task_id] = future
+            worker.task_queue.put((task_id, texts))
+
+        return future
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        Stop all workers and fail any outstanding batches.
+
+        Args:
+            timeout: Seconds to wait for each worker to exit
+        """
+        if self._collector is None:
+            return
+
+        self._stopping.set()
+
+        with self._lock:
+            workers, self._workers = self._workers, []
+
+        for worker in workers:
+            try:
+                worker.task_queue.put(None)
+            except (OSError, ValueError):
+                pass
+
+        for worker in workers:
+            worker.process.join(timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join(timeout)
+            self._fail_pending(worker, "Inference process pool shut down")
+
+        self._collector.join(timeout)
+        self._collector = None
+
+        for worker in workers:
+            self._close_channels(worker)
+        logger.info("Inference process pool stopped")
+
+    def _spawn_worker(self, worker_id: int) -> _Worker:
+        """Fork a single worker process with its own task queue and result pipe."""
+        prepare_for_fork()
+        task_queue = self._ctx.Queue()
+        result_conn, worker_conn = self._ctx.Pipe(duplex=False)
+        process = self._ctx.Process(
+            target=self._worker_main,
+            args=(task_queue, worker_conn),
+            name=f"inference-worker-{worker_id}",
+            daemon=True
+        )
+        process.start()
+        # Only the worker writes; closing our copy lets its death show as EOF
+        worker_conn.close()
+        return _Worker(
+            worker_id=worker_id,
+            process=process,
+            task_queue=task_queue,
+            result_conn=result_conn
+        )
+
+    def _worker_main(self, task_queue: multiprocessing.Queue, result_conn: Connection) -> None:
+        """Worker loop: run inference on batches until told to stop."""
+        # Interrupts are handled by the parent, which shuts workers down
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        try:
+            import torch
+            torch.set_num_threads(self.torch_threads)
+        except ImportError:
+            pass
+
+        warmup_result = None
+        if self.warmup_fn is not None:
+            try:
+                warmup_result = self.warmup_fn()
+            except Exception as e:
+                logger.warning(f"Inference worker warm-up failed: {e}")
+        # Task id None reports the worker ready
+        result_conn.send((None, True, warmup_result, ()))
+
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+
+            task_id, texts = task
+            # Stage timings go back with the result; this process is not scraped
+            with collecting_stages() as stages:
+                try:
+                    ok, payload = True, self._infer_fn(texts)
+                except Exception as e:
+                    ok, payload = False, str(e)
+            result_conn.send((task_id, ok, payload, stages))
+
+    def _collect_results(self) -> None:
+        """Resolve futures from worker results and watch for dead or stuck workers."""
+        while not self._stopping.is_set():
+            with self._lock:
+                by_conn = {w.result_conn: w for w in self._workers if not w.broken}
+                sentinels = [w.process.sentinel for w in self._workers]
+
+            for ready in wait([*by_conn, *sentinels], timeout=self.poll_interval):
+                worker = by_conn.get(ready)
+                if worker is None:
+                    continue
+                try:
+                    task_id, ok, payload, stages = worker.result_conn.recv()
+                except (EOFError, OSError):
+                    # The worker is gone; _check_workers replaces it
+                    worker.broken = True
+                else:
+                    record_stages(stages)
+                    self._resolve(worker, task_id, ok, payload)
+
+            self._check_workers()
+
+    def _resolve(self, worker: _Worker, task_id: Optional[int], ok: bool, payload) -> None:
+        """Complete the future belonging to a finished batch."""
+        if task_id is None:
+            with self._ready:
+                worker.ready = True
+                self._failed_starts = 0
+                if payload is not None:
+                    self.warmup_result = payload
+                self._ready.notify_all()
+            return
+
+        with self._lock:
+            future = worker.pending.pop(task_id, None)
+            # The worker moves straight on to its next queued batch
+            worker.busy_since = time.monotonic() if worker.pending else None
+
+        if future is None or future.done():
+            return
+
+        if ok:
+            future.set_result(payload)
+        else:
+            future.set_exception(
+                AnalysisException("LLM inference failed in worker", details=payload)
+            )
+
+    def _check_workers(self) -> None:
+        """Fail batches held by dead or stuck workers and restart them if configured."""
+        now = time.monotonic()
+        failed: List[tuple] = []
+
+        with self._lock:
+            if self._stopping.is_set():
+                return
+
+            workers: List[_Worker] = []
+            for worker in self._workers:
+                stuck = (
+                    self.batch_timeout is not None
+                    and worker.ready
+                    and worker.busy_since is not None
+                    and now - worker.busy_since > self.batch_timeout
+                )
+                hung = (
+                    self.startup_timeout is not None
+                    and not worker.ready
+                    and now - worker.started_at > self.startup_timeout
+                )
+                if worker.process.is_alive() and not worker.broken and not stuck and not hung:
+                    workers.append(worker)
+                    continue
+
+                if hung:
+                    logger.error(
+                        f"Inference worker {worker.worker_id} did not report ready within "
+                        f"{self.startup_timeout:g}s; killing it"
+                    )
+                    failed.append((worker, "Inference worker did not start"))
+                elif stuck:
+                    logger.error(
+                        f"Inference worker {worker.worker_id} exceeded the "
+                        f"{self.batch_timeout:g}s batch timeout; killing it"
+                    )
+                    failed.append((worker, "Inference worker timed out"))
+                else:
+                    logger.error(
+                        f"Inference worker {worker.worker_id} exited "
+                        f"with code {worker.process.exitcode}"
+                    )
+                    failed.append((worker, "Inference worker crashed"))
+
+                if worker.process.is_alive():
+                    worker.process.kill()
+                worker.process.join(1.0)
+                self._close_channels(worker)
+
+                if not worker.ready:
+                    self._failed_starts += 1
+
+                if self.restart_on_crash and self._failed_starts >= self.max_failed_starts:
+                    logger.error(
+                        f"{self._failed_starts} inference workers in a row failed to start; "
+                        f"not replacing worker {worker.worker_id}"
+                    )
+                elif self.restart_on_crash:
+                    workers.append(self._spawn_worker(worker.worker_id))
+                    self.restarts += 1
+                    logger.info(f"Restarted inference worker {worker.worker_id}")
+
+            self._workers = workers
+            # Wake start() if no worker is left to wait for
+            self._ready.notify_all()
+
+        # Resolve outside the lock: callbacks may submit the next batch
+        for worker, message in failed:
+            self._fail_pending(worker, message)
+
+    @staticmethod
+    def _fail_pending(worker: _Worker, message: str) -> None:
+        """Fail every batch still assigned to a worker."""
+        pending, worker.pending = worker.pending, {}
+        worker.busy_since = None
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(AnalysisException(message))
+
+    @staticmethod
+    def _close_channels(worker: _Worker) -> None:
+        """Release a finished worker's queue and pipe without blocking on them."""
+        worker.result_conn.close()
+        # Batches still buffered for a dead worker can never be delivered
+        worker.task_queue.cancel_join_thread()
+        worker.task_queue.close()
@@ -0,0 +1,149 @@
+import hashlib
+from typing import TYPE_CHECKING, Dict, List
+from app.models.topic import Topic
+
+if TYPE_CHECKING:
+    import torch
+
+# Few-shot prompt for topic classification; {text} is the sentence slot
+PROMPT_TEMPLATE = """Classify review sentences into: {topics}.
+
+Input: The screen is frozen.
+Topic: Performance
+Input: I was charged double.
+Topic: Billing
+Input: The button is hard to find.
+Topic: UX
+Input: {text}
+Topic:"""
+
+# Changes whenever the template or the label set changes
+PROMPT_VERSION = hashlib.sha256(
+    (PROMPT_TEMPLATE + "|" + ",".join(Topic.all_values())).encode("utf-8")
+).hexdigest()[:12]
+
+
+def build_prompt(text: str) -> str:
+    """
+    Build the few-shot prompt for a sentence.
+
+    Args:
+        text: Text to classify
+
+    Returns:
+        Formatted prompt
+    """
+    return PROMPT_TEMPLATE.format(topics=", ".join(Topic.all_values()), text=text)
+
+
+class CompiledPrompt:
+    """
+    Few-shot prompt with its fixed parts pre-tokenized.
+    Built once per tokenizer; per sentence only the sentence text is
+    tokenized and spliced between the cached prefix and suffix token IDs.
+    """
+
+    def __init__(self, tokenizer, max_tokens: int):
+        """
+        Tokenize the fixed parts of the prompt.
+
+        Args:
+            tokenizer: Hugging Face tokenizer used by the model
+            max_tokens: Maximum length of a full prompt in tokens
+        """
+        self.tokenizer = tokenizer
+        self.max_tokens = max_tokens
+
+        prefix, suffix = PROMPT_TEMPLATE.split("{text}")
+        prefix = prefix.format(topics=", ".join(Topic.all_values()))
+
+        # The space before the sentence is re-created by the tokenizer
+        # when the sentence is encoded on its own
+        self.prefix_ids = self._encode(prefix.rstrip(" "))
+        self.suffix_ids = self._encode(suffix)
+        self.head_ids, self.tail_ids = self._special_tokens()
+
+        fixed = (
+            len(self.head_ids) + len(self.prefix_ids)
+            + len(self.suffix_ids) + len(self.tail_ids)
+        )
+        self.max_text_tokens = max(max_tokens - fixed, 1)
+
+        self.pad_token_id = tokenizer.pad_token_id or 0
+        self.pad_left = getattr(tokenizer, "padding_side", "right") == "left"
+
+    def token_ids(self, texts: List[str]) -> List[List[int]]:
+        """
+        Build full prompt token IDs for each sentence.
+        Only the sentence portion is truncated to fit max_tokens.
+
+        Args:
+            texts: Sentences to classify
+
+        Returns:
+            Unpadded token ID lists, one per sentence
+        """
+        text_ids = self.tokenizer(
+            texts,
+            add_special_tokens=False,
+            truncation=True,
+            max_length=self.max_text_tokens
+        )["input_ids"]
+
+        fixed_head = self.head_ids + self.prefix_ids
+        fixed_tail = self.suffix_ids + self.tail_ids
+        return [fixed_head + ids + fixed_tail for ids in text_ids]
+
+    def encode(self, texts: List[str]) -> Dict[str, "torch.Tensor"]:
+        """
+        Build a padded model input batch for the given sentences.
+
+        Args:
+            texts: Sentences to classify
+
+        Returns:
+            Dict with input_ids and attention_mask tensors
+        """
+        return self.pad(self.token_ids(texts))
+
+    def pad(self, rows: List[List[int]]) -> Dict[str, "torch.Tensor"]:
+        """
+        Pad token ID lists into a batch using the tokenizer's padding side.
+
+        Args:
+            rows: Token ID lists
+
+        Returns:
+            Dict with input_ids and attention_mask tensors
+        """
+        # Imported here so importing the prompt does not load torch
+        import torch
+
+        width = max(len(row) for row in rows)
+        input_ids = torch.full((len(rows), width), self.pad_token_id, dtype=torch.long)
+        attention_mask = torch.zeros((len(rows), width), dtype=torch.long)
+
+        for i, row in enumerate(rows):
+            start = width - len(row) if self.pad_left else 0
+            input_ids[i, start:start + len(row)] = torch.tensor(row, dtype=torch.long)
+            attention_mask[i, start:start + len(row)] = 1
+
+        return {"input_ids": input_ids, "attention_mask": attention_mask}
+
+    def _encode(self, text: str) -> List[int]:
+        """Tokenize a fixed prompt part without special tokens."""
+        return self.tokenizer(text, add_special_tokens=False)["input_ids"]
+
+    def _special_tokens(self):
+        """
+        Find the special tokens the tokenizer wraps around a sequence
+        (e.g. T5's trailing </s>) by comparing a probe with and without them.
+        """
+        plain = self.tokenizer("probe", add_special_tokens=False)["input_ids"]
+        full = self.tokenizer("probe")["input_ids"]
+
+        for start in range(len(full) - len(plain) + 1):
+            if full[start:start + len(plain)] == plain:
+                return full[:start], full[start + len(plain):]
+
+        return [], []
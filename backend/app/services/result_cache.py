@@ -0,0 +1,174 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+from app.models.classification import Classification
+
+# Rough per-entry overhead of the key tuple, OrderedDict node and result,
+# on top of the sentence string itself
+_ENTRY_OVERHEAD_BYTES = 256
+
+
+def normalize_sentence(text: str) -> str:
+    """
+    Normalize a sentence for cache lookups.
+    Collapses whitespace and ignores case, so trivially different copies
+    of the same stock phrase share an entry.
+
+    Args:
+        text: Sentence text
+
+    Returns:
+        Normalized sentence
+    """
+    return " ".join(text.split()).casefold()
+
+
+@dataclass
+class _Entry:
+    """A cached classification with its size and expiry time."""
+
+    value: Classification
+    size: int
+    expires_at: Optional[float]
+
+
+class SentenceCache:
+    """
+    Bounded in-memory LRU cache of sentence classifications.
+    Supports an entry limit, an optional byte budget and an optional TTL.
+    Thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None
+    ):
+        """
+        Initialize sentence cache.
+
+        Args:
+            max_entries: Maximum number of cached sentences
+            max_bytes: Optional approximate memory budget in bytes
+            ttl_seconds: Optional lifetime of an entry in seconds
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(self, keys: List[Hashable]) -> List[Optional[Classification]]:
+        """
+        Look up several keys at once.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached classification or None for each key
+        """
+        now = time.monotonic()
+        results: List[Optional[Classification]] = []
+
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+
+                if entry is not None and entry.expires_at is not None and entry.expires_at <= now:
+                    self._remove(key)
+                    self.expirations += 1
+                    entry = None
+
+                if entry is None:
+                    self.misses += 1
+                    results.append(None)
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    results.append(entry.value)
+
+        return results
+
+    def put_many(self, items: Iterable[Tuple[Hashable, Classification]]) -> None:
+        """
+        Store several classifications, evicting least recently used entries
+        once the entry limit or byte budget is exceeded.
+
+        Args:
+            items: (key, classification) pairs
+        """
+        expires_at = (
+            time.monotonic() + self.ttl_seconds
+            if self.ttl_seconds is not None
+            else None
+        )
+
+        with self._lock:
+            for key, value in items:
+                if key in self._entries:
+                    self._remove(key)
+
+                size = self._estimate_size(key)
+                self._entries[key] = _Entry(value=value, size=size, expires_at=expires_at)
+                self._bytes += size
+
+            while self._entries and self._over_budget():
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit, miss, eviction and size counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def _over_budget(self) -> bool:
+        """Check whether the cache exceeds its entry or byte limit."""
+        if len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self._bytes > self.max_bytes
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry and release its bytes. Caller holds the lock."""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    @staticmethod
+    def _estimate_size(key: Hashable) -> int:
+        """
+        Approximate the memory held by an entry.
+        Only the sentence (last key part) is counted; model name and prompt
+        version strings are shared between entries.
+        """
+        sentence = key[-1] if isinstance(key, tuple) else key
+        return _ENTRY_OVERHEAD_BYTES + sys.getsizeof(sentence)
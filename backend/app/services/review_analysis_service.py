@@ -1,10 +1,24 @@
-from typing import List
+import asyncio
+from collections import Counter, deque
+from typing import AsyncIterable, AsyncIterator, Deque, Dict, List, Tuple, Union
+from app.models.classification import Classification
 from app.models.sentence import Sentence
 from app.models.topic import Topic
-from app.schemas.analyze import AnalyzeRequest, AnalyzeResponse, SentenceResult
+from app.schemas.analyze import (
+    AnalysisSummary,
+    AnalyzeRequest,
+    AnalyzeResponse,
+    BatchAnalyzeRequest,
+    BatchAnalyzeResponse,
+    BatchReviewResult,
+    MAX_REVIEW_LENGTH,
+    SentenceResult
+)
+from app.services.batch_scheduler import Priority
 from app.services.llm_service import LLMService
-from app.utils.text_processing import split_into_sentences
+from app.utils.text_processing import IncrementalSplitter, SentenceSpan, sentence_spans
 from app.core.logging import get_logger
+from app.core.metrics import SENTENCES_PER_REQUEST, stage_timer
 
 logger = get_logger(__name__)
 
@@ -37,54 +51,320 @@ class ReviewAnalysisService:
         logger.info(f"Analyzing review with {len(request.text)} characters")
         
         # Step 1: Split into sentences
-        sentence_texts = split_into_sentences(request.text)
-        logger.debug(f"Split into {len(sentence_texts)} sentences")
+        with stage_timer("split"):
+            spans = sentence_spans(request.text)
+        logger.debug(f"Split into {len(spans)} sentences")
+        SENTENCES_PER_REQUEST.labels("analyze").observe(len(spans))
         
         # Step 2: Analyze each sentence
-        sentences = await self._analyze_sentences(sentence_texts)
+        sentences = await self._analyze_sentences(request.text, spans)
         
         # Step 3: Convert to response schema
-        response = self._build_response(sentences)
+        with stage_timer("response_build"):
+            response = self._build_response(sentences, include_scores=request.include_scores)
         
         logger.info(f"Analysis complete: {len(response.sentences)} sentences classified")
         return response
     
-    async def _analyze_sentences(self, sentence_texts: List[str]) -> List[Sentence]:
+    async def stream_review(
+        self,
+        request: AnalyzeRequest
+    ) -> AsyncIterator[Union[SentenceResult, AnalysisSummary]]:
+        """
+        Analyze a customer review, yielding each sentence as soon as its
+        topic is known, followed by a summary.
+        Sentences may arrive out of order; each carries its index.
+        
+        Args:
+            request: Analysis request containing review text
+            
+        Yields:
+            A SentenceResult per sentence, then an AnalysisSummary
+        """
+        logger.info(f"Streaming analysis of review with {len(request.text)} characters")
+        
+        with stage_timer("split"):
+            spans = sentence_spans(request.text)
+        sentence_texts = [request.text[start:end] for start, end in spans]
+        SENTENCES_PER_REQUEST.labels("stream").observe(len(spans))
+        
+        # One task per sentence: keyword and cache hits finish immediately,
+        # the rest are batched together by the LLM service's scheduler
+        tasks = {
+            asyncio.ensure_future(self.llm_service.classify_sentences([text])): index
+            for index, text in enumerate(sentence_texts)
+        }
+        topic_counts: Counter = Counter()
+        
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=tasks.__getitem__):
+                    index = tasks[task]
+                    classification = task.result()[0]
+                    sentence = Sentence(
+                        index=index,
+                        text=sentence_texts[index],
+                        topic=classification.topic,
+                        start=spans[index][0],
+                        end=spans[index][1],
+                        scores=classification.scores
+                    )
+                    topic_counts[sentence.topic_name] += 1
+                    yield self._to_result(sentence, include_scores=request.include_scores)
+        finally:
+            # Client went away or something failed: stop outstanding work
+            for task in tasks:
+                task.cancel()
+        
+        logger.info(f"Streaming analysis complete: {len(sentence_texts)} sentences classified")
+        yield AnalysisSummary(
+            total_sentences=len(sentence_texts),
+            topic_counts=dict(topic_counts)
+        )
+    
+    async def analyze_document(
+        self,
+        chunks: AsyncIterable[str],
+        include_scores: bool = False,
+        batch_size: int = 32,
+        max_in_flight: int = 2,
+        max_sentence_chars: int = 2000
+    ) -> AsyncIterator[Union[SentenceResult, AnalysisSummary]]:
+        """
+        Analyze a document of any length, read as a stream of text chunks.
+        Sentences are split incrementally and classified in batches of
+        batch_size, with at most max_in_flight batches outstanding, so
+        memory stays flat with input size. Sentences are yielded in order
+        with indices and offsets relative to the whole document.
+        
+        Args:
+            chunks: The document's text, in pieces
+            include_scores: Whether to attach per-topic scores
+            batch_size: Sentences classified together
+            max_in_flight: Batches classified concurrently while reading on
+            max_sentence_chars: Longer runs without punctuation are cut
+            
+        Yields:
+            A SentenceResult per sentence, then an AnalysisSummary
+        """
+        splitter = IncrementalSplitter(max_sentence_chars)
+        in_flight: Deque[Tuple[asyncio.Future, List[Tuple[SentenceSpan, str]]]] = deque()
+        pending: List[Tuple[SentenceSpan, str]] = []
+        topic_counts: Counter = Counter()
+        total = 0
+        
+        def submit(batch: List[Tuple[SentenceSpan, str]]) -> None:
+            texts = [text for _, text in batch]
+            in_flight.append((
+                asyncio.ensure_future(self.llm_service.classify_sentences(texts)),
+                batch
+            ))
+        
+        async def drain(keep: int) -> AsyncIterator[SentenceResult]:
+            nonlocal total
+            while len(in_flight) > keep:
+                task, batch = in_flight.popleft()
+                for ((start, end), text), classification in zip(batch, await task):
+                    sentence = Sentence(
+                        index=total,
+                        text=text,
+                        topic=classification.topic,
+                        start=start,
+                        end=end,
+                        scores=classification.scores
+                    )
+                    total += 1
+                    topic_counts[sentence.topic_name] += 1
+                    yield self._to_result(sentence, include_scores=include_scores)
+        
+        try:
+            async for chunk in chunks:
+                with stage_timer("split"):
+                    pending.extend(splitter.feed(chunk))
+                while len(pending) >= batch_size:
+                    submit(pending[:batch_size])
+                    del pending[:batch_size]
+                    async for result in drain(max_in_flight):
+                        yield result
+            
+            with stage_timer("split"):
+                pending.extend(splitter.close())
+            if pending:
+                submit(pending)
+            async for result in drain(0):
+                yield result
+        finally:
+            # Client went away or something failed: stop outstanding work
+            for task, _ in in_flight:
+                task.cancel()
+        
+        logger.info(f"Document analysis complete: {total} sentences classified")
+        SENTENCES_PER_REQUEST.labels("document").observe(total)
+        yield AnalysisSummary(total_sentences=total, topic_counts=dict(topic_counts))
+    
+    async def analyze_batch(
+        self,
+        request: BatchAnalyzeRequest,
+        priority: Priority = Priority.INTERACTIVE
+    ) -> BatchAnalyzeResponse:
+        """
+        Analyze many reviews in one pass.
+        Sentences are deduplicated across the whole batch and the unique
+        set is classified together; a review that cannot be analyzed gets
+        an error entry instead of failing the batch.
+        
+        Args:
+            request: Batch request containing the reviews
+            priority: Batching priority; bulk jobs pass Priority.BULK
+            
+        Returns:
+            Per-review results in request order
+        """
+        logger.info(f"Analyzing batch of {len(request.reviews)} reviews")
+        
+        # Step 1: Validate and split every review
+        split_reviews: Dict[int, List[SentenceSpan]] = {}
+        errors: Dict[int, str] = {}
+        
+        with stage_timer("split"):
+            for position, review in enumerate(request.reviews):
+                if not review.text.strip():
+                    errors[position] = "Text cannot be empty or whitespace only"
+                elif len(review.text) > MAX_REVIEW_LENGTH:
+                    errors[position] = f"Text exceeds {MAX_REVIEW_LENGTH} characters"
+                else:
+                    split_reviews[position] = sentence_spans(review.text)
+        
+        # Step 2: Classify each distinct sentence once
+        unique_texts = list(dict.fromkeys(
+            request.reviews[position].text[start:end]
+            for position, spans in split_reviews.items()
+            for start, end in spans
+        ))
+        total_sentences = sum(len(spans) for spans in split_reviews.values())
+        logger.debug(f"Batch has {total_sentences} sentences, {len(unique_texts)} unique")
+        SENTENCES_PER_REQUEST.labels("batch").observe(total_sentences)
+        
+        classifications = await self.llm_service.classify_sentences(unique_texts, priority)
+        by_text: Dict[str, Classification] = dict(zip(unique_texts, classifications))
+        
+        # Step 3: Reassemble per-review responses
+        results: List[BatchReviewResult] = []
+        with stage_timer("response_build"):
+            for position, review in enumerate(request.reviews):
+                if position in errors:
+                    results.append(BatchReviewResult(id=review.id, error=errors[position]))
+                    continue
+                
+                spans = split_reviews[position]
+                sentences = self._to_sentences(
+                    review.text,
+                    spans,
+                    [by_text[review.text[start:end]] for start, end in spans]
+                )
+                response = self._build_response(sentences, include_scores=request.include_scores)
+                results.append(BatchReviewResult(id=review.id, sentences=response.sentences))
+        
+        logger.info(
+            f"Batch analysis complete: {total_sentences} sentences, "
+            f"{len(unique_texts)} unique, {len(errors)} failed reviews"
+        )
+        return BatchAnalyzeResponse(
+            results=results,
+            total_sentences=total_sentences,
+            unique_sentences=len(unique_texts)
+        )
+    
+    async def _analyze_sentences(
+        self,
+        text: str,
+        spans: List[SentenceSpan]
+    ) -> List[Sentence]:
         """
         Analyze multiple sentences and classify their topics.
         
         Args:
-            sentence_texts: List of sentence strings
+            text: Review text the sentences come from
+            spans: (start, end) offsets of each sentence in the text
             
         Returns:
             List of Sentence domain entities
         """
-        sentences: List[Sentence] = []
-        
-        for index, text in enumerate(sentence_texts):
-            topic = await self.llm_service.analyze_sentence(text)
-            sentence = Sentence(index=index, text=text, topic=topic)
-            sentences.append(sentence)
+        sentence_texts = [text[start:end] for start, end in spans]
+        classifications = await self.llm_service.classify_sentences(sentence_texts)
+        return self._to_sentences(text, spans, classifications)
+    
+    def _to_sentences(
+        self,
+        text: str,
+        spans: List[SentenceSpan],
+        classifications: List[Classification]
+    ) -> List[Sentence]:
+        """
+        Pair sentence spans with their classifications.
         
-        return sentences
+        Args:
+            text: Review text the sentences come from
+            spans: (start, end) offsets of each sentence in the text
+            classifications: Classification for each sentence
+            
+        Returns:
+            List of Sentence domain entities
+        """
+        return [
+            Sentence(
+                index=index,
+                text=text[start:end],
+                topic=classification.topic,
+                start=start,
+                end=end,
+                scores=classification.scores
+            )
+            for index, ((start, end), classification) in enumerate(
+                zip(spans, classifications)
+            )
+        ]
     
-    def _build_response(self, sentences: List[Sentence]) -> AnalyzeResponse:
+    def _build_response(
+        self,
+        sentences: List[Sentence],
+        include_scores: bool = False
+    ) -> AnalyzeResponse:
         """
         Convert domain entities to API response schema.
         
         Args:
             sentences: List of Sentence domain entities
+            include_scores: Whether to attach per-topic scores
             
         Returns:
             AnalyzeResponse schema
         """
         sentence_results = [
-            SentenceResult(
-                index=sentence.index,
-                text=sentence.text,
-                topic=sentence.topic_name
-            )
+            self._to_result(sentence, include_scores=include_scores)
             for sentence in sentences
         ]
         
         return AnalyzeResponse(sentences=sentence_results)
+    
+    def _to_result(self, sentence: Sentence, include_scores: bool = False) -> SentenceResult:
+        """
+        Convert a domain entity to its response schema.
+        
+        Args:
+            sentence: Sentence domain entity
+            include_scores: Whether to attach per-topic scores
+            
+        Returns:
+            SentenceResult schema
+        """
+        return SentenceResult(
+            index=sentence.index,
+            text=sentence.text,
+            topic=sentence.topic_name,
+            start=sentence.start,
+            end=sentence.end,
+            scores=sentence.scores if include_scores else None
+        )
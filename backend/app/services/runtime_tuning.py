@@ -0,0 +1,130 @@
+import os
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Words used to build synthetic warm-up sentences of a given length
+_WARMUP_WORDS = (
+    "the app keeps crashing after the last update and I was charged twice "
+    "this month while support never answered my emails about the refund"
+).split()
+
+
+@dataclass(frozen=True)
+class ThreadBudget:
+    """Threads each inference unit may use without oversubscribing the host."""
+
+    cores: int
+    server_workers: int
+    parallel_units: int
+    intra_op_threads: int
+    inter_op_threads: int
+
+
+def available_cores() -> int:
+    """
+    Count the cores this process may actually use, honouring CPU affinity
+    and a cgroup v2 CPU quota (as set by container limits).
+
+    Returns:
+        Number of usable cores, at least 1
+    """
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cores = os.cpu_count() or 1
+
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cores = min(cores, max(1, int(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+
+    return max(1, cores)
+
+
+def plan_thread_budget(
+    cores: int,
+    server_workers: int,
+    parallel_units: int,
+    intra_op_threads: Optional[int] = None,
+    inter_op_threads: Optional[int] = None
+) -> ThreadBudget:
+    """
+    Split the cores between server worker processes and, within each, the
+    inference threads or processes that run batches in parallel.
+
+    Args:
+        cores: Usable cores on the host
+        server_workers: Web server worker processes sharing the host
+        parallel_units: Batches run at once per server worker (inference
+            threads, or worker processes in process mode)
+        intra_op_threads: Explicit intra-op thread count, if configured
+        inter_op_threads: Explicit inter-op thread count, if configured
+
+    Returns:
+        Thread budget for each inference unit
+    """
+    server_workers = max(1, server_workers)
+    parallel_units = max(1, parallel_units)
+    per_unit = max(1, cores // (server_workers * parallel_units))
+
+    return ThreadBudget(
+        cores=cores,
+        server_workers=server_workers,
+        parallel_units=parallel_units,
+        intra_op_threads=intra_op_threads or per_unit,
+        # Batches are already run in parallel by the units themselves
+        inter_op_threads=inter_op_threads or 1
+    )
+
+
+def set_thread_env(budget: ThreadBudget) -> None:
+    """
+    Set OpenMP/MKL thread defaults for libraries not imported yet.
+    Variables already set in the environment win.
+
+    Args:
+        budget: Thread budget to apply
+    """
+    for name in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ.setdefault(name, str(budget.intra_op_threads))
+
+
+def warm_up(
+    classify: Callable[[List[str]], object],
+    batch_sizes: Sequence[int],
+    sentence_words: Sequence[int]
+) -> Dict[str, float]:
+    """
+    Run one pass per (batch size, sentence length) shape so kernel
+    selection and buffer allocation for realistic shapes happen before
+    the first request rather than during it.
+
+    Args:
+        classify: Blocking batch classification function
+        batch_sizes: Batch sizes to warm up
+        sentence_words: Sentence lengths, in words, to warm up
+
+    Returns:
+        Latency in milliseconds per shape, keyed "<batch>x<words>w"
+    """
+    latencies: Dict[str, float] = {}
+
+    for words in sentence_words:
+        sentence = " ".join(_WARMUP_WORDS[i % len(_WARMUP_WORDS)] for i in range(words)) + "."
+        for batch_size in batch_sizes:
+            started = time.perf_counter()
+            classify([sentence] * batch_size)
+            latencies[f"{batch_size}x{words}w"] = (time.perf_counter() - started) * 1000
+
+    logger.info(
+        "Warm-up latencies: "
+        + ", ".join(f"{shape} {ms:.0f} ms" for shape, ms in latencies.items())
+    )
+    return latencies
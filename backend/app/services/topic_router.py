@@ -0,0 +1,92 @@
+import threading
+from enum import Enum
+from typing import Dict, Iterable
+from app.utils.keyword_matcher import KeywordMatch
+
+
+class RoutingTier(str, Enum):
+    """Where a sentence's topic came from."""
+
+    KEYWORD = "keyword"
+    CACHE = "cache"
+    LLM = "llm"
+    FALLBACK = "fallback"
+
+
+class TopicRouter:
+    """
+    Confidence-gated router in front of LLM inference.
+    Sends a sentence straight to the keyword tier when its keyword signal
+    is unambiguous, and counts how many sentences each tier handles.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        min_hits: int,
+        strong_keywords: Iterable[str]
+    ):
+        """
+        Initialize topic router.
+
+        Args:
+            enabled: Whether confident keyword matches may skip the LLM
+            min_hits: Distinct keywords needed to trust a single matched topic
+            strong_keywords: Keywords that are trusted on a single hit
+        """
+        self.enabled = enabled
+        self.min_hits = min_hits
+        self.strong_keywords = frozenset(keyword.lower() for keyword in strong_keywords)
+
+        self._counts: Dict[RoutingTier, int] = {tier: 0 for tier in RoutingTier}
+        self._lock = threading.Lock()
+
+    def is_confident(self, match: KeywordMatch) -> bool:
+        """
+        Decide whether a keyword match is unambiguous enough to skip the LLM.
+        Requires exactly one matched topic, backed either by enough distinct
+        keywords or by a strong keyword. A keyword repeated in the sentence
+        (e.g. "help ... helpful") counts once.
+
+        Args:
+            match: Keyword matcher result for the sentence
+
+        Returns:
+            True if the keyword topic can be used as-is
+        """
+        if not self.enabled or len(match.counts) != 1:
+            return False
+
+        keywords = set(match.keywords)
+        if len(keywords) >= self.min_hits:
+            return True
+
+        return not keywords.isdisjoint(self.strong_keywords)
+
+    def record(self, tier: RoutingTier, count: int = 1) -> None:
+        """
+        Count sentences handled by a tier.
+
+        Args:
+            tier: Tier that produced the topic
+            count: Number of sentences
+        """
+        if count <= 0:
+            return
+        with self._lock:
+            self._counts[tier] += count
+
+    def stats(self) -> Dict[str, object]:
+        """Get per-tier sentence counts and the fraction handled by each tier."""
+        with self._lock:
+            counts = {tier.value: count for tier, count in self._counts.items()}
+
+        total = sum(counts.values())
+        return {
+            "total": total,
+            "counts": counts,
+            "fractions": {
+                tier: (count / total if total else 0.0)
+                for tier, count in counts.items()
+            },
+        }
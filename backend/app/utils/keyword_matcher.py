@@ -0,0 +1,113 @@
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+# Default keyword tables, in priority order: when several topics match,
+# the first one listed wins. These only seed Settings.topic_keywords;
+# build matchers from the settings (see get_keyword_matcher)
+DEFAULT_TOPIC_KEYWORDS: Dict[str, List[str]] = {
+    "Performance": ["crash", "slow", "lag", "freeze", "hang", "performance"],
+    "Billing": ["bill", "charg", "refund", "payment", "price", "cost"],
+    "Support": ["support", "help", "service", "assist", "response"],
+    "Account": ["login", "password", "sign in", "account", "auth"],
+    "UX": ["button", "ui", "interface", "design", "confusing", "hard to find"],
+}
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    """Keyword hits found in a piece of text."""
+
+    topic: Optional[str]
+    counts: Dict[str, int] = field(default_factory=dict)
+    keywords: Tuple[str, ...] = ()
+
+    @property
+    def matched_topics(self) -> List[str]:
+        """Topics with at least one hit, in priority order."""
+        return list(self.counts)
+
+
+class KeywordMatcher:
+    """
+    Multi-pattern keyword matcher.
+    Compiles all keywords into one regular expression so the text is
+    scanned once, however many keywords there are. Keywords match as
+    case-insensitive substrings, like a plain `keyword in text` check.
+    """
+
+    def __init__(self, table: Mapping[str, Sequence[str]]):
+        """
+        Compile the keyword table.
+
+        Args:
+            table: Topic label to keywords, in priority order
+        """
+        self.priority: Dict[str, int] = {}
+        self._topic_of: Dict[str, str] = {}
+
+        for rank, (topic, keywords) in enumerate(table.items()):
+            self.priority[topic] = rank
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if keyword:
+                    self._topic_of.setdefault(keyword, topic)
+
+        # At each position the regex reports only the longest keyword, so
+        # remember which shorter keywords are prefixes of it and hit too
+        self._implied: Dict[str, Tuple[str, ...]] = {
+            keyword: tuple(k for k in self._topic_of if keyword.startswith(k))
+            for keyword in self._topic_of
+        }
+
+        alternatives = sorted(self._topic_of, key=len, reverse=True)
+        self._pattern: Optional[re.Pattern] = (
+            re.compile("(?=(" + "|".join(map(re.escape, alternatives)) + "))")
+            if alternatives
+            else None
+        )
+
+    def match(self, text: str) -> KeywordMatch:
+        """
+        Find every keyword hit in a single pass.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Winning topic (or None), per-topic hit counts and matched keywords
+        """
+        if self._pattern is None:
+            return KeywordMatch(topic=None)
+
+        counts: Dict[str, int] = {}
+        keywords: List[str] = []
+
+        for found in self._pattern.finditer(text.lower()):
+            for keyword in self._implied[found.group(1)]:
+                topic = self._topic_of[keyword]
+                counts[topic] = counts.get(topic, 0) + 1
+                keywords.append(keyword)
+
+        if not counts:
+            return KeywordMatch(topic=None)
+
+        ordered = dict(sorted(counts.items(), key=lambda item: self.priority[item[0]]))
+        return KeywordMatch(
+            topic=next(iter(ordered)),
+            counts=ordered,
+            keywords=tuple(keywords)
+        )
+
+    def detect(self, text: str) -> Optional[str]:
+        """
+        Get the highest-priority topic with a keyword hit.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Topic label, or None if no keyword matched
+        """
+        return self.match(text).topic
+
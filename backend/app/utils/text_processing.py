@@ -1,24 +1,220 @@
 import re
-from typing import List
+from typing import Iterator, List, Tuple
+
+# (start, end) character offsets of a sentence in the original text
+SentenceSpan = Tuple[int, int]
+
+# Abbreviations that never end a sentence (they precede a name or an example)
+NON_TERMINAL_ABBREVIATIONS = frozenset({
+    "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "mt",
+    "e.g", "i.e", "vs", "cf", "approx", "fig",
+})
+
+# Abbreviations that end a sentence only when a capitalized word follows
+AMBIGUOUS_ABBREVIATIONS = frozenset({"etc", "inc", "ltd", "co", "corp", "al"})
+
+# Abbreviations that never end a sentence when a number follows ("No. 5")
+NUMBER_ABBREVIATIONS = frozenset({"no", "nos"})
+
+# Candidate boundaries, with the whitespace after them: a line break, or
+# a run of terminators (plus closing quotes or brackets) followed by
+# whitespace or the end of the text. The pattern starts with a single
+# character class so the regex engine can skip ahead to candidates with
+# a fast character scan instead of trying every alternative everywhere.
+_CANDIDATE = re.compile(r"""[.!?…\n](?:(?<=\n)\s*|[.!?…]*["'”’)\]]*(?:\s+|$))""")
+_NON_SPACE = re.compile(r"\S")
+_OPENING_PUNCTUATION = "\"'(“‘["
+
+
+def iter_sentence_spans(text: str) -> Iterator[SentenceSpan]:
+    """
+    Scan text once and yield the span of each sentence.
+    Sentences end at . ! ? or an ellipsis followed by whitespace, or at a
+    line break. Decimals ("3.5"), abbreviations ("Mr.", "e.g.", "No. 5")
+    and mid-sentence ellipses ("it was... fine") do not end a sentence.
+    Spans exclude surrounding whitespace.
+
+    Args:
+        text: Input text to split
+
+    Yields:
+        (start, end) offsets such that text[start:end] is a sentence
+    """
+    start = _skip_space(text, 0)
+
+    for match in _CANDIDATE.finditer(text):
+        position, next_start = match.span()
+        terminator = text[position]
+
+        if terminator == "\n":
+            end = _trim_end(text, start, position)
+        elif terminator in "!?" or _ends_sentence(text, start, position, next_start):
+            end = position + len(match.group().rstrip())
+        else:
+            # Not a boundary, unless the whitespace after it breaks the line
+            newline = text.find("\n", position, next_start)
+            if newline < 0:
+                continue
+            end = _trim_end(text, start, newline)
+
+        if end > start:
+            yield start, end
+        start = next_start
+
+    end = _trim_end(text, start, len(text))
+    if end > start:
+        yield start, end
+
+
+def sentence_spans(text: str) -> List[SentenceSpan]:
+    """
+    Get the span of every sentence in the text.
+
+    Args:
+        text: Input text to split
+
+    Returns:
+        List of (start, end) offsets
+    """
+    return list(iter_sentence_spans(text))
 
 
 def split_into_sentences(text: str) -> List[str]:
     """
     Split text into sentences using punctuation rules.
-    
+
     Args:
         text: Input text to split
-        
+
     Returns:
         List of sentence strings
-        
+
     Examples:
         >>> split_into_sentences("Hello world. How are you?")
         ['Hello world.', 'How are you?']
+        >>> split_into_sentences("Mr. Smith paid $4.99 for it... twice!")
+        ['Mr. Smith paid $4.99 for it... twice!']
     """
-    # Split after . ! ? followed by whitespace
-    # Pattern: (?<=[.!?])\s+
-    sentences = re.split(r'(?<=[.!?])\s+', text)
-    
-    # Filter out empty strings and strip whitespace
-    return [s.strip() for s in sentences if s.strip()]
+    return [text[start:end] for start, end in iter_sentence_spans(text)]
+
+
+class IncrementalSplitter:
+    """
+    Split text that arrives in chunks, yielding each sentence as soon as
+    the text after it proves it complete.
+    Only the unfinished tail is buffered, so memory stays flat however
+    long the input is; a tail longer than max_sentence_chars (a "sentence"
+    with no punctuation) is cut at its last whitespace.
+    Offsets are global: they index into the concatenation of all chunks.
+    """
+
+    def __init__(self, max_sentence_chars: int = 2000):
+        """
+        Initialize incremental splitter.
+
+        Args:
+            max_sentence_chars: Longest sentence kept whole
+        """
+        self.max_sentence_chars = max_sentence_chars
+        self._buffer = ""
+        # Global offset of the first buffered character
+        self._offset = 0
+
+    def feed(self, chunk: str) -> List[Tuple[SentenceSpan, str]]:
+        """
+        Add a chunk of text.
+
+        Args:
+            chunk: Next piece of the text
+
+        Returns:
+            ((start, end), sentence) for every sentence completed by the chunk
+        """
+        self._buffer += chunk
+        spans = sentence_spans(self._buffer)
+        # The last sentence may continue in the next chunk
+        complete, tail = spans[:-1], spans[-1:]
+
+        while tail and tail[0][1] - tail[0][0] > self.max_sentence_chars:
+            start, end = tail[0]
+            cut = self._buffer.rfind(" ", start + 1, start + self.max_sentence_chars)
+            cut = cut if cut > start else start + self.max_sentence_chars
+            complete.append((start, _trim_end(self._buffer, start, cut)))
+            tail = [(_skip_space(self._buffer, cut), end)]
+
+        sentences = [self._emit(start, end) for start, end in complete]
+        keep = tail[0][0] if tail else len(self._buffer)
+        self._buffer = self._buffer[keep:]
+        self._offset += keep
+        return sentences
+
+    def close(self) -> List[Tuple[SentenceSpan, str]]:
+        """
+        Signal the end of the text.
+
+        Returns:
+            ((start, end), sentence) for the remaining sentences
+        """
+        sentences = [self._emit(start, end) for start, end in sentence_spans(self._buffer)]
+        self._offset += len(self._buffer)
+        self._buffer = ""
+        return sentences
+
+    def _emit(self, start: int, end: int) -> Tuple[SentenceSpan, str]:
+        """Globalize a buffer span and pair it with its text."""
+        return (self._offset + start, self._offset + end), self._buffer[start:end]
+
+
+def _ends_sentence(text: str, start: int, position: int, next_start: int) -> bool:
+    """
+    Decide whether the terminators at position really end the sentence.
+    next_start is where the following text begins, after the whitespace.
+    """
+    terminator = text[position]
+    follower = text[position + 1:position + 2]
+    more_terminators = bool(follower) and follower in ".!?…"
+
+    if (terminator == "." and follower == ".") or (terminator == "…" and not more_terminators):
+        # Ellipsis: a pause unless a new sentence visibly starts
+        return _next_is_capitalized(text, next_start)
+
+    if terminator != "." or more_terminators:
+        return True
+
+    # A single period: look at the word it is attached to
+    word_start = max(text.rfind(" ", start, position) + 1, start)
+    word = text[word_start:position]
+    if not word.isprintable():
+        # Separated by other whitespace, such as a tab
+        word_start = position
+        while word_start > start and not text[word_start - 1].isspace():
+            word_start -= 1
+        word = text[word_start:position]
+    word = word.lstrip(_OPENING_PUNCTUATION).lower()
+
+    if word in NON_TERMINAL_ABBREVIATIONS:
+        return False
+    if word in NUMBER_ABBREVIATIONS:
+        return not text[next_start:next_start + 1].isdigit()
+    if word in AMBIGUOUS_ABBREVIATIONS or "." in word:
+        # Includes dotted abbreviations such as "U.S." or "a.m."
+        return _next_is_capitalized(text, next_start)
+    return True
+
+
+def _next_is_capitalized(text: str, position: int) -> bool:
+    """Whether the word at position starts a new sentence (or the text ends)."""
+    return position >= len(text) or not text[position].islower()
+
+
+def _skip_space(text: str, position: int) -> int:
+    """Offset of the first non-whitespace character at or after position."""
+    match = _NON_SPACE.search(text, position)
+    return match.start() if match else len(text)
+
+
+def _trim_end(text: str, start: int, end: int) -> int:
+    """Move end back over trailing whitespace, but not before start."""
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return end
@@ -1,6 +1,10 @@
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
 import logging
 
+from app.core.config import get_keyword_matcher, get_settings
+from app.core.metrics import stage_timer
+from app.services.topic_router import TopicRouter
+
 # Suppress warnings
 logging.getLogger("transformers").setLevel(logging.ERROR)
 
@@ -9,6 +13,13 @@ class LLMService:
         self.model = None
         self.tokenizer = None
         self.model_name = "google/flan-t5-small"
+        settings = get_settings()
+        # Same confidence gate as the app: only unambiguous keyword matches skip the model
+        self.router = TopicRouter(
+            enabled=settings.router_enabled,
+            min_hits=settings.router_min_keyword_hits,
+            strong_keywords=settings.router_strong_keywords
+        )
 
     def load_model(self):
         # Lazy loading handled in analyze_sentence
@@ -32,15 +43,10 @@ class LLMService:
 
     def analyze_sentence(self, text: str) -> str:
         # Fallback Keywords (Hybrid approach for reliability on small model)
-        lower_text = text.lower()
-        if "crash" in lower_text or "slow" in lower_text or "lag" in lower_text:
-            return "Performance"
-        if "bill" in lower_text or "charg" in lower_text or "refund" in lower_text:
-            return "Billing"
-        if "support" in lower_text or "help" in lower_text or "service" in lower_text:
-            return "Support"
-        if "login" in lower_text or "password" in lower_text or "sign in" in lower_text:
-            return "Account"
+        with stage_timer("keyword_match"):
+            match = get_keyword_matcher().match(text)
+        if self.router.is_confident(match):
+            return match.topic
         
         try:
             model, tokenizer = self._get_model_and_tokenizer()
@@ -62,9 +68,12 @@ Input: {text}
 Topic:"""
 
         try:
-            inputs = self.tokenizer(prompt, return_tensors="pt", max_length=512, truncation=True)
-            outputs = self.model.generate(**inputs, max_new_tokens=10)
-            output_text = self.tokenizer.batch_decode(outputs, skip_special_tokens=True)[0]
+            with stage_timer("tokenize"):
+                inputs = self.tokenizer(prompt, return_tensors="pt", max_length=512, truncation=True)
+            with stage_timer("generate"):
+                outputs = self.model.generate(**inputs, max_new_tokens=10)
+            with stage_timer("decode"):
+                output_text = self.tokenizer.batch_decode(outputs, skip_special_tokens=True)[0]
             
             print(f"DEBUG: Input='{text}' | Model Output='{output_text}'")
             return self._validate_topic(output_text)
@@ -1,3 +1,9 @@
+import asyncio
+import contextvars
+import functools
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
@@ -5,6 +11,8 @@ from typing import List
 
 from utils.text_processing import split_into_sentences
 from core.llm import llm_service
+from app.core.metrics import stage_timer
+from app.core.profiling import RequestProfilingMiddleware
 
 app = FastAPI(title="Customer Review Topic Highlighter")
 
@@ -15,6 +23,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
+)
+
+# Opt-in per-request profiling: X-Profile header -> Server-Timing header
+app.add_middleware(
+    RequestProfilingMiddleware,
+    enabled=os.getenv("REQUEST_PROFILING_ENABLED", "false").lower() == "true",
+    token=os.getenv("REQUEST_PROFILING_TOKEN") or None,
+    cprofile=os.getenv("REQUEST_PROFILING_CPROFILE", "false").lower() == "true",
 )
 
 class AnalyzeRequest(BaseModel):
@@ -33,8 +50,15 @@ async def startup_event():
     print("Starting up... Model will load lazily on first request")
     # llm_service.load_model() # Removed to prevent OOM on startup
 
-# Simple in-memory cache
-analysis_cache = {}
+# Dedicated threads for blocking model inference, so the event loop stays free
+inference_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("INFERENCE_THREADS", "1")),
+    thread_name_prefix="inference"
+)
+
+# Simple in-memory LRU cache, bounded so it cannot grow forever
+ANALYSIS_CACHE_SIZE = int(os.getenv("ANALYSIS_CACHE_SIZE", "1024"))
+analysis_cache: "OrderedDict[str, AnalyzeResponse]" = OrderedDict()
 
 @app.post("/analyze", response_model=AnalyzeResponse)
 async def analyze_review(request: AnalyzeRequest):
@@ -44,15 +68,23 @@ async def analyze_review(request: AnalyzeRequest):
     # Check cache
     if request.text in analysis_cache:
         print("Cache hit!")
+        analysis_cache.move_to_end(request.text)
         return analysis_cache[request.text]
 
     # 1. Split sentences
-    sentences = split_into_sentences(request.text)
+    with stage_timer("split"):
+        sentences = split_into_sentences(request.text)
 
     # 2. Analyze each sentence
+    loop = asyncio.get_running_loop()
     results = []
     for idx, sentence in enumerate(sentences):
-        topic = llm_service.analyze_sentence(sentence)
+        # Run in this request's context so its profile sees the stages
+        context = contextvars.copy_context()
+        topic = await loop.run_in_executor(
+            inference_executor,
+            functools.partial(context.run, llm_service.analyze_sentence, sentence)
+        )
         results.append(SentenceResult(
             index=idx,
             text=sentence,
@@ -63,6 +95,8 @@ async def analyze_review(request: AnalyzeRequest):
     
     # Store in cache
     analysis_cache[request.text] = response
+    while len(analysis_cache) > ANALYSIS_CACHE_SIZE:
+        analysis_cache.popitem(last=False)
     
     return response
 
@@ -0,0 +1,339 @@
+"""
+Micro-benchmarks for the text and classification hot paths.
+
+Times sentence splitting, keyword detection, topic parsing, prompt
+building and tokenization, and the full
+ReviewAnalysisService.analyze_review pipeline with a stub model (the
+keyword backend, with routing and caching off so every sentence goes
+through the scheduler and executor). Inputs are generated review
+corpora of several sizes, seeded so every run sees the same text.
+
+Results are written as JSON and compared with a baseline; the script
+exits with status 1 when a benchmark is slower than the baseline by
+more than the threshold. Timings only compare on the same machine, so
+baselines are committed per machine label, under
+scripts/benchmark_baselines/<label>.json. The label comes from
+--machine-label or BENCHMARK_MACHINE_LABEL and defaults to the host
+name; give CI runners a stable label. A baseline can also be loaded
+from elsewhere (e.g. a CI artifact) with --baseline. A missing baseline,
+or one recorded under another label, exits with status 2 unless
+--allow-missing-baseline is passed.
+
+Usage (from backend/):
+    # Record a baseline on the accepted revision (which must already have
+    # this script), running that revision's own copy of it
+    git worktree add --detach /tmp/bench-base main
+    python /tmp/bench-base/backend/scripts/benchmark.py --update-baseline --baseline scripts/benchmark_baselines/$(hostname).json
+    git worktree remove /tmp/bench-base
+
+    python scripts/benchmark.py
+    python scripts/benchmark.py --machine-label ci-x86 --baseline artifacts/baseline.json
+    python scripts/benchmark.py --output results.json --threshold 0.3
+    python scripts/benchmark.py --tokenizer google/flan-t5-small
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import re
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.core.config import get_settings  # noqa: E402
+from app.core.logging import setup_logging  # noqa: E402
+from app.models.topic import Topic  # noqa: E402
+from app.schemas.analyze import AnalyzeRequest, MAX_REVIEW_LENGTH  # noqa: E402
+from app.services.llm_service import LLMService  # noqa: E402
+from app.services.review_analysis_service import ReviewAnalysisService  # noqa: E402
+from app.utils.text_processing import split_into_sentences  # noqa: E402
+
+# One committed baseline per machine label
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baselines")
+
+# Exit status when there is no comparable baseline
+EXIT_NO_BASELINE = 2
+
+# Sentences per review for each corpus; "long" is capped at the request limit
+CORPUS_SIZES = {"short": 2, "medium": 8, "long": 60}
+
+_SENTENCES = [
+    "The app keeps crashing after the {n}.{m} update.",
+    "I was charged ${n}.{m}9 twice this month!",
+    "Customer support never answered my {n} emails...",
+    "I can't log in since I reset my password, e.g. on my phone.",
+    "The new settings screen is really confusing.",
+    "Pages take forever to load, approx. {n} seconds each.",
+    "Dr. Smith from the help desk was friendly and quick.",
+    "Why does the subscription cost more than last year?",
+    "Overall the idea is good, but the UI feels cluttered.",
+    "Two-factor authentication locks me out every time.",
+    "Refund took {n} days to arrive.",
+    "It was... fine, I guess.",
+    "Sync between devices is slow and unreliable.",
+    "The dark mode is lovely",
+]
+
+_MODEL_OUTPUTS = ["Billing", " performance.", "Support", "ux", "Account issue", "no idea"]
+
+
+def make_review(rng: random.Random, sentences: int) -> str:
+    """Build one review from templated sentences, with occasional line breaks."""
+    parts = []
+    for _ in range(sentences):
+        parts.append(rng.choice(_SENTENCES).format(n=rng.randint(1, 99), m=rng.randint(0, 9)))
+        parts.append("\n" if rng.random() < 0.1 else " ")
+    return "".join(parts).strip()[:MAX_REVIEW_LENGTH]
+
+
+def make_corpus(size: str, reviews: int = 50, seed: int = 1) -> list:
+    """Generate a deterministic corpus of reviews of the given size."""
+    rng = random.Random(f"{seed}:{size}")
+    return [make_review(rng, CORPUS_SIZES[size]) for _ in range(reviews)]
+
+
+def measure(run, repeats: int, min_seconds: float) -> dict:
+    """
+    Time a benchmark. `run(n)` performs n operations and returns the
+    elapsed seconds; n is calibrated so one repeat takes min_seconds.
+    """
+    n = 1
+    while run(n) < min_seconds and n < 10_000_000:
+        n *= 2
+
+    per_op = [run(n) / n * 1e6 for _ in range(repeats)]
+    return {
+        "median_us": statistics.median(per_op),
+        "min_us": min(per_op),
+        "ops_per_repeat": n,
+    }
+
+
+def timed_loop(fn, inputs):
+    """Make a run(n) callable that applies fn to inputs round-robin."""
+    def run(n):
+        started = time.perf_counter()
+        for i in range(n):
+            fn(inputs[i % len(inputs)])
+        return time.perf_counter() - started
+    return run
+
+
+def text_benchmarks() -> dict:
+    """Benchmarks that need nothing but the standard library."""
+    benchmarks = {}
+    for size in CORPUS_SIZES:
+        corpus = make_corpus(size)
+        benchmarks[f"split_into_sentences[{size}]"] = timed_loop(split_into_sentences, corpus)
+
+    sentences = [s for review in make_corpus("medium") for s in split_into_sentences(review)]
+    benchmarks["Topic.detect_from_keywords"] = timed_loop(Topic.detect_from_keywords, sentences)
+    benchmarks["Topic.from_string"] = timed_loop(Topic.from_string, _MODEL_OUTPUTS)
+
+    service = LLMService(get_settings())
+    benchmarks["LLMService._build_prompt"] = timed_loop(service._build_prompt, sentences)
+    return benchmarks
+
+
+def tokenizer_benchmarks(tokenizer_name: str, batch_size: int) -> dict:
+    """Prompt tokenization, if the tokenizer can be loaded."""
+    try:
+        from transformers import AutoTokenizer
+        from app.services.prompt import CompiledPrompt
+
+        tokenizer = AutoTokenizer.from_pretrained(tokenizer_name)
+    except Exception as e:
+        print(f"Skipping tokenization benchmarks: {e}", file=sys.stderr)
+        return {}
+
+    prompt = CompiledPrompt(tokenizer, get_settings().max_tokens)
+    sentences = [s for review in make_corpus("medium") for s in split_into_sentences(review)]
+    batches = [
+        sentences[i:i + batch_size]
+        for i in range(0, len(sentences) - batch_size + 1, batch_size)
+    ]
+    return {
+        f"tokenize_prompts[batch={batch_size}]": timed_loop(prompt.encode, batches),
+    }
+
+
+def pipeline_benchmarks(loop: asyncio.AbstractEventLoop, llm_service: LLMService) -> dict:
+    """ReviewAnalysisService.analyze_review end to end with a stub model."""
+    service = ReviewAnalysisService(llm_service)
+
+    benchmarks = {}
+    for size in CORPUS_SIZES:
+        requests = [AnalyzeRequest(text=text) for text in make_corpus(size)]
+
+        def run(n, requests=requests):
+            async def analyze():
+                for i in range(n):
+                    await service.analyze_review(requests[i % len(requests)])
+
+            started = time.perf_counter()
+            loop.run_until_complete(analyze())
+            return time.perf_counter() - started
+
+        benchmarks[f"analyze_review[{size}]"] = run
+    return benchmarks
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Find benchmarks slower than the baseline by more than the threshold.
+
+    Args:
+        results: name -> measurement with median_us
+        baseline: Baseline document with a "benchmarks" mapping
+        threshold: Allowed slowdown, e.g. 0.25 for 25%
+
+    Returns:
+        (name, baseline_us, current_us, slowdown) for each regression
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get("benchmarks", {}).get(name)
+        if reference is None:
+            continue
+        slowdown = result["median_us"] / reference["median_us"] - 1
+        if slowdown > threshold:
+            regressions.append((name, reference["median_us"], result["median_us"], slowdown))
+    return regressions
+
+
+def baseline_path(label: str) -> str:
+    """Path of the committed baseline for a machine label."""
+    safe = re.sub(r"[^A-Za-z0-9_.-]", "_", label)
+    return os.path.join(BASELINE_DIR, f"{safe}.json")
+
+
+def load_baseline(path: str, label: str):
+    """
+    Load a baseline recorded under the given machine label.
+
+    Returns:
+        (baseline, None) when it can be compared, else (None, reason)
+    """
+    if not os.path.exists(path):
+        return None, f"No baseline at {path}; record one with --update-baseline"
+
+    with open(path) as f:
+        baseline = json.load(f)
+    if baseline.get("machine_label") != label:
+        return None, (
+            f"Baseline {path} was recorded as {baseline.get('machine_label', 'an unlabelled machine')!r}, "
+            f"not {label!r}; timings are not comparable"
+        )
+    return baseline, None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--machine-label",
+        default=os.environ.get("BENCHMARK_MACHINE_LABEL") or platform.node(),
+        help="Machine the baseline belongs to (default: BENCHMARK_MACHINE_LABEL, else the host name)"
+    )
+    parser.add_argument("--baseline", help="Baseline JSON file (default: scripts/benchmark_baselines/<label>.json)")
+    parser.add_argument(
+        "--allow-missing-baseline", action="store_true",
+        help="Exit 0 instead of 2 when there is no baseline for this machine label"
+    )
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--threshold", type=float, help="Allowed slowdown vs. baseline (default: baseline's, else 0.25)")
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the new baseline")
+    parser.add_argument("--tokenizer", help="Tokenizer for tokenization benchmarks (default: MODEL_NAME)")
+    parser.add_argument("--batch-size", type=int, default=16, help="Sentences per tokenized batch")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed repeats per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.05, help="Minimum seconds per repeat")
+    parser.add_argument("--filter", help="Only run benchmarks whose name contains this text")
+    args = parser.parse_args()
+    baseline_file = args.baseline or baseline_path(args.machine_label)
+
+    # Check the baseline first so a CI run without one fails before timing anything
+    baseline = None
+    if not args.update_baseline:
+        baseline, reason = load_baseline(baseline_file, args.machine_label)
+        if baseline is None:
+            print(reason, file=sys.stderr)
+            if not args.allow_missing_baseline:
+                sys.exit(EXIT_NO_BASELINE)
+
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    setup_logging()
+
+    # Stub model: keyword answers, but routed through batching and the executor
+    llm_service = LLMService(get_settings().model_copy(update={
+        "inference_backend": "keyword",
+        "model_warmup": False,
+        "router_enabled": False,
+        "cache_enabled": False,
+        "persistent_cache_path": None,
+        # Measure pipeline overhead, not the wait for a batch to fill
+        "batch_max_wait_ms": 0.0,
+    }))
+    # Code that ignores the override would time the real model instead, and
+    # its numbers would not be comparable with any other run
+    backend = getattr(llm_service, "backend", None)
+    if getattr(backend, "name", None) != "keyword":
+        sys.exit("The keyword stub backend was not applied; refusing to benchmark this revision")
+    llm_service.load_model()
+
+    loop = asyncio.new_event_loop()
+    benchmarks = {
+        **text_benchmarks(),
+        **tokenizer_benchmarks(args.tokenizer or get_settings().model_name, args.batch_size),
+        **pipeline_benchmarks(loop, llm_service),
+    }
+
+    results = {}
+    for name, run in benchmarks.items():
+        if args.filter and args.filter not in name:
+            continue
+        results[name] = measure(run, args.repeats, args.min_time)
+        print(f"{name:45s} {results[name]['median_us']:12.2f} us/op", file=sys.stderr)
+    loop.run_until_complete(llm_service.shutdown())
+    loop.close()
+
+    document = {
+        "machine_label": args.machine_label,
+        "host": platform.node(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "benchmarks": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2)
+
+    if args.update_baseline:
+        document["threshold"] = args.threshold if args.threshold is not None else 0.25
+        os.makedirs(os.path.dirname(os.path.abspath(baseline_file)), exist_ok=True)
+        with open(baseline_file, "w") as f:
+            json.dump(document, f, indent=2)
+        print(f"Baseline written to {baseline_file}", file=sys.stderr)
+        return
+
+    if baseline is None:
+        return
+    threshold = args.threshold if args.threshold is not None else baseline.get("threshold", 0.25)
+
+    regressions = compare(results, baseline, threshold)
+    for name, before, after, slowdown in regressions:
+        print(
+            f"REGRESSION {name}: {before:.2f} -> {after:.2f} us/op (+{slowdown:.0%}, limit {threshold:.0%})",
+            file=sys.stderr
+        )
+    if regressions:
+        sys.exit(1)
+    print(f"No regressions beyond {threshold:.0%} of the baseline", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Compare a reduced-precision model against fp32 on the same sentences.
+
+Each precision runs in its own process so peak RSS is measured fairly.
+Reports load time, peak RSS, per-sentence latency and label agreement.
+
+Usage (from backend/):
+    python scripts/compare_precision.py --precision int8
+    python scripts/compare_precision.py --precision bf16 --input reviews.jsonl --limit 2000
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import get_settings  # noqa: E402
+from app.services.job_service import parse_upload  # noqa: E402
+from app.services.llm_service import LLMService  # noqa: E402
+from app.utils.text_processing import split_into_sentences  # noqa: E402
+
+SAMPLE_SENTENCES = [
+    "The app keeps crashing after the last update.",
+    "I was charged twice this month.",
+    "Customer support never answered my emails.",
+    "I can't log in since I reset my password.",
+    "The new settings screen is really confusing.",
+    "Pages take forever to load on my phone.",
+    "The subscription price went up without notice.",
+    "Overall the idea is good.",
+    "The agent I spoke to was friendly and quick.",
+    "Two-factor authentication locks me out every time.",
+]
+
+
+def load_sentences(path, limit):
+    """Read up to `limit` sentences from a JSONL or CSV review file."""
+    fmt = "csv" if path.lower().endswith(".csv") else "jsonl"
+    sentences = []
+    with open(path, "rb") as f:
+        for _, text, failed in parse_upload(f, fmt):
+            if failed is None:
+                sentences.extend(split_into_sentences(text))
+            if len(sentences) >= limit:
+                break
+    return sentences[:limit]
+
+
+def run_precision(precision, sentences, batch_size):
+    """Load the model at one precision and classify every sentence."""
+    settings = get_settings().model_copy(update={
+        "model_precision": precision,
+        "model_warmup": True,
+        "router_enabled": False,
+        "cache_enabled": False,
+        "persistent_cache_path": None,
+        "batching_enabled": False,
+        "batch_max_size": batch_size,
+    })
+    service = LLMService(settings)
+
+    started = time.perf_counter()
+    service.load_model()
+    load_seconds = time.perf_counter() - started
+
+    labels, latencies = [], []
+    for start in range(0, len(sentences), batch_size):
+        batch = sentences[start:start + batch_size]
+        started = time.perf_counter()
+        results = asyncio.run(service.classify_sentences(batch))
+        elapsed = time.perf_counter() - started
+        labels.extend(result.topic.value for result in results)
+        latencies.extend([elapsed / len(batch)] * len(batch))
+
+    return {
+        "precision": precision,
+        "load_seconds": load_seconds,
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "labels": labels,
+        "latencies": latencies,
+    }
+
+
+def run_isolated(precision, sentences, batch_size):
+    """Run one precision in a fresh process."""
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        return pool.apply(run_precision, (precision, sentences, batch_size))
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of a list of numbers."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def report(baseline, candidate, sentences):
+    """Print the side-by-side comparison."""
+    print(f"{'':18}{'fp32':>12}{candidate['precision']:>12}")
+    for name, key, unit in (
+        ("load time", "load_seconds", "s"),
+        ("peak RSS", "peak_rss_mb", "MB"),
+    ):
+        print(f"{name:18}{baseline[key]:>10.1f}{unit:>2}{candidate[key]:>10.1f}{unit:>2}")
+    for name, q in (("latency p50", 0.5), ("latency p95", 0.95)):
+        base_ms = percentile(baseline["latencies"], q) * 1000
+        cand_ms = percentile(candidate["latencies"], q) * 1000
+        print(f"{name:18}{base_ms:>10.1f}ms{cand_ms:>10.1f}ms")
+    base_mean = statistics.mean(baseline["latencies"])
+    cand_mean = statistics.mean(candidate["latencies"])
+    print(f"{'speed-up':18}{base_mean / cand_mean:>22.2f}x")
+
+    disagreements = [
+        (sentence, old, new)
+        for sentence, old, new in zip(sentences, baseline["labels"], candidate["labels"])
+        if old != new
+    ]
+    agreement = 1 - len(disagreements) / len(sentences)
+    print(f"\nLabel agreement: {agreement:.2%} ({len(disagreements)} of {len(sentences)} differ)")
+    for sentence, old, new in disagreements[:10]:
+        print(f"  {old} -> {new}: {sentence}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare a model precision against fp32")
+    parser.add_argument("--precision", choices=("int8", "bf16"), default="int8")
+    parser.add_argument("--input", help="JSONL or CSV review file (default: built-in samples)")
+    parser.add_argument("--limit", type=int, default=1000, help="Maximum sentences to compare")
+    parser.add_argument("--batch-size", type=int, default=16)
+    args = parser.parse_args()
+
+    sentences = load_sentences(args.input, args.limit) if args.input else SAMPLE_SENTENCES
+    print(f"Comparing fp32 and {args.precision} on {len(sentences)} sentences...\n")
+
+    baseline = run_isolated("fp32", sentences, args.batch_size)
+    candidate = run_isolated(args.precision, sentences, args.batch_size)
+    report(baseline, candidate, sentences)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+Async load generator for the analysis API.
+
+Drives POST /api/v1/analyze (or another analyze endpoint) either at a
+fixed concurrency (closed loop: N clients, each sending its next request
+when the previous one returns) or at a fixed request rate (open loop:
+Poisson arrivals, independent of how fast responses come back), and
+reports throughput, latency percentiles and error rates.
+
+Runs against a server URL, e.g. a local uvicorn, or against the app
+in-process. In-process runs default to the fake model backend, so
+batching, queueing and worker settings can be tried on any laptop.
+They also turn off the sentence caches and the keyword router, since
+the corpus repeats sentences and would otherwise measure cache and
+keyword hits rather than batching and inference; --cache and --router
+turn them back on. Every setting can still be overridden through the
+environment.
+
+Usage (from backend/):
+    python scripts/loadgen.py --in-process --concurrency 32 --duration 20
+    FAKE_LATENCY_BASE_MS=40 BATCH_MAX_SIZE=32 python scripts/loadgen.py --in-process --rate 200
+    python scripts/loadgen.py --in-process --cache --router --concurrency 32
+    INFERENCE_BACKEND=fake CACHE_ENABLED=false ROUTER_ENABLED=false uvicorn app.main:app --workers 2 &
+    python scripts/loadgen.py --url http://localhost:8000 --concurrency 64 --output load.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from typing import List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import httpx  # noqa: E402
+
+from benchmark import make_corpus  # noqa: E402
+
+
+class LoadStats:
+    """Latencies and outcomes of the requests sent during the measured window."""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.outcomes: Counter = Counter()
+        self.sentences = 0
+
+    def record(self, latency: float, outcome: str, sentences: int = 0) -> None:
+        self.latencies.append(latency)
+        self.outcomes[outcome] += 1
+        self.sentences += sentences
+
+    def report(self, elapsed: float) -> dict:
+        """Summarize throughput, latency percentiles and error rate."""
+        total = sum(self.outcomes.values())
+        errors = total - self.outcomes["200"]
+        ordered = sorted(self.latencies)
+
+        def percentile(p: float) -> Optional[float]:
+            if not ordered:
+                return None
+            return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1000
+
+        return {
+            "requests": total,
+            "duration_seconds": elapsed,
+            "throughput_rps": total / elapsed if elapsed else 0.0,
+            "sentences_per_second": self.sentences / elapsed if elapsed else 0.0,
+            "error_rate": errors / total if total else 0.0,
+            "outcomes": dict(self.outcomes),
+            "latency_ms": {
+                "mean": statistics.fmean(ordered) * 1000 if ordered else None,
+                "p50": percentile(50),
+                "p95": percentile(95),
+                "p99": percentile(99),
+                "max": ordered[-1] * 1000 if ordered else None,
+            },
+        }
+
+
+async def send(client: httpx.AsyncClient, path: str, text: str, stats: Optional[LoadStats]) -> None:
+    """Send one request and record it (stats is None during warm-up)."""
+    started = time.perf_counter()
+    try:
+        response = await client.post(path, json={"text": text})
+        outcome = str(response.status_code)
+        sentences = len(response.json().get("sentences", [])) if response.status_code == 200 else 0
+    except httpx.HTTPError as e:
+        outcome, sentences = type(e).__name__, 0
+    if stats is not None:
+        stats.record(time.perf_counter() - started, outcome, sentences)
+
+
+async def run_closed_loop(client, path, texts, concurrency, warmup, duration, stats) -> None:
+    """Keep `concurrency` requests in flight until the duration ends."""
+    rng = random.Random(0)
+    measure_from = time.perf_counter() + warmup
+    stop_at = measure_from + duration
+
+    async def worker():
+        while time.perf_counter() < stop_at:
+            measuring = time.perf_counter() >= measure_from
+            await send(client, path, rng.choice(texts), stats if measuring else None)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+
+async def run_open_loop(client, path, texts, rate, warmup, duration, max_outstanding, stats) -> None:
+    """Start requests at Poisson-distributed times averaging `rate` per second."""
+    rng = random.Random(0)
+    measure_from = time.perf_counter() + warmup
+    stop_at = measure_from + duration
+    outstanding = set()
+    next_start = time.perf_counter()
+
+    while next_start < stop_at:
+        await asyncio.sleep(max(0.0, next_start - time.perf_counter()))
+        measuring = next_start >= measure_from
+
+        if len(outstanding) >= max_outstanding:
+            # The server fell too far behind; count the request as shed
+            if measuring:
+                stats.record(0.0, "shed")
+        else:
+            task = asyncio.create_task(
+                send(client, path, rng.choice(texts), stats if measuring else None)
+            )
+            outstanding.add(task)
+            task.add_done_callback(outstanding.discard)
+
+        next_start += rng.expovariate(rate)
+
+    if outstanding:
+        await asyncio.gather(*outstanding)
+
+
+def load_texts(args) -> List[str]:
+    """Reviews to send: from --input, or a generated corpus."""
+    if not args.input:
+        return make_corpus(args.corpus, reviews=500)
+
+    from app.services.job_service import parse_upload
+
+    fmt = "csv" if args.input.lower().endswith(".csv") else "jsonl"
+    with open(args.input, "rb") as f:
+        return [text for _, text, failed in parse_upload(f, fmt) if failed is None]
+
+
+async def run(args) -> dict:
+    texts = load_texts(args)
+    stats = LoadStats()
+    timeout = httpx.Timeout(args.timeout)
+    limits = httpx.Limits(max_connections=max(args.concurrency, args.max_outstanding))
+
+    if args.in_process:
+        # Fake model unless configured otherwise; set before the app reads settings
+        os.environ.setdefault("INFERENCE_BACKEND", "fake")
+        os.environ.setdefault("CACHE_ENABLED", "true" if args.cache else "false")
+        if not args.cache:
+            os.environ.setdefault("PERSISTENT_CACHE_PATH", "")
+        os.environ.setdefault("ROUTER_ENABLED", "true" if args.router else "false")
+        os.environ.setdefault("JOBS_ENABLED", "false")
+        os.environ.setdefault("LOG_LEVEL", "WARNING")
+        from app.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=timeout) as client:
+                await wait_until_ready(client)
+                elapsed = await drive(client, texts, stats, args)
+    else:
+        async with httpx.AsyncClient(base_url=args.url, timeout=timeout, limits=limits) as client:
+            await wait_until_ready(client)
+            elapsed = await drive(client, texts, stats, args)
+
+    return stats.report(elapsed)
+
+
+async def wait_until_ready(client: httpx.AsyncClient, timeout: float = 300.0) -> None:
+    """Wait for the readiness probe to report the model serving."""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            response = await client.get("/api/v1/health/ready")
+            if response.status_code == 200 and response.json().get("serving") == "model":
+                return
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.5)
+    raise SystemExit("Server did not become ready")
+
+
+async def drive(client, texts, stats, args) -> float:
+    """Run the configured load pattern; returns the measured seconds."""
+    started = time.perf_counter()
+    if args.rate:
+        await run_open_loop(
+            client, args.path, texts, args.rate, args.warmup, args.duration,
+            args.max_outstanding, stats
+        )
+    else:
+        await run_closed_loop(
+            client, args.path, texts, args.concurrency, args.warmup, args.duration, stats
+        )
+    # Requests still in flight at the end are measured too
+    return max(time.perf_counter() - started - args.warmup, 1e-9)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", default="http://localhost:8000", help="Server to load")
+    target.add_argument("--in-process", action="store_true", help="Load the app in this process")
+    parser.add_argument("--path", default="/api/v1/analyze", help="Endpoint to POST reviews to")
+    parser.add_argument("--concurrency", type=int, default=16, help="Clients in closed-loop mode")
+    parser.add_argument("--rate", type=float, help="Requests per second (open-loop mode)")
+    parser.add_argument("--max-outstanding", type=int, default=1000, help="Open-loop requests in flight before shedding")
+    parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Unmeasured seconds first")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--corpus", choices=["short", "medium", "long"], default="medium", help="Generated review size")
+    parser.add_argument("--input", help="JSONL or CSV reviews to send instead of a generated corpus")
+    parser.add_argument("--output", help="Write the report as JSON to this file")
+    parser.add_argument("--cache", action="store_true", help="Keep the sentence caches on (in-process runs)")
+    parser.add_argument("--router", action="store_true", help="Keep the keyword router on (in-process runs)")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    latency = report["latency_ms"]
+    mode = f"{args.rate:g} req/s" if args.rate else f"concurrency {args.concurrency}"
+    print(
+        f"{mode}: {report['requests']} requests in {report['duration_seconds']:.1f}s, "
+        f"{report['throughput_rps']:.1f} req/s, {report['sentences_per_second']:.0f} sentences/s, "
+        f"errors {report['error_rate']:.2%}",
+        file=sys.stderr
+    )
+    if latency["p50"] is not None:
+        print(
+            f"latency ms: p50 {latency['p50']:.1f}  p95 {latency['p95']:.1f}  "
+            f"p99 {latency['p99']:.1f}  max {latency['max']:.1f}",
+            file=sys.stderr
+        )
+    print(f"outcomes: {report['outcomes']}", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import sys
+import os
+
+import pytest
+
+# Add backend to path so we can import app
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from app.models.topic import Topic
+from app.services.prompt import build_prompt
+
+# Sentences the tiny test tokenizer knows every word of
+TINY_SENTENCES = [
+    "The app crashes every time I open it.",
+    "I was charged twice for my subscription!",
+    "Support never answered my emails...",
+    "The new settings screen is confusing.",
+    "I can't log in since I reset my password.",
+    "Lovely colours.",
+]
+
+
+@pytest.fixture(scope="session")
+def tiny_t5_path(tmp_path_factory):
+    """
+    A randomly initialised T5 and a word-level tokenizer saved to disk, so
+    the transformers backend can be exercised without downloading a model.
+    """
+    pytest.importorskip("torch")
+    transformers = pytest.importorskip("transformers")
+    from tokenizers import Tokenizer, models, pre_tokenizers, processors
+
+    pre_tokenizer = pre_tokenizers.Whitespace()
+    words = set()
+    for text in [build_prompt(s) for s in TINY_SENTENCES] + Topic.all_values():
+        words.update(word for word, _ in pre_tokenizer.pre_tokenize_str(text))
+
+    vocab = {"<pad>": 0, "</s>": 1, "<unk>": 2}
+    for word in sorted(words):
+        vocab[word] = len(vocab)
+
+    tokenizer = Tokenizer(models.WordLevel(vocab, unk_token="<unk>"))
+    tokenizer.pre_tokenizer = pre_tokenizer
+    tokenizer.post_processor = processors.TemplateProcessing(
+        single="$A </s>", special_tokens=[("</s>", 1)]
+    )
+
+    import torch
+
+    torch.manual_seed(0)
+    model = transformers.T5ForConditionalGeneration(transformers.T5Config(
+        vocab_size=len(vocab),
+        d_model=32,
+        d_ff=64,
+        d_kv=8,
+        num_layers=2,
+        num_heads=4,
+        pad_token_id=0,
+        eos_token_id=1,
+        decoder_start_token_id=0
+    ))
+
+    path = tmp_path_factory.mktemp("tiny-t5")
+    model.save_pretrained(path)
+    transformers.PreTrainedTokenizerFast(
+        tokenizer_object=tokenizer,
+        pad_token="<pad>",
+        eos_token="</s>",
+        unk_token="<unk>"
+    ).save_pretrained(path)
+    return str(path)
@@ -0,0 +1,114 @@
+import json
+from fastapi.testclient import TestClient
+import pytest
+import sys
+import os
+
+# Add backend to path so we can import app
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from app.main import app
+from app.api.v1.dependencies import get_llm_service
+from app.services.llm_service import ModelLoadState
+
+# Lifespan (model loading) is not run, so classification uses keywords
+client = TestClient(app)
+
+
+def test_analyze_batch_deduplicates_sentences():
+    response = client.post("/api/v1/analyze/batch", json={"reviews": [
+        {"id": "a", "text": "The app crashes. I was charged twice."},
+        {"id": "b", "text": "The app crashes."},
+    ]})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_sentences"] == 3
+    assert data["unique_sentences"] == 2
+    assert [r["id"] for r in data["results"]] == ["a", "b"]
+    assert [s["topic"] for s in data["results"][0]["sentences"]] == ["Performance", "Billing"]
+
+
+def test_analyze_batch_reports_item_errors():
+    response = client.post("/api/v1/analyze/batch", json={"reviews": [
+        {"id": "ok", "text": "Support was helpful."},
+        {"id": "empty", "text": "   "},
+    ]})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0]["sentences"][0]["topic"] == "Support"
+    assert "error" in results[1] and "sentences" not in results[1]
+
+
+def test_analyze_stream_emits_sentences_then_summary():
+    response = client.post(
+        "/api/v1/analyze/stream",
+        json={"text": "The app crashes. Support was helpful."}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+    sentences = sorted(
+        (e["data"] for e in events if e["event"] == "sentence"),
+        key=lambda s: s["index"]
+    )
+    assert [s["topic"] for s in sentences] == ["Performance", "Support"]
+    assert events[-1] == {
+        "event": "summary",
+        "data": {"total_sentences": 2, "topic_counts": {"Performance": 1, "Support": 1}}
+    }
+
+
+def test_analyze_document_streams_in_order_with_global_offsets():
+    text = "The app crashes. Support was helpful. " * 3000
+    response = client.post(
+        "/api/v1/analyze/document",
+        content=text.encode(),
+        headers={"Content-Type": "text/plain"}
+    )
+    assert response.status_code == 200
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+    sentences = [e["data"] for e in events[:-1]]
+    assert len(text) > 5000 and len(sentences) == 6000
+    assert [s["index"] for s in sentences] == list(range(6000))
+    assert all(text[s["start"]:s["end"]] == s["text"] for s in sentences)
+    assert events[-1]["data"]["topic_counts"] == {"Performance": 3000, "Support": 3000}
+
+
+def test_liveness_and_readiness_probes():
+    assert client.get("/api/v1/health/live").json() == {"status": "ok"}
+
+    response = client.get("/api/v1/health/ready")
+    assert response.status_code == 200
+    assert response.json()["serving"] == "keyword"
+
+
+@pytest.fixture
+def model_loading_without_keywords(monkeypatch):
+    """Pretend the model is loading and keyword answers are turned off."""
+    service = get_llm_service()
+    monkeypatch.setattr(service, "_load_state", ModelLoadState.LOADING)
+    monkeypatch.setattr(
+        service,
+        "settings",
+        service.settings.model_copy(update={"serve_keywords_while_loading": False})
+    )
+
+
+def test_analyze_stream_is_rejected_before_streaming_while_loading(model_loading_without_keywords):
+    response = client.post("/api/v1/analyze/stream", json={"text": "The app crashes."})
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "5"
+
+
+def test_analyze_document_is_rejected_before_streaming_while_loading(model_loading_without_keywords):
+    response = client.post(
+        "/api/v1/analyze/document",
+        content=b"The app crashes.",
+        headers={"Content-Type": "text/plain"}
+    )
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "5"
@@ -0,0 +1,77 @@
+import asyncio
+import sys
+import os
+
+# Add backend to path so we can import app
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from app.services.batch_scheduler import BatchScheduler, Priority
+
+
+def test_concurrent_submissions_share_a_batch():
+    batches = []
+
+    async def handler(items):
+        batches.append(list(items))
+        return [item.upper() for item in items]
+
+    async def run():
+        scheduler = BatchScheduler(handler, max_batch_size=8, max_wait_ms=20)
+        results = await asyncio.gather(*(scheduler.submit(s) for s in ["a", "b", "c"]))
+        await scheduler.close()
+        return results
+
+    assert asyncio.run(run()) == ["A", "B", "C"]
+    assert batches == [["a", "b", "c"]]
+
+
+def test_batches_respect_max_size():
+    batches = []
+
+    async def handler(items):
+        batches.append(len(items))
+        return items
+
+    async def run():
+        scheduler = BatchScheduler(handler, max_batch_size=2, max_wait_ms=20)
+        await asyncio.gather(*(scheduler.submit(str(i)) for i in range(5)))
+        await scheduler.close()
+
+    asyncio.run(run())
+    assert batches == [2, 2, 1]
+
+
+def test_handler_errors_reach_every_caller():
+    async def handler(items):
+        raise RuntimeError("boom")
+
+    async def run():
+        scheduler = BatchScheduler(handler, max_batch_size=4, max_wait_ms=5)
+        results = await asyncio.gather(
+            scheduler.submit("a"), scheduler.submit("b"), return_exceptions=True
+        )
+        await scheduler.close()
+        return results
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_interactive_items_are_batched_before_bulk():
+    batches = []
+
+    async def handler(items):
+        batches.append(list(items))
+        return items
+
+    async def run():
+        scheduler = BatchScheduler(handler, max_batch_size=2, max_wait_ms=5)
+        await asyncio.gather(
+            scheduler.submit("bulk-1", Priority.BULK),
+            scheduler.submit("bulk-2", Priority.BULK),
+            scheduler.submit("user-1"),
+        )
+        await scheduler.close()
+
+    asyncio.run(run())
+    assert batches == [["user-1", "bulk-1"], ["bulk-2"]]
@@ -0,0 +1,40 @@
+import sys
+import os
+
+# Add backend to path so we can import app
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+sys.path.append(os.path.join(os.getcwd(), 'backend', 'scripts'))
+
+from benchmark import compare, make_corpus
+
+
+def test_regressions_beyond_threshold_are_reported():
+    baseline = {"benchmarks": {"split": {"median_us": 10.0}, "parse": {"median_us": 2.0}}}
+    results = {
+        "split": {"median_us": 14.0},
+        "parse": {"median_us": 2.2},
+        "new_benchmark": {"median_us": 99.0},
+    }
+
+    regressions = compare(results, baseline, threshold=0.25)
+
+    assert [name for name, *_ in regressions] == ["split"]
+
+
+def test_generated_corpora_are_deterministic():
+    assert make_corpus("medium") == make_corpus("medium")
+    assert all(len(review) <= 5000 for review in make_corpus("long"))
+
+
+def test_baseline_must_match_the_machine_label(tmp_path):
+    from benchmark import load_baseline
+
+    path = tmp_path / "ci.json"
+    assert load_baseline(str(path), "ci")[0] is None
+
+    path.write_text('{"machine_label": "laptop", "benchmarks": {}}')
+    baseline, reason = load_baseline(str(path), "ci")
+    assert baseline is None and "laptop" in reason
+
+    path.write_text('{"machine_label": "ci", "benchmarks": {}}')
+    assert load_baseline(str(path), "ci")[0] == {"machine_label": "ci", "benchmarks": {}}
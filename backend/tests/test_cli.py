@@ -0,0 +1,50 @@
+import json
+import sys
+import os
+
+# Add backend to path so we can import app
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from app.cli import Checkpoint, main
+
+REVIEWS = [
+    {"id": "a", "text": "The app crashes. I want a refund."},
+    {"id": "b", "text": "Support was helpful."},
+    {"id": "c", "text": "The button is confusing."},
+]
+
+
+def write_input(path):
+    path.write_text("".join(json.dumps(review) + "\n" for review in REVIEWS))
+
+
+def read_output(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_classify_writes_one_result_per_review(tmp_path):
+    source, target = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_input(source)
+
+    assert main(["classify", str(source), str(target), "--keywords-only", "--chunk-size", "2"]) == 0
+
+    results = read_output(target)
+    assert [r["id"] for r in results] == ["a", "b", "c"]
+    assert [s["topic"] for s in results[0]["sentences"]] == ["Performance", "Billing"]
+    assert Checkpoint.load(str(target)).completed
+
+
+def test_resume_continues_after_last_checkpoint(tmp_path):
+    source, target = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_input(source)
+
+    # Simulate a run interrupted after one checkpointed record plus a partial line
+    first_line = json.dumps({"id": "a", "sentences": []}) + "\n"
+    target.write_text(first_line + '{"id": "b", "sen')
+    Checkpoint(records=1, output_bytes=len(first_line)).save(str(target))
+
+    assert main(["classify", str(source), str(target), "--keywords-only", "--resume"]) == 0
+
+    results = read_output(target)
+    assert [r["id"] for r in results] == ["a", "b", "c"]
+    assert results[0]["sentences"] == []
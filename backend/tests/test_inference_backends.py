@@ -0,0 +1,158 @@
+import sys
+import os
+import statistics
+
+import pytest
+
+# Add backend to path so we can import app
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from app.core.config import Settings
+from app.core.exceptions import ConfigurationException
+from app.models.topic import Topic
+from app.services.backends.factory import create_backend, resolve_backend_name
+from app.services.backends.gguf_backend import GGUFBackend
+
+
+def test_auto_backend_follows_model_name():
+    assert resolve_backend_name(Settings()) == "transformers"
+    assert resolve_backend_name(Settings(model_name="models/model.gguf")) == "gguf"
+    assert resolve_backend_name(Settings(model_name="keyword")) == "keyword"
+    assert resolve_backend_name(Settings(inference_backend="keyword")) == "keyword"
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ConfigurationException):
+        create_backend(Settings(inference_backend="onnx"))
+
+
+def test_keyword_backend_classifies_without_a_model():
+    backend = create_backend(Settings(inference_backend="keyword"))
+    backend.load()
+
+    results = backend.classify(["The app crashes.", "Lovely colours."])
+
+    assert [r.topic for r in results] == [Topic.PERFORMANCE, Topic.OTHER]
+
+
+def test_gguf_backend_parses_completions():
+    class FakeLlama:
+        def create_completion(self, prompt, **kwargs):
+            return {"choices": [{"text": " Billing"}]}
+
+    backend = GGUFBackend(Settings(model_name="models/model.gguf"))
+    backend.model = FakeLlama()
+
+    assert [r.topic for r in backend.classify(["I was charged twice."])] == [Topic.BILLING]
+
+
+def test_fake_backend_is_deterministic():
+    settings = Settings(
+        model_name="fake",
+        classification_mode="score",
+        fake_latency_base_ms=0.0,
+        fake_latency_per_item_ms=0.0
+    )
+    assert resolve_backend_name(settings) == "fake"
+
+    texts = ["The app crashes.", "I was charged twice.", "Lovely colours."]
+    first = create_backend(settings).classify(texts)
+    second = create_backend(settings).classify(texts)
+
+    assert [r.topic for r in first] == [r.topic for r in second]
+    assert all(r.scores[r.topic.value] == 0.8 for r in first)
+
+
+def test_fake_backend_latency_grows_with_batch_size():
+    backend = create_backend(Settings(
+        inference_backend="fake",
+        fake_latency_base_ms=10.0,
+        fake_latency_per_item_ms=2.0,
+        fake_batch_exponent=1.0,
+        fake_latency_distribution="fixed"
+    ))
+
+    assert backend.batch_latency(1) == pytest.approx(0.012)
+    assert backend.batch_latency(5) == pytest.approx(0.020)
+
+
+def test_fake_exponential_jitter_sets_the_spread():
+    def multipliers(jitter):
+        backend = create_backend(Settings(
+            inference_backend="fake",
+            fake_latency_distribution="exponential",
+            fake_latency_jitter=jitter
+        ))
+        return [backend._jitter() for _ in range(5000)]
+
+    narrow = multipliers(0.1)
+    assert min(narrow) >= 0.9
+    assert statistics.fmean(narrow) == pytest.approx(1.0, abs=0.02)
+    assert statistics.pstdev(narrow) == pytest.approx(0.1, abs=0.02)
+    assert set(multipliers(0.0)) == {1.0}
+
+    with pytest.raises(ConfigurationException):
+        multipliers(1.5)
+
+
+def test_unknown_fake_latency_distribution_is_rejected():
+    with pytest.raises(ConfigurationException):
+        create_backend(Settings(inference_backend="fake", fake_latency_distribution="pareto"))
+
+
+def test_score_mode_gives_the_same_topics_batched_and_one_at_a_time(tiny_t5_path):
+    from conftest import TINY_SENTENCES
+
+    backend = create_backend(Settings(model_name=tiny_t5_path, classification_mode="score"))
+    backend.load()
+
+    batched = backend.classify(TINY_SENTENCES)
+    single = [backend.classify([text])[0] for text in TINY_SENTENCES]
+
+    assert [r.topic for r in batched] == [r.topic for r in single]
+    for together, alone in zip(batched, single):
+        assert set(together.scores) == set(Topic.all_values())
+        assert sum(together.scores.values()) == pytest.approx(1.0, abs=1e-4)
+        assert max(together.scores, key=together.scores.get) == together.topic.value
+        for label, score in together.scores.items():
+            assert score == pytest.approx(alone.scores[label], abs=1e-4)
+
+
+def test_unknown_precision_is_rejected():
+    with pytest.raises(ConfigurationException):
+        create_backend(Settings(model_precision="fp16"))
+
+
+def test_precisions_do_not_share_cache_entries():
+    namespaces = {
+        create_backend(Settings(model_precision=precision)).cache_namespace
+        for precision in ("fp32", "int8", "bf16")
+    }
+    assert len(namespaces) == 3
+
+
+@pytest.mark.parametrize("precision", ["fp32", "int8", "bf16"])
+def test_precision_modes_convert_the_model_and_classify(tiny_t5_path, precision):
+    import torch
+    from conftest import TINY_SENTENCES
+
+    backend = create_backend(Settings(
+        model_name=tiny_t5_path,
+        model_precision=precision,
+        classification_mode="score"
+    ))
+    backend.load()
+
+    modules = list(backend.model.modules())
+    float_linears = [m for m in modules if isinstance(m, torch.nn.Linear)]
+    int8_linears = [m for m in modules if isinstance(m, torch.ao.nn.quantized.dynamic.Linear)]
+    if precision == "int8":
+        assert int8_linears and not float_linears
+    else:
+        dtype = torch.bfloat16 if precision == "bf16" else torch.float32
+        assert float_linears and not int8_linears
+        assert {p.dtype for p in backend.model.parameters()} == {dtype}
+
+    results = backend.classify(TINY_SENTENCES)
+    assert len(results) == len(TINY_SENTENCES)
+    assert all(sum(r.scores.values()) == pytest.approx(1.0, abs=1e-3) for r in results)
@@ -0,0 +1,61 @@
+import asyncio
+import contextvars
+import sys
+import os
+import threading
+
+import pytest
+
+# Add backend to path so we can import app
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from app.services.inference_executor import InferenceExecutor
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+def test_run_uses_an_inference_thread_and_sees_context_variables():
+    executor = InferenceExecutor(max_workers=1)
+
+    async def call():
+        request_id.set("abc")
+        return await executor.run(lambda: (threading.current_thread().name, request_id.get()))
+
+    try:
+        thread_name, seen = asyncio.run(call())
+    finally:
+        executor.shutdown()
+
+    assert thread_name.startswith("inference")
+    assert seen == "abc"
+
+
+def test_context_changes_in_the_thread_do_not_leak_back():
+    executor = InferenceExecutor(max_workers=1)
+
+    async def call():
+        request_id.set("caller")
+        await executor.run(request_id.set, "worker")
+        return request_id.get()
+
+    try:
+        assert asyncio.run(call()) == "caller"
+    finally:
+        executor.shutdown()
+
+
+def test_shutdown_stops_the_threads_and_the_pool_is_recreated():
+    executor = InferenceExecutor(max_workers=2)
+    first = executor.submit(threading.current_thread).result()
+
+    executor.shutdown(wait=True)
+    assert not first.is_alive()
+
+    assert executor.submit(lambda x: x * 2, 21).result() == 42
+    executor.shutdown()
+    executor.shutdown()
+
+
+def test_max_workers_must_be_positive():
+    with pytest.raises(ValueError):
+        InferenceExecutor(max_workers=0)
@@ -0,0 +1,144 @@
+import asyncio
+import io
+import json
+import sys
+import os
+
+import pytest
+
+# Add backend to path so we can import app
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from app.core.config import Settings
+from app.core.exceptions import ModelNotLoadedException, ValidationException
+from app.services.job_service import JobService
+from app.services.job_store import JobStore
+from app.services.llm_service import LLMService
+from app.services.review_analysis_service import ReviewAnalysisService
+
+
+def make_service(path, chunk_size=2, load=True, **settings) -> JobService:
+    """Build a job service on the keyword backend, loaded unless load=False."""
+    llm_service = LLMService(Settings(**{
+        "inference_backend": "keyword",
+        "model_warmup": False,
+        "persistent_cache_path": None,
+        **settings,
+    }))
+    if load:
+        llm_service.load_model()
+    review_service = ReviewAnalysisService(llm_service)
+    return JobService(review_service, JobStore(str(path)), chunk_size=chunk_size)
+
+
+def upload(lines) -> io.BytesIO:
+    return io.BytesIO("\n".join(lines).encode())
+
+
+def test_job_runs_to_completion_with_ordered_results(tmp_path):
+    service = make_service(tmp_path / "jobs.db")
+
+    async def run():
+        job = await service.create_job(upload([
+            json.dumps({"id": "a", "text": "The app crashes."}),
+            "not json",
+            json.dumps({"text": "I was charged twice."}),
+        ]), "jsonl")
+        while await service.run_once():
+            pass
+        return await service.get_status(job.id)
+
+    status = asyncio.run(run())
+    assert (status.status, status.total, status.processed, status.failed) == ("completed", 3, 3, 1)
+
+    results = [json.loads(line) for line in service.iter_results(status.id)]
+    assert [r["id"] for r in results] == ["a", "1", "2"]
+    assert results[0]["sentences"][0]["topic"] == "Performance"
+    assert "error" in results[1]
+    assert results[2]["sentences"][0]["topic"] == "Billing"
+
+
+def test_unfinished_job_resumes_after_restart(tmp_path):
+    path = tmp_path / "jobs.db"
+    first = make_service(path, chunk_size=1)
+    csv_upload = io.BytesIO(b"id,text\nx,Support was helpful.\ny,The button is confusing.\n")
+
+    async def start():
+        job = await first.create_job(csv_upload, "csv")
+        await first.run_once()
+        return job.id
+
+    job_id = asyncio.run(start())
+
+    # A new service on the same database picks up the remaining item
+    second = make_service(path)
+
+    async def resume():
+        while await second.run_once():
+            pass
+        return await second.get_status(job_id)
+
+    status = asyncio.run(resume())
+    assert (status.status, status.processed) == ("completed", 2)
+    assert [json.loads(line)["id"] for line in second.iter_results(job_id)] == ["x", "y"]
+
+
+
+def test_failed_model_load_leaves_items_pending(tmp_path):
+    service = make_service(tmp_path / "jobs.db", load=False)
+    llm_service = service.review_service.llm_service
+
+    def fail():
+        raise OSError("weights missing")
+
+    llm_service.backend.load = fail
+    with pytest.raises(ModelNotLoadedException):
+        llm_service.load_model()
+
+    async def run():
+        job = await service.create_job(upload([json.dumps({"text": "The app crashes."})]), "jsonl")
+        processed = await service.run_once()
+        return processed, await service.get_status(job.id)
+
+    processed, status = asyncio.run(run())
+    assert not processed
+    assert (status.processed, status.total) == (0, 1)
+    assert status.status != "completed"
+
+
+def test_csv_without_text_column_is_rejected(tmp_path):
+    service = make_service(tmp_path / "jobs.db")
+
+    with pytest.raises(ValidationException):
+        asyncio.run(service.create_job(io.BytesIO(b"id,body\n1,hello\n"), "csv"))
+
+
+def test_concurrent_result_downloads_span_several_pages(tmp_path):
+    import httpx
+    from app.api.v1.routers.jobs import _job_service
+    from app.main import app
+
+    service = make_service(tmp_path / "jobs.db")
+    # Items stored with a result are finished already, no worker needed
+    job = service.store.create_job(
+        (str(i), "", json.dumps({"id": str(i), "error": "x"})) for i in range(2000)
+    )
+
+    async def download_all():
+        # One event loop, so the downloads share its threadpool threads
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await asyncio.gather(*(
+                client.get(f"/api/v1/jobs/{job.id}/results") for _ in range(4)
+            ))
+
+    app.dependency_overrides[_job_service] = lambda: service
+    try:
+        responses = asyncio.run(download_all())
+    finally:
+        app.dependency_overrides.pop(_job_service)
+
+    expected = [str(i) for i in range(2000)]
+    for response in responses:
+        assert response.status_code == 200
+        assert [json.loads(line)["id"] for line in response.text.splitlines()] == expected
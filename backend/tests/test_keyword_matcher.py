@@ -0,0 +1,76 @@
+import sys
+import os
+
+import pytest
+
+# Add backend to path so we can import app
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from app.core.config import get_keyword_matcher, get_settings
+from app.models.topic import Topic
+from app.utils.keyword_matcher import KeywordMatcher
+
+
+def test_match_counts_hits_per_topic_in_priority_order():
+    matcher = KeywordMatcher({"Billing": ["refund", "charg"], "Support": ["help"]})
+
+    match = matcher.match("Help! I was CHARGED twice and need a refund.")
+
+    assert match.topic == "Billing"
+    assert match.counts == {"Billing": 2, "Support": 1}
+
+
+def test_overlapping_keywords_all_count():
+    matcher = KeywordMatcher({"Support": ["serv"], "Other": ["service"]})
+
+    assert matcher.match("Great service").counts == {"Support": 1, "Other": 1}
+
+
+def test_detect_from_keywords_uses_default_tables():
+    assert Topic.detect_from_keywords("The app keeps crashing") == Topic.PERFORMANCE
+    assert Topic.detect_from_keywords("Where is the sign in page?") == Topic.ACCOUNT
+    assert Topic.detect_from_keywords("Lovely colours") == Topic.OTHER
+
+
+def test_detect_from_keywords_follows_configured_tables(monkeypatch):
+    monkeypatch.setenv("TOPIC_KEYWORDS", '{"Support": ["crash"]}')
+    get_settings.cache_clear()
+    get_keyword_matcher.cache_clear()
+    try:
+        assert Topic.detect_from_keywords("The app keeps crashing") == Topic.SUPPORT
+        assert Topic.detect_from_keywords("I was charged twice") == Topic.OTHER
+    finally:
+        get_settings.cache_clear()
+        get_keyword_matcher.cache_clear()
+
+
+@pytest.mark.parametrize("text", [
+    "I want to change my plan.",
+    "The guide was good.",
+    "The author replied quickly.",
+])
+def test_legacy_service_sends_weak_keyword_matches_to_the_model(text):
+    pytest.importorskip("transformers")
+    from core.llm import LLMService as LegacyLLMService
+
+    service = LegacyLLMService()
+    asked = []
+
+    def no_model():
+        asked.append(text)
+        raise RuntimeError("model unavailable")
+
+    service._get_model_and_tokenizer = no_model
+
+    assert service.analyze_sentence(text) == "Other"
+    assert asked == [text]
+
+
+def test_legacy_service_answers_confident_keyword_matches_itself():
+    pytest.importorskip("transformers")
+    from core.llm import LLMService as LegacyLLMService
+
+    service = LegacyLLMService()
+    service._get_model_and_tokenizer = None
+
+    assert service.analyze_sentence("The app crashes on launch.") == "Performance"
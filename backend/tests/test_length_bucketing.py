@@ -0,0 +1,30 @@
+import sys
+import os
+
+# Add backend to path so we can import app
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from app.services.length_bucketing import LengthBucketer
+
+
+def test_prompts_are_grouped_by_bucket_and_sorted_by_length():
+    bucketer = LengthBucketer([64, 128])
+
+    groups = bucketer.split([200, 60, 100, 58, 64])
+
+    assert groups == [[3, 1, 4], [2], [0]]
+
+
+def test_stats_report_occupancy_and_padding_waste():
+    bucketer = LengthBucketer([64])
+    bucketer.split([60, 40, 100])
+
+    stats = bucketer.stats()
+    short, long = stats["buckets"]
+
+    assert (short["sentences"], long["sentences"]) == (2, 1)
+    assert short["occupancy"] == 2 / 3
+    assert short["padding_waste"] == 1 - 100 / 120
+    assert long["padding_waste"] == 0.0
+    # One batch padded to 100 tokens would have wasted 100 of 300 slots
+    assert stats["padding_waste_unbucketed"] == 1 - 200 / 300
@@ -0,0 +1,128 @@
+import asyncio
+import sys
+import os
+
+import pytest
+
+# Add backend to path so we can import app
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from app.core.config import Settings
+from app.core.exceptions import ModelNotLoadedException
+from app.models.classification import Classification
+from app.models.topic import Topic
+from app.services.llm_service import LLMService, ModelLoadState
+
+
+def make_service(outputs=None, **overrides) -> LLMService:
+    """Build an LLMService whose inference step is replaced by a stub."""
+    service = LLMService(Settings(**overrides))
+    service.model = object()
+    service._model_loaded = True
+    calls = []
+
+    async def fake_inference(texts):
+        calls.append(list(texts))
+        if outputs is None:
+            raise RuntimeError("inference failed")
+        return [Classification(topic=Topic.from_string(outputs[text])) for text in texts]
+
+    service._run_batch_inference = fake_inference
+    service.calls = calls
+    return service
+
+
+def test_analyze_sentences_runs_one_batch():
+    outputs = {"I was charged twice.": "Billing", "Nice colours.": "UX"}
+    service = make_service(outputs, batching_enabled=False)
+
+    topics = asyncio.run(service.analyze_sentences(list(outputs)))
+
+    assert topics == [Topic.BILLING, Topic.UX]
+    assert service.calls == [list(outputs)]
+
+
+def test_analyze_sentences_falls_back_to_keywords_per_sentence():
+    service = make_service(None, batching_enabled=False)
+
+    topics = asyncio.run(
+        service.analyze_sentences(["The app keeps crashing.", "Lovely weather."])
+    )
+
+    assert topics == [Topic.PERFORMANCE, Topic.OTHER]
+
+
+def test_repeated_sentences_reach_the_model_once():
+    outputs = {"Nothing works anymore.": "Performance", "nothing works  ANYMORE.": "Performance"}
+    service = make_service(outputs, batching_enabled=False)
+
+    asyncio.run(service.analyze_sentences(["Nothing works anymore.", "nothing works  ANYMORE."]))
+    topics = asyncio.run(service.analyze_sentences(["Nothing works anymore."]))
+
+    assert topics == [Topic.PERFORMANCE]
+    assert service.calls == [["Nothing works anymore."]]
+    assert service.cache_stats()["hits"] == 1
+
+
+def test_persistent_cache_survives_restart(tmp_path):
+    path = str(tmp_path / "classifications.db")
+    outputs = {"I was charged twice.": "Billing"}
+
+    first = make_service(outputs, batching_enabled=False, persistent_cache_path=path)
+    asyncio.run(first.analyze_sentences(["I was charged twice."]))
+
+    second = make_service(outputs, batching_enabled=False, persistent_cache_path=path)
+    topics = asyncio.run(second.analyze_sentences(["I was charged twice."]))
+
+    assert topics == [Topic.BILLING]
+    assert second.calls == []
+    assert second.persistent_cache_stats()["hits"] == 1
+
+
+def test_unambiguous_keyword_matches_skip_the_model():
+    outputs = {"Support replied but the app still lags.": "Performance"}
+    service = make_service(outputs, batching_enabled=False)
+
+    topics = asyncio.run(service.analyze_sentences([
+        "I want a refund.",
+        "Support replied but the app still lags.",
+    ]))
+
+    assert topics == [Topic.BILLING, Topic.PERFORMANCE]
+    assert service.calls == [["Support replied but the app still lags."]]
+    assert service.routing_stats()["counts"]["keyword"] == 1
+
+
+def test_a_repeated_weak_keyword_does_not_skip_the_model():
+    outputs = {"I asked for help but the FAQ was not helpful.": "UX"}
+    service = make_service(outputs, batching_enabled=False)
+
+    topics = asyncio.run(service.analyze_sentences([
+        "I asked for help but the FAQ was not helpful.",
+        "Support was a big help.",
+    ]))
+
+    assert topics == [Topic.UX, Topic.SUPPORT]
+    assert service.calls == [["I asked for help but the FAQ was not helpful."]]
+
+
+def test_requests_while_loading_use_keywords_or_are_rejected():
+    service = LLMService(Settings(inference_backend="keyword"))
+    service._load_state = ModelLoadState.LOADING
+
+    assert asyncio.run(service.analyze_sentences(["The app crashes."])) == [Topic.PERFORMANCE]
+
+    service.settings = Settings(inference_backend="keyword", serve_keywords_while_loading=False)
+    with pytest.raises(ModelNotLoadedException):
+        asyncio.run(service.analyze_sentences(["The app crashes."]))
+
+
+def test_load_status_reports_completion():
+    service = LLMService(Settings(inference_backend="keyword", model_warmup=False))
+    assert service.load_status()["state"] == "not_started"
+
+    service.load_model()
+
+    status = service.load_status()
+    assert (status["state"], status["progress"]) == ("ready", 1.0)
+    assert status["load_seconds"] is not None
@@ -0,0 +1,59 @@
+import sys
+import os
+import pytest
+from fastapi.testclient import TestClient
+
+# Add backend to path so we can import app
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from app.core.metrics import MetricsRegistry, _Metric
+from app.main import app
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", ("stage",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.labels("split").observe(value)
+
+    lines = registry.render().splitlines()
+
+    assert 'latency_seconds_bucket{stage="split",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{stage="split",le="1"} 3' in lines
+    assert 'latency_seconds_bucket{stage="split",le="+Inf"} 4' in lines
+    assert 'latency_seconds_count{stage="split"} 4' in lines
+
+
+
+def test_metric_subclass_missing_samples_fails_on_creation():
+    class Incomplete(_Metric):
+        def _new_child(self):
+            return object()
+
+    with pytest.raises(TypeError):
+        Incomplete("incomplete", "Missing _samples.")
+
+
+def test_counters_and_callbacks_render_with_type_headers():
+    registry = MetricsRegistry()
+    registry.counter("fallbacks", "Fallbacks.", ("reason",)).labels("error").inc(3)
+    registry.callback("queue_depth", "Queue depth.", lambda: 7)
+
+    text = registry.render()
+
+    assert "# TYPE fallbacks_total counter" in text
+    assert 'fallbacks_total{reason="error"} 3' in text
+    assert "# TYPE queue_depth gauge\nqueue_depth 7" in text
+
+
+def test_metrics_endpoint_reports_pipeline_stages():
+    client = TestClient(app)
+    client.post("/api/v1/analyze", json={"text": "The app crashes. Support was helpful."})
+
+    response = client.get("/api/v1/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'review_stage_duration_seconds_count{stage="split"}' in response.text
+    assert 'review_request_sentences_bucket{endpoint="analyze",le="2"}' in response.text
+    assert "review_model_loaded 0" in response.text
@@ -0,0 +1,148 @@
+import asyncio
+import os
+import signal
+import sys
+import time
+
+import pytest
+
+# Add backend to path so we can import app
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from app.core.config import Settings
+from app.core.exceptions import AnalysisException
+from app.core.metrics import STAGE_SECONDS, stage_timer
+from app.services.backends.factory import create_backend
+from app.services.llm_service import LLMService
+from app.services.process_pool import InferenceProcessPool
+
+TEXTS = ["The app crashes.", "I was charged twice.", "Lovely colours.", "Support never replied."]
+
+
+def fake_backend(latency_ms=0.0):
+    return create_backend(Settings(
+        inference_backend="fake",
+        fake_latency_base_ms=latency_ms,
+        fake_latency_per_item_ms=0.0,
+        fake_latency_distribution="fixed"
+    ))
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def make(backend, **kwargs):
+        pool = InferenceProcessPool(backend.classify, **kwargs)
+        pool.poll_interval = 0.05
+        pool.start()
+        pools.append(pool)
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.shutdown(timeout=1.0)
+
+
+def test_workers_return_the_backend_results(make_pool):
+    backend = fake_backend()
+    pool = make_pool(backend, size=2)
+
+    futures = [pool.submit([text]) for text in TEXTS]
+
+    expected = [backend.classify([text]) for text in TEXTS]
+    assert [f.result(timeout=10) for f in futures] == expected
+
+
+def test_killed_worker_is_replaced_and_the_pool_keeps_serving(make_pool):
+    pool = make_pool(fake_backend(), size=2)
+    pool.submit(TEXTS).result(timeout=10)
+
+    os.kill(pool._workers[0].process.pid, signal.SIGKILL)
+    deadline = time.monotonic() + 5
+    while pool.restarts == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # Every later batch completes, whichever worker it lands on
+    for _ in range(20):
+        assert len(pool.submit(TEXTS).result(timeout=10)) == len(TEXTS)
+    assert pool.restarts == 1
+
+
+def test_batches_on_a_crashed_worker_fail(make_pool):
+    pool = make_pool(fake_backend(latency_ms=5000), size=1)
+    future = pool.submit(TEXTS)
+    time.sleep(0.2)
+
+    os.kill(pool._workers[0].process.pid, signal.SIGKILL)
+
+    with pytest.raises(AnalysisException, match="crashed"):
+        future.result(timeout=5)
+
+
+def test_stuck_worker_is_killed_after_the_batch_timeout(make_pool):
+    pool = make_pool(fake_backend(latency_ms=10000), size=1, batch_timeout=0.3)
+    started = time.monotonic()
+
+    with pytest.raises(AnalysisException, match="timed out"):
+        pool.submit(TEXTS).result(timeout=5)
+
+    assert time.monotonic() - started < 5
+    assert pool.restarts == 1
+
+
+def test_workers_warm_up_after_the_fork(make_pool):
+    pool = make_pool(fake_backend(), size=2, warmup_fn=os.getpid)
+
+    assert pool.warmup_result in {w.process.pid for w in pool._workers}
+    assert all(w.ready for w in pool._workers)
+
+
+def test_restarts_stop_after_repeated_failed_starts(make_pool):
+    pool = make_pool(fake_backend(), size=1, warmup_fn=lambda: os._exit(1))
+
+    assert pool._workers == []
+    assert pool.restarts == InferenceProcessPool.max_failed_starts - 1
+    with pytest.raises(AnalysisException, match="not running"):
+        pool.submit(TEXTS)
+
+
+def test_worker_stage_timings_are_recorded_in_the_parent():
+    def infer(texts):
+        with stage_timer("worker_test_stage"):
+            return texts
+
+    pool = InferenceProcessPool(infer, size=1)
+    pool.start()
+    try:
+        pool.submit(TEXTS).result(timeout=10)
+        # The collector records the timings before resolving the batch
+        counts, _ = STAGE_SECONDS.labels("worker_test_stage").snapshot()
+    finally:
+        pool.shutdown(timeout=1.0)
+
+    assert sum(counts) == 1
+
+
+def test_process_mode_classifies_with_the_fake_backend():
+    service = LLMService(Settings(
+        inference_backend="fake",
+        inference_mode="process",
+        process_pool_size=2,
+        fake_latency_base_ms=0.0,
+        fake_latency_per_item_ms=0.0,
+        model_warmup=False,
+        router_enabled=False,
+        cache_enabled=False,
+        persistent_cache_path=None
+    ))
+    service.load_model()
+
+    async def analyze():
+        try:
+            return await service.analyze_sentences(TEXTS)
+        finally:
+            await service.shutdown()
+
+    expected = [c.topic for c in fake_backend().classify(TEXTS)]
+    assert asyncio.run(analyze()) == expected
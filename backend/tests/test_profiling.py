@@ -0,0 +1,64 @@
+import asyncio
+import contextvars
+import sys
+import os
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add backend to path so we can import app
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from app.core.metrics import stage_timer
+from app.core.profiling import RequestProfilingMiddleware
+from app.services.batch_scheduler import BatchScheduler
+
+
+def make_client(**options) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(RequestProfilingMiddleware, **options)
+
+    @app.get("/work")
+    async def work():
+        with stage_timer("split"):
+            pass
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def test_server_timing_is_returned_only_when_asked_for():
+    client = make_client(enabled=True)
+
+    timing = client.get("/work", headers={"X-Profile": "1"}).headers["server-timing"]
+
+    assert timing.startswith("split;dur=") and "total;dur=" in timing
+    assert "server-timing" in client.get("/work?profile=1").headers
+    assert "server-timing" not in client.get("/work").headers
+
+
+def test_profiling_is_restricted_by_setting_and_token():
+    assert "server-timing" not in make_client(enabled=False).get(
+        "/work", headers={"X-Profile": "1"}
+    ).headers
+
+    client = make_client(enabled=True, token="secret")
+    assert "server-timing" not in client.get("/work", headers={"X-Profile": "1"}).headers
+    assert "server-timing" in client.get("/work", headers={"X-Profile": "secret"}).headers
+
+
+def test_scheduler_does_not_inherit_the_first_callers_context():
+    request_id = contextvars.ContextVar("request_id", default=None)
+    seen = []
+
+    async def handler(items):
+        seen.append(request_id.get())
+        return items
+
+    async def main():
+        scheduler = BatchScheduler(handler, max_batch_size=4, max_wait_ms=1)
+        request_id.set("first-request")
+        await scheduler.submit("a")
+        await scheduler.close()
+
+    asyncio.run(main())
+    assert seen == [None]
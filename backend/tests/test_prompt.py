@@ -0,0 +1,46 @@
+import sys
+import os
+
+import pytest
+
+# Add backend to path so we can import app
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from app.services.prompt import CompiledPrompt, build_prompt
+from conftest import TINY_SENTENCES
+
+
+@pytest.fixture
+def tokenizer(tiny_t5_path):
+    from transformers import AutoTokenizer
+
+    return AutoTokenizer.from_pretrained(tiny_t5_path)
+
+
+def test_compiled_prompt_matches_tokenizing_the_full_prompt(tokenizer):
+    prompt = CompiledPrompt(tokenizer, max_tokens=512)
+
+    expected = [tokenizer(build_prompt(text))["input_ids"] for text in TINY_SENTENCES]
+
+    assert prompt.token_ids(TINY_SENTENCES) == expected
+    assert prompt.tail_ids == [tokenizer.eos_token_id]
+
+
+def test_only_the_sentence_is_truncated(tokenizer):
+    full = CompiledPrompt(tokenizer, max_tokens=512).token_ids(TINY_SENTENCES[:1])[0]
+    prompt = CompiledPrompt(tokenizer, max_tokens=len(full) - 3)
+
+    truncated = prompt.token_ids(TINY_SENTENCES[:1])[0]
+
+    assert len(truncated) == len(full) - 3
+    assert truncated[-len(prompt.suffix_ids) - 1:] == full[-len(prompt.suffix_ids) - 1:]
+
+
+def test_encode_pads_like_the_tokenizer(tokenizer):
+    prompt = CompiledPrompt(tokenizer, max_tokens=512)
+
+    encoded = prompt.encode(TINY_SENTENCES)
+    expected = tokenizer([build_prompt(text) for text in TINY_SENTENCES], padding=True)
+
+    assert encoded["input_ids"].tolist() == expected["input_ids"]
+    assert encoded["attention_mask"].tolist() == expected["attention_mask"]
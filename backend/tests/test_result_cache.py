@@ -0,0 +1,30 @@
+import sys
+import os
+
+# Add backend to path so we can import app
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from app.models.classification import Classification
+from app.models.topic import Topic
+from app.services.result_cache import SentenceCache
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SentenceCache(max_entries=2)
+    cache.put_many([("a", Classification(Topic.UX)), ("b", Classification(Topic.BILLING))])
+
+    cache.get_many(["a"])
+    cache.put_many([("c", Classification(Topic.SUPPORT))])
+
+    assert cache.get_many(["a", "b", "c"]) == [
+        Classification(Topic.UX), None, Classification(Topic.SUPPORT)
+    ]
+    assert cache.stats()["evictions"] == 1
+
+
+def test_expired_entries_are_misses():
+    cache = SentenceCache(max_entries=10, ttl_seconds=0)
+    cache.put_many([("a", Classification(Topic.UX))])
+
+    assert cache.get_many(["a"]) == [None]
+    assert cache.stats()["expirations"] == 1
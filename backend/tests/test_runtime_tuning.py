@@ -0,0 +1,54 @@
+import sys
+import os
+
+# Add backend to path so we can import app
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from app.services.runtime_tuning import plan_thread_budget, warm_up
+
+
+def test_cores_are_split_across_workers_and_units():
+    budget = plan_thread_budget(cores=16, server_workers=2, parallel_units=2)
+    assert (budget.intra_op_threads, budget.inter_op_threads) == (4, 1)
+
+
+def test_budget_never_drops_below_one_thread():
+    assert plan_thread_budget(cores=2, server_workers=4, parallel_units=2).intra_op_threads == 1
+
+
+def test_explicit_thread_counts_win():
+    budget = plan_thread_budget(
+        cores=16, server_workers=1, parallel_units=1, intra_op_threads=3, inter_op_threads=2
+    )
+    assert (budget.intra_op_threads, budget.inter_op_threads) == (3, 2)
+
+
+def test_warm_up_runs_every_shape():
+    batches = []
+    latencies = warm_up(batches.append, batch_sizes=[1, 4], sentence_words=[5, 20])
+
+    assert sorted(latencies) == ["1x20w", "1x5w", "4x20w", "4x5w"]
+    assert sorted(len(batch) for batch in batches) == [1, 1, 4, 4]
+    assert len(batches[-1][0].split()) == 20
+
+
+def test_warm_up_is_left_out_of_stage_metrics_and_bucket_stats(tiny_t5_path):
+    from app.core.config import Settings
+    from app.core.metrics import STAGE_SECONDS
+    from app.services.llm_service import LLMService
+
+    service = LLMService(Settings(
+        model_name=tiny_t5_path,
+        model_warmup=True,
+        warmup_batch_sizes=[1, 4],
+        warmup_sentence_words=[5, 20],
+        persistent_cache_path=None
+    ))
+    before = {stage: STAGE_SECONDS.labels(stage).snapshot() for stage in ("tokenize", "generate")}
+
+    service.load_model()
+
+    assert len(service.warmup_latencies) == 4
+    assert service.bucket_stats()["sentences"] == 0
+    for stage, snapshot in before.items():
+        assert STAGE_SECONDS.labels(stage).snapshot() == snapshot
@@ -0,0 +1,79 @@
+import sys
+import os
+
+# Add backend to path so we can import app
+sys.path.append(os.path.join(os.getcwd(), 'backend'))
+
+from app.utils.text_processing import IncrementalSplitter, sentence_spans, split_into_sentences
+
+
+def test_splits_on_terminal_punctuation():
+    assert split_into_sentences("Great app! Crashes a lot. Why?") == [
+        "Great app!", "Crashes a lot.", "Why?"
+    ]
+
+
+def test_abbreviations_and_decimals_do_not_split():
+    text = "Dr. Smith said e.g. version 2.5 works. It costs $4.99 now."
+    assert split_into_sentences(text) == [
+        "Dr. Smith said e.g. version 2.5 works.", "It costs $4.99 now."
+    ]
+
+
+def test_no_ends_a_sentence_unless_a_number_follows():
+    assert split_into_sentences("I said no. The app crashed.") == [
+        "I said no.", "The app crashed."
+    ]
+    assert split_into_sentences("Would I recommend it? No. It crashes daily.") == [
+        "Would I recommend it?", "No.", "It crashes daily."
+    ]
+    assert split_into_sentences("See ticket No. 5 for details.") == [
+        "See ticket No. 5 for details."
+    ]
+
+
+def test_abbreviation_before_a_line_break_still_splits():
+    assert split_into_sentences("Ask Dr.\nThe app crashes.") == ["Ask Dr.", "The app crashes."]
+
+
+def test_ellipsis_splits_only_before_a_new_sentence():
+    assert split_into_sentences("It was... fine. Then... Nothing worked") == [
+        "It was... fine.", "Then...", "Nothing worked"
+    ]
+
+
+def test_line_breaks_end_sentences():
+    assert split_into_sentences("Login fails\n\nSupport is slow") == [
+        "Login fails", "Support is slow"
+    ]
+
+
+def test_spans_index_into_the_original_text():
+    text = "  Billing is wrong.   The app crashes!  "
+    spans = sentence_spans(text)
+
+    assert [text[start:end] for start, end in spans] == [
+        "Billing is wrong.", "The app crashes!"
+    ]
+    assert spans[0][0] == 2
+
+
+def test_incremental_splitter_matches_one_pass_split():
+    text = "Mr. Smith paid $4.99. It was... fine! Then... Nothing worked\nWhy? " * 20
+    splitter = IncrementalSplitter()
+
+    sentences = []
+    for position in range(0, len(text), 7):
+        sentences.extend(splitter.feed(text[position:position + 7]))
+    sentences.extend(splitter.close())
+
+    assert [span for span, _ in sentences] == sentence_spans(text)
+    assert all(text[start:end] == sentence for (start, end), sentence in sentences)
+
+
+def test_incremental_splitter_cuts_runaway_sentences():
+    splitter = IncrementalSplitter(max_sentence_chars=50)
+    sentences = splitter.feed("word " * 100) + splitter.close()
+
+    assert max(len(sentence) for _, sentence in sentences) <= 50
+    assert " ".join(sentence for _, sentence in sentences) == ("word " * 100).strip()
@@ -2,6 +2,8 @@
 export interface Sentence {
   text: string;
   topic: string;
+  start?: number;
+  end?: number;
 }
 
 